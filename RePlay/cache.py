@@ -0,0 +1,421 @@
+"""
+2단계 캐시 백엔드 (프로세스 메모리 L1 + Redis L2)
+
+자주 읽는 값은 프로세스 메모리(L1)에서 네트워크 왕복 없이 제공하고, L1에 없으면 Redis(L2)에서 읽어 L1에 채웁니다.
+값을 저장/삭제하면 Redis pub/sub으로 키를 알려서 모든 프로세스가 자신의 L1 항목을 버립니다.
+메시지가 늦거나 유실되더라도 L1 항목은 L1_TIMEOUT보다 오래 남지 않으며,
+구독이 끊긴 동안에는 L1을 사용하지 않고 다시 구독하면 L1을 비운 뒤 사용합니다.
+
+    CACHES = {
+        'accounts': {
+            'BACKEND': 'RePlay.cache.TwoTierCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {'L1_MAX_ENTRIES': 10000, 'L1_TIMEOUT': 30},
+        },
+    }
+"""
+
+import itertools
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from asgiref.sync import sync_to_async
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.redis import RedisCache
+from django.utils.functional import cached_property
+from redis.exceptions import LockError, RedisError
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LocalTier:
+    """
+    L1 저장소 (항목별 만료 시각이 있는 LRU)
+    값은 pickle한 바이트로 보관해서 요청 사이에 같은 객체를 공유하지 않도록 합니다. (LocMemCache와 같은 방식)
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return _MISSING
+            expires_at, data = item
+            if expires_at <= now:
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+        return pickle.loads(data)
+
+    def set(self, key, value, timeout):
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        expires_at = time.monotonic() + timeout
+        with self._lock:
+            self._data[key] = (expires_at, data)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class CacheMetrics:
+    """
+    2단계 캐시 지표 (프로세스 전체에서 하나)
+    """
+
+    def __init__(self):
+        # settings가 준비된 뒤에 만들어지도록 지연 import
+        from accounts.instrumentation import CallbackGauge, Counter, get_metrics_registry
+
+        registry = get_metrics_registry()
+        self.requests = registry.register(Counter(
+            'replay_cache_requests_total', '캐시 단계별 조회 결과', ('tier', 'result')
+        ))
+        self.invalidations = registry.register(Counter(
+            'replay_cache_invalidations_total', 'L1 무효화 횟수 (local: 이 프로세스, remote: pub/sub, resync: 재구독)',
+            ('source',)
+        ))
+        self.single_flight = registry.register(Counter(
+            'replay_cache_single_flight_total', 'get_or_set 재계산 결과 (computed: 직접 계산, waited: 다른 요청의 결과 사용)',
+            ('outcome',)
+        ))
+        registry.register(CallbackGauge(
+            'replay_cache_l1_entries', 'L1 캐시 항목 수', lambda: sum(len(store.l1) for store in _stores.values())
+        ))
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_cache_metrics():
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = CacheMetrics()
+    return _metrics
+
+
+class TieredStore:
+    """
+    같은 Redis와 채널을 쓰는 캐시 인스턴스들이 공유하는 L1과 무효화 구독 스레드
+    Django는 캐시 백엔드 인스턴스를 스레드마다 만들기 때문에 L1은 인스턴스가 아니라 여기에 둡니다.
+    """
+
+    def __init__(self, client, channel, max_entries, timeout):
+        self.client = client
+        self.channel = channel
+        self.timeout = timeout
+        self.l1 = LocalTier(max_entries)
+        self.origin = uuid.uuid4().hex
+        self.metrics = get_cache_metrics()
+        # 무효화가 일어날 때마다 증가 (L2에서 읽는 동안 무효화된 값을 L1에 채우지 않기 위해 사용)
+        self._generations = itertools.count()
+        self.generation = next(self._generations)
+        # 구독 중일 때만 L1 사용
+        self.subscribed = threading.Event()
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._listen, name='cache-invalidation', daemon=True)
+        self._thread.start()
+
+    def get(self, key):
+        if not self.subscribed.is_set():
+            return _MISSING
+        value = self.l1.get(key)
+        self.metrics.requests.inc('l1', 'miss' if value is _MISSING else 'hit')
+        return value
+
+    def fill(self, key, value, generation, timeout=None):
+        """
+        L2에서 읽거나 저장한 값을 L1에 기록 (generation 이후 무효화가 있었으면 기록하지 않음)
+        """
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        if timeout <= 0 or not self.subscribed.is_set() or generation != self.generation:
+            return
+        self.l1.set(key, value, timeout)
+
+    def invalidate(self, keys):
+        """
+        이 프로세스의 L1에서 지우고 다른 프로세스에 알림
+        """
+        self._drop(keys, 'local')
+        self.client.publish(self.channel, json.dumps({'origin': self.origin, 'keys': keys}))
+
+    def invalidate_all(self):
+        self._drop(None, 'local')
+        self.client.publish(self.channel, json.dumps({'origin': self.origin, 'keys': None}))
+
+    def _drop(self, keys, source):
+        self.generation = next(self._generations)
+        if keys is None:
+            self.l1.clear()
+        else:
+            self.l1.delete_many(keys)
+        self.metrics.invalidations.inc(source)
+
+    def _listen(self):
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                # 구독 전에 놓친 메시지가 있을 수 있으므로 L1을 비운 뒤 사용 시작
+                self._drop(None, 'resync')
+                self.subscribed.set()
+                for message in pubsub.listen():
+                    try:
+                        payload = json.loads(message['data'])
+                        origin, keys = payload['origin'], payload['keys']
+                    except (ValueError, TypeError, KeyError):
+                        logger.warning('잘못된 캐시 무효화 메시지를 무시합니다: %r', message['data'])
+                        continue
+                    if origin != self.origin:
+                        self._drop(keys, 'remote')
+            except RedisError:
+                logger.warning('캐시 무효화 구독이 끊겨 L1 캐시를 사용하지 않고 다시 연결합니다.', exc_info=True)
+            finally:
+                self.subscribed.clear()
+                pubsub.close()
+            time.sleep(1)
+
+    @contextmanager
+    def single_flight(self, key):
+        """
+        같은 키의 재계산을 프로세스 안에서 한 번에 하나만 실행
+        """
+        with self._flights_lock:
+            lock, waiters = self._flights.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._flights[key] = (lock, waiters + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._flights_lock:
+                lock, waiters = self._flights[key]
+                if waiters == 1:
+                    del self._flights[key]
+                else:
+                    self._flights[key] = (lock, waiters - 1)
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(servers, client, channel, max_entries, timeout):
+    # fork된 프로세스에는 구독 스레드가 없으므로 프로세스 id도 키에 포함
+    store_key = (os.getpid(), tuple(servers), channel, max_entries, timeout)
+    store = _stores.get(store_key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(store_key)
+            if store is None:
+                store = _stores[store_key] = TieredStore(client, channel, max_entries, timeout)
+    return store
+
+
+class TwoTierCache(RedisCache):
+    """
+    L1(프로세스 메모리 LRU) + L2(Redis) 캐시 백엔드
+
+    OPTIONS (나머지는 RedisCache와 같음)
+        L1_MAX_ENTRIES: L1 최대 항목 수 (기본 10000)
+        L1_TIMEOUT: L1 항목 최대 유지 시간 (초, 기본 30, 다른 프로세스의 변경이 늦게 보일 수 있는 최대 시간)
+        CHANNEL: 무효화 메시지 채널 (기본 'cache:invalidate')
+        LOCK_TIMEOUT: get_or_set 재계산 잠금 유지 시간 (초, 기본 10)
+    """
+
+    def __init__(self, server, params):
+        options = dict(params.get('OPTIONS', {}))
+        self._l1_max_entries = options.pop('L1_MAX_ENTRIES', 10000)
+        self._l1_timeout = options.pop('L1_TIMEOUT', 30)
+        self._channel = options.pop('CHANNEL', 'cache:invalidate')
+        self._lock_timeout = options.pop('LOCK_TIMEOUT', 10)
+        super().__init__(server, {**params, 'OPTIONS': options})
+
+    @cached_property
+    def _store(self):
+        return get_store(
+            self._servers, self._cache.get_client(write=True), self._channel,
+            self._l1_max_entries, self._l1_timeout,
+        )
+
+    def _get(self, key, default):
+        store = self._store
+        value = store.get(key)
+        if value is not _MISSING:
+            return value
+        generation = store.generation
+        value = self._cache.get(key, _MISSING)
+        store.metrics.requests.inc('l2', 'miss' if value is _MISSING else 'hit')
+        if value is _MISSING:
+            return default
+        store.fill(key, value, generation)
+        return value
+
+    def get(self, key, default=None, version=None):
+        return self._get(self.make_and_validate_key(key, version=version), default)
+
+    async def aget(self, key, default=None, version=None):
+        # L1에 있으면 스레드 전환 없이 이벤트 루프에서 바로 반환
+        key = self.make_and_validate_key(key, version=version)
+        value = self._store.get(key)
+        if value is not _MISSING:
+            return value
+        return await sync_to_async(self._get)(key, default)
+
+    def get_many(self, keys, version=None):
+        store = self._store
+        key_map = {self.make_and_validate_key(key, version=version): key for key in keys}
+        found = {}
+        for key in key_map:
+            value = store.get(key)
+            if value is not _MISSING:
+                found[key] = value
+        missing = [key for key in key_map if key not in found]
+        if missing:
+            generation = store.generation
+            fetched = self._cache.get_many(missing)
+            store.metrics.requests.inc('l2', 'hit', amount=len(fetched))
+            store.metrics.requests.inc('l2', 'miss', amount=len(missing) - len(fetched))
+            for key, value in fetched.items():
+                store.fill(key, value, generation)
+            found.update(fetched)
+        return {key_map[key]: value for key, value in found.items()}
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._store.get(key) is not _MISSING or self._cache.has_key(key)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        timeout = self.get_backend_timeout(timeout)
+        self._cache.set(key, value, timeout)
+        store = self._store
+        store.invalidate([key])
+        store.fill(key, value, store.generation, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        timeout = self.get_backend_timeout(timeout)
+        added = self._cache.add(key, value, timeout)
+        if added:
+            store = self._store
+            store.invalidate([key])
+            store.fill(key, value, store.generation, timeout)
+        return added
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        if not data:
+            return []
+        safe_data = {self.make_and_validate_key(key, version=version): value for key, value in data.items()}
+        timeout = self.get_backend_timeout(timeout)
+        self._cache.set_many(safe_data, timeout)
+        store = self._store
+        store.invalidate(list(safe_data))
+        generation = store.generation
+        for key, value in safe_data.items():
+            store.fill(key, value, generation, timeout)
+        return []
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        # 값은 그대로이므로 L1은 유지 (L1 항목은 어차피 L1_TIMEOUT 안에 만료)
+        key = self.make_and_validate_key(key, version=version)
+        return self._cache.touch(key, self.get_backend_timeout(timeout))
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        value = self._cache.incr(key, delta)
+        self._store.invalidate([key])
+        return value
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        deleted = self._cache.delete(key)
+        self._store.invalidate([key])
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        if not keys:
+            return
+        safe_keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        self._cache.delete_many(safe_keys)
+        self._store.invalidate(safe_keys)
+
+    def clear(self):
+        result = self._cache.clear()
+        self._store.invalidate_all()
+        return result
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT, version=None):
+        """
+        캐시에 없을 때 default()로 계산해서 저장 (캐시 쇄도 방지)
+        같은 키의 재계산은 프로세스 안에서는 잠금으로, 프로세스 사이에서는 Redis 잠금으로 한 번만 실행하고
+        나머지 요청은 그 결과를 기다립니다. (LOCK_TIMEOUT이 지나도록 결과가 없으면 직접 계산)
+        """
+        value = self.get(key, _MISSING, version=version)
+        if value is not _MISSING:
+            return value
+        if not callable(default):
+            return super().get_or_set(key, default, timeout=timeout, version=version)
+
+        full_key = self.make_and_validate_key(key, version=version)
+        store = self._store
+        with store.single_flight(full_key):
+            value = self._get(full_key, _MISSING)
+            if value is not _MISSING:
+                store.metrics.single_flight.inc('waited')
+                return value
+            lock = self._cache.get_client(full_key, write=True).lock(
+                f'{full_key}:lock', timeout=self._lock_timeout
+            )
+            deadline = time.monotonic() + self._lock_timeout
+            while not lock.acquire(blocking=False):
+                # 다른 프로세스가 계산 중이면 결과가 저장될 때까지 대기
+                time.sleep(0.05)
+                value = self._get(full_key, _MISSING)
+                if value is not _MISSING:
+                    store.metrics.single_flight.inc('waited')
+                    return value
+                if time.monotonic() >= deadline:
+                    lock = None
+                    break
+            try:
+                value = default()
+                self.set(key, value, timeout=timeout, version=version)
+            finally:
+                if lock is not None:
+                    try:
+                        lock.release()
+                    except LockError:
+                        pass  # 계산하는 동안 잠금이 만료됨
+            store.metrics.single_flight.inc('computed')
+            return value
@@ -0,0 +1,60 @@
+"""
+미디어 파일 제공
+
+내용 해시 이름으로 저장된 파일(accounts.storage)은 이름이 바뀌지 않는 한 내용도 바뀌지 않으므로
+1년짜리 immutable 캐시 헤더로 제공하고, 그 밖의 파일(렌디션, 이전 방식으로 저장된 파일)은
+MEDIA_CACHE_MAX_AGE 동안 캐시한 뒤 ETag로 재검증하도록 합니다.
+"""
+
+import mimetypes
+import os
+import posixpath
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import storages
+from django.http import FileResponse, Http404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_safe
+
+from accounts.storage import is_immutable_name
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+@require_safe
+def serve_media(request, path):
+    storage = storages['default']
+    if any(part.startswith('.') for part in path.split('/')):
+        raise Http404()
+    try:
+        full_path = storage.path(path)
+    except SuspiciousFileOperation:
+        raise Http404()
+    try:
+        stat = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise Http404()
+    if not os.path.isfile(full_path):
+        raise Http404()
+
+    if is_immutable_name(path):
+        etag = quote_etag(posixpath.splitext(posixpath.basename(path))[0])
+    else:
+        etag = quote_etag(f'{stat.st_mtime_ns:x}-{stat.st_size:x}')
+
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        content_type, encoding = mimetypes.guess_type(full_path)
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type or 'application/octet-stream')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+    response.headers['ETag'] = etag
+    response.headers['Last-Modified'] = http_date(stat.st_mtime)
+
+    if is_immutable_name(path):
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=settings.MEDIA_CACHE_MAX_AGE)
+    return response
@@ -0,0 +1,115 @@
+"""
+경로별 Middleware 구성
+
+JWT로만 인증하는 API 경로(settings.API_PATH_PREFIXES)에서는 세션, CSRF,
+세션 기반 인증, 메시지 Middleware를 건너뛰고, /admin/ 등 나머지 경로에서는
+기존 Django Middleware를 그대로 실행합니다.
+각 클래스는 원래 Middleware의 하위 클래스이므로 admin 등의 시스템 체크도 그대로 통과합니다.
+
+ReplicaRoutingMiddleware는 복제본에서 읽어도 되는 요청을 표시합니다. (RePlay/routers.py)
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import middleware as auth_middleware
+from django.contrib.messages import middleware as messages_middleware
+from django.contrib.sessions import middleware as sessions_middleware
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.middleware import csrf
+
+from .routers import begin_request, end_request, get_pin_cache, get_replica_settings, is_process_local, pin_user
+
+
+def is_api_request(request):
+    return request.path_info.startswith(tuple(getattr(settings, 'API_PATH_PREFIXES', ('/api/',))))
+
+
+class SkipForAPIMiddlewareMixin:
+    """
+    API 경로 요청에서는 Middleware를 건너뛰고 다음 단계로 바로 넘기는 Mixin
+    """
+
+    def __call__(self, request):
+        if is_api_request(request):
+            # 비동기 체인에서는 코루틴을 반환하고 호출한 쪽에서 await합니다.
+            return self.get_response(request)
+        return super().__call__(request)
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        # process_view는 핸들러가 __call__과 별도로 호출하므로 여기서도 건너뜀
+        if is_api_request(request) or not hasattr(super(), 'process_view'):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class SessionMiddleware(SkipForAPIMiddlewareMixin, sessions_middleware.SessionMiddleware):
+    pass
+
+
+class CsrfViewMiddleware(SkipForAPIMiddlewareMixin, csrf.CsrfViewMiddleware):
+    pass
+
+
+class AuthenticationMiddleware(SkipForAPIMiddlewareMixin, auth_middleware.AuthenticationMiddleware):
+    pass
+
+
+class MessageMiddleware(SkipForAPIMiddlewareMixin, messages_middleware.MessageMiddleware):
+    pass
+
+
+class ReplicaRoutingMiddleware:
+    """
+    DATABASE_REPLICAS['PATHS']의 GET/HEAD 요청은 복제본에서 읽도록 표시하는 Middleware
+    쓰기가 있었던 요청은 같은 사용자의 다음 요청들도 PIN_SECONDS 동안 기본 DB에서 읽도록 해서,
+    방금 수정한 정보를 복제 지연 때문에 이전 값으로 보지 않게 합니다. (사용자 확인은 인증 단계의 bind_user())
+    복제본이 설정되지 않았으면 Middleware 체인에서 제외됩니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        options = get_replica_settings()
+        if not options.get('ALIASES'):
+            raise MiddlewareNotUsed()
+        # 고정 시간이 허용 복제 지연보다 짧으면 고정이 풀린 뒤에도 이전 값을 읽을 수 있음
+        if options.get('PIN_SECONDS', 30) < options.get('MAX_LAG_SECONDS', 30):
+            raise ImproperlyConfigured(
+                "DATABASE_REPLICAS['PIN_SECONDS']는 MAX_LAG_SECONDS 이상이어야 합니다."
+            )
+        # 고정 정보를 프로세스 메모리에 두면 다른 워커로 간 요청이 방금 쓴 값을 복제본에서 읽음
+        if is_process_local(get_pin_cache()):
+            raise ImproperlyConfigured(
+                "DATABASE_REPLICAS['PIN_CACHE']는 프로세스 간 공유되는 캐시(Redis 등)여야 합니다. "
+                "REDIS_URL을 설정하세요."
+            )
+
+        self.get_response = get_response
+        self.paths = tuple(options.get('PATHS', ()))
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def is_read_only(self, request):
+        return request.method in ('GET', 'HEAD') and request.path_info.startswith(self.paths)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state, token = begin_request(self.is_read_only(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request(token)
+        pin_user(state)
+        return response
+
+    async def __acall__(self, request):
+        state, token = begin_request(self.is_read_only(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request(token)
+        await sync_to_async(pin_user)(state)
+        return response
@@ -0,0 +1,180 @@
+"""
+읽기 전용 복제본 DB 라우팅
+
+ReplicaRoutingMiddleware가 복제본에서 읽어도 되는 요청(settings.DATABASE_REPLICAS['PATHS']의 GET/HEAD)을
+표시하면, 그 요청의 읽기 쿼리만 정상 상태인 복제본 중 하나로 보냅니다.
+요청 중에 쓰기가 한 번이라도 있으면 이후 읽기는 모두 기본 DB로 고정하고, 그 사용자의 다음 요청들도
+PIN_SECONDS 동안 기본 DB에서 읽도록 합니다. (인증 시 bind_user()로 확인)
+고정 정보는 다른 프로세스의 요청에서도 보여야 하므로 DATABASE_REPLICAS['PIN_CACHE'] 캐시(Redis 등 공유 저장소)에 저장합니다.
+요청 밖(관리 명령, 백그라운드 작업 등)의 쿼리는 항상 기본 DB를 사용합니다.
+"""
+
+import contextvars
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+
+class RoutingState:
+    """
+    요청 단위 라우팅 상태
+    sync_to_async로 실행되는 ORM 호출에서 변경한 값도 보이도록 변경 가능한 객체로 공유합니다.
+    """
+
+    def __init__(self, use_replica=False):
+        self.use_replica = use_replica
+        self.pinned = False
+        self.wrote = False
+        self.user_id = None
+
+
+_state = contextvars.ContextVar('replica_routing_state', default=None)
+
+
+def begin_request(use_replica):
+    state = RoutingState(use_replica)
+    return state, _state.set(state)
+
+
+def end_request(token):
+    _state.reset(token)
+
+
+def get_replica_settings():
+    return getattr(settings, 'DATABASE_REPLICAS', {})
+
+
+def pin_key(user_id):
+    return f'replica:pin:user:{user_id}'
+
+
+def get_pin_cache():
+    return caches[get_replica_settings().get('PIN_CACHE', 'replica_pin')]
+
+
+def is_process_local(cache):
+    # 프로세스 메모리 캐시에 저장하면 다른 워커 프로세스로 간 다음 요청은 고정되지 않음
+    return isinstance(cache, (LocMemCache, DummyCache))
+
+
+def bind_user(user_id):
+    """
+    인증된 사용자를 현재 요청에 기록 (요청 밖이면 무시)
+    최근에 쓰기를 한 사용자면 이 요청의 읽기도 기본 DB로 고정합니다.
+    (토큰이 아니라 사용자 기준이므로 비밀번호 변경 등으로 새로 발급된 토큰의 요청도 포함)
+    """
+    state = _state.get()
+    if state is None:
+        return
+    state.user_id = user_id
+    if state.use_replica and not state.pinned and get_pin_cache().get(pin_key(user_id)):
+        state.pinned = True
+
+
+def pin_user(state):
+    """
+    쓰기가 있었던 요청이면 그 사용자의 다음 요청들을 PIN_SECONDS 동안 기본 DB로 고정
+    """
+    if state.wrote and state.user_id is not None:
+        get_pin_cache().set(pin_key(state.user_id), True, get_replica_settings().get('PIN_SECONDS', 30))
+
+
+class ReplicaHealth:
+    """
+    복제본 상태 확인 결과 (프로세스 단위, HEALTH_CHECK_INTERVAL 동안 재사용)
+    """
+
+    def __init__(self):
+        self._checked = {}
+        self._lock = threading.Lock()
+
+    def is_healthy(self, alias):
+        interval = get_replica_settings().get('HEALTH_CHECK_INTERVAL', 10)
+        now = time.monotonic()
+        with self._lock:
+            checked_at, healthy = self._checked.get(alias, (None, None))
+            if checked_at is not None and now - checked_at < interval:
+                return healthy
+            # 확인 중에 다른 스레드는 이전 결과를 사용
+            self._checked[alias] = (now, healthy if healthy is not None else True)
+        healthy = self.check(alias)
+        with self._lock:
+            self._checked[alias] = (time.monotonic(), healthy)
+        return healthy
+
+    def check(self, alias):
+        connection = connections[alias]
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == 'postgresql':
+                    # 받은 WAL을 모두 적용했으면 지연 없음 (기본 DB에 쓰기가 없으면 마지막 적용 시각이
+                    # 계속 과거로 남으므로 시각 차이만으로 판단하지 않음)
+                    cursor.execute(
+                        'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+                        'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END'
+                    )
+                    lag = float(cursor.fetchone()[0])
+                    max_lag = get_replica_settings().get('MAX_LAG_SECONDS', 30)
+                    if lag > max_lag:
+                        logger.warning('복제본 %s 복제 지연 %.1f초로 제외합니다.', alias, lag)
+                        return False
+                else:
+                    cursor.execute('SELECT 1')
+        except DatabaseError:
+            logger.warning('복제본 %s 연결 실패로 제외합니다.', alias, exc_info=True)
+            connection.close()
+            return False
+        return True
+
+    def status(self):
+        with self._lock:
+            return {alias: healthy for alias, (_, healthy) in self._checked.items()}
+
+    def reset(self):
+        with self._lock:
+            self._checked.clear()
+
+
+health = ReplicaHealth()
+
+
+class ReplicaRouter:
+    """
+    복제본 라우터 (settings.DATABASE_ROUTERS)
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.use_replica or state.pinned:
+            return None
+        # 트랜잭션 안의 읽기는 같은 트랜잭션(기본 DB)에서 실행
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        replicas = [
+            alias for alias in get_replica_settings().get('ALIASES', ())
+            if health.is_healthy(alias)
+        ]
+        return random.choice(replicas) if replicas else None
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.pinned = True
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB와 같은 데이터이므로 DB가 달라도 관계 허용
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,164 @@
+"""
+OpenAPI 스키마 사전 생성 및 제공
+
+drf_yasg는 스키마 요청마다 모든 뷰와 Serializer를 다시 분석하므로, 배포 시
+`python manage.py build_openapi_schema`로 파일을 만들어 두고 그 파일을 ETag와 함께 제공합니다.
+DEBUG 모드에서는 URLconf/Serializer/View 모듈이 바뀐 경우에만 다시 생성합니다.
+"""
+
+import hashlib
+import logging
+import os
+import sys
+import threading
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_safe
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson
+from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.views import get_schema_view
+from rest_framework import permissions
+
+logger = logging.getLogger(__name__)
+
+API_INFO = openapi.Info(
+    title="RePlay API",
+    default_version='v1',
+    description="RePlay 프로젝트의 API 문서",
+)
+
+# Swagger 설정
+schema_view = get_schema_view(
+    API_INFO,
+    public=True,
+    permission_classes=(permissions.AllowAny,),
+)
+
+# 스키마에 영향을 주는 앱 모듈
+SCHEMA_SOURCE_MODULES = ('urls', 'serializers', 'views')
+
+
+def get_schema_path():
+    return settings.OPENAPI_SCHEMA_PATH
+
+
+def generate_schema():
+    """
+    전체 URLconf를 분석하여 OpenAPI 스키마(JSON 바이트) 생성
+    """
+    generator = OpenAPISchemaGenerator(API_INFO)
+    schema = generator.get_schema(request=None, public=True)
+    return OpenAPICodecJson(validators=[]).encode(schema)
+
+
+def write_schema(path=None):
+    """
+    스키마를 생성하여 파일로 저장 (임시 파일에 쓴 뒤 교체)
+    """
+    path = path or get_schema_path()
+    content = generate_schema()
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as schema_file:
+        schema_file.write(content)
+    os.replace(temp_path, path)
+    return content
+
+
+def _source_files():
+    modules = [settings.ROOT_URLCONF]
+    for app_config in apps.get_app_configs():
+        if not app_config.path.startswith(str(settings.BASE_DIR)):
+            continue
+        modules += [f'{app_config.name}.{name}' for name in SCHEMA_SOURCE_MODULES]
+    for name in modules:
+        module = sys.modules.get(name)
+        if module is not None and getattr(module, '__file__', None):
+            yield module.__file__
+
+
+def _is_stale(path):
+    try:
+        schema_mtime = os.path.getmtime(path)
+    except OSError:
+        return True
+    return any(os.path.getmtime(source) > schema_mtime for source in _source_files())
+
+
+class _SchemaCache:
+    """
+    스키마 파일 내용과 ETag를 프로세스 메모리에 보관 (파일이 바뀐 경우에만 다시 읽음)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._mtime = None
+        self.content = None
+        self.etag = None
+
+    def _set(self, content, mtime):
+        self.content = content
+        self.etag = quote_etag(hashlib.sha256(content).hexdigest()[:32])
+        self._mtime = mtime
+
+    def load(self):
+        path = get_schema_path()
+        with self._lock:
+            if settings.DEBUG and _is_stale(path):
+                logger.info('OpenAPI 스키마를 다시 생성합니다: %s', path)
+                write_schema(path)
+
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                if self.content is None:
+                    # 배포 시 생성하지 않은 경우 한 번만 메모리에서 생성
+                    logger.warning('%s 파일이 없어 스키마를 메모리에서 생성합니다. '
+                                   'build_openapi_schema 명령으로 미리 생성하세요.', path)
+                    self._set(generate_schema(), None)
+                return self.content, self.etag
+
+            if mtime != self._mtime:
+                with open(path, 'rb') as schema_file:
+                    self._set(schema_file.read(), mtime)
+            return self.content, self.etag
+
+
+_schema_cache = _SchemaCache()
+
+
+@require_safe
+def precomputed_schema_view(request):
+    """
+    미리 생성한 OpenAPI 스키마 제공 (If-None-Match가 일치하면 304)
+    """
+    content, etag = _schema_cache.load()
+
+    if etag in [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type='application/json')
+    response['ETag'] = etag
+    # 캐시는 허용하되 매번 ETag로 재검증
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
+def schema_ui_view(renderer):
+    """
+    Swagger/ReDoc UI 뷰
+    UI 페이지는 그대로 렌더링하고, 같은 URL로 들어온 스키마 요청(?format=openapi)은
+    미리 생성한 스키마로 응답합니다.
+    """
+    ui_view = schema_view.with_ui(renderer, cache_timeout=0)
+
+    def view(request, *args, **kwargs):
+        if request.GET.get('format') in ('openapi', 'json'):
+            return precomputed_schema_view(request)
+        return ui_view(request, *args, **kwargs)
+
+    return view
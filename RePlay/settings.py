@@ -40,6 +40,8 @@ ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=['localhost', '127.0.0.1'])
 # Application definition
 
 INSTALLED_APPS = [
+    # runserver를 ASGI(WebSocket 포함)로 실행
+    "daphne",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
@@ -60,15 +62,23 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # INSTRUMENTATION_ENABLED가 꺼져 있으면 체인에서 제외됨
+    "accounts.instrumentation.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # 복제본이 없으면 체인에서 제외됨
+    "RePlay.middleware.ReplicaRoutingMiddleware",
+    # 세션/CSRF/세션 인증/메시지는 API_PATH_PREFIXES 경로에서 건너뜀 (RePlay/middleware.py)
+    "RePlay.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "RePlay.middleware.CsrfViewMiddleware",
+    "RePlay.middleware.AuthenticationMiddleware",
+    "RePlay.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# JWT로만 인증하는 API 경로 (세션 기반 Middleware를 실행하지 않음)
+API_PATH_PREFIXES = tuple(env.list('API_PATH_PREFIXES', default=['/api/']))
+
 ROOT_URLCONF = "RePlay.urls"
 
 TEMPLATES = [
@@ -88,16 +98,153 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "RePlay.wsgi.application"
+ASGI_APPLICATION = "RePlay.asgi.application"
 
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DATABASE_URL이 없으면 로컬 SQLite 파일을 사용합니다.
+# 예) postgres://user:pass@db:5432/replay, mysql://user:pass@db:3306/replay
+
+# 요청마다 연결을 새로 열지 않도록 Postgres/MySQL에서는 연결을 유지합니다.
+# DATABASE_POOL을 켜면 Postgres(psycopg 3)는 드라이버 연결 풀을 사용합니다.
+# (ASGI에서는 연결이 요청 스레드에 묶이지 않으므로 풀 사용을 권장하며, 이 경우 CONN_MAX_AGE는 0)
+DATABASE_CONN_MAX_AGE = env.int('DATABASE_CONN_MAX_AGE', default=60)
+DATABASE_POOL = env.bool('DATABASE_POOL', default=False)
+DATABASE_POOL_MIN_SIZE = env.int('DATABASE_POOL_MIN_SIZE', default=2)
+DATABASE_POOL_MAX_SIZE = env.int('DATABASE_POOL_MAX_SIZE', default=10)
+
+
+def database_config(url, **extra):
+    config = {**env.db_url_config(url), **extra}
+    if config['ENGINE'] == 'django.db.backends.sqlite3':
+        return config
+    # 유지한 연결이 끊겼으면 요청 시작 시 다시 연결
+    config['CONN_HEALTH_CHECKS'] = True
+    if DATABASE_POOL and config['ENGINE'] == 'django.db.backends.postgresql':
+        config['CONN_MAX_AGE'] = 0
+        config.setdefault('OPTIONS', {})['pool'] = {
+            'min_size': DATABASE_POOL_MIN_SIZE,
+            'max_size': DATABASE_POOL_MAX_SIZE,
+        }
+    else:
+        config['CONN_MAX_AGE'] = DATABASE_CONN_MAX_AGE
+    return config
+
+
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+    "default": database_config(env('DATABASE_URL', default=f'sqlite:///{BASE_DIR / "db.sqlite3"}')),
+}
+
+# 읽기 전용 복제본 (쉼표로 구분, 로컬에서는 SQLite 파일을 복제본 대용으로 사용 가능)
+# 예) DATABASE_REPLICA_URLS=sqlite:////tmp/replica1.sqlite3,sqlite:////tmp/replica2.sqlite3
+#     (python manage.py sync_sqlite_replicas로 기본 DB 내용을 복사)
+# 복제본을 사용하면 쓰기 후 읽기 고정 정보를 워커 프로세스 간에 공유하도록 REDIS_URL도 설정해야 합니다.
+for index, url in enumerate(env.list('DATABASE_REPLICA_URLS', default=[]), start=1):
+    DATABASES[f'replica{index}'] = database_config(url, TEST={'MIRROR': 'default'})
+
+DATABASE_ROUTERS = ['RePlay.routers.ReplicaRouter']
+
+# 복제본 라우팅 (RePlay/routers.py)
+DATABASE_REPLICAS = {
+    'ALIASES': [alias for alias in DATABASES if alias != 'default'],
+    # 복제본에서 읽어도 되는 경로 (GET/HEAD 요청만)
+    'PATHS': env.list(
+        'DATABASE_REPLICA_PATHS', default=['/api/accounts/profile/', '/api/accounts/users/']
+    ),
+    # 쓰기 후 같은 사용자의 요청을 기본 DB로 보내는 시간 (초, MAX_LAG_SECONDS 이상이어야 함)
+    'PIN_SECONDS': env.int('DATABASE_REPLICA_PIN_SECONDS', default=30),
+    # 쓰기 후 고정 정보를 저장하는 캐시 (모든 워커 프로세스가 공유해야 하므로 복제본 사용 시 REDIS_URL 필요)
+    'PIN_CACHE': 'replica_pin',
+    # 복제본 상태 확인 주기 (초)와 허용하는 최대 복제 지연 (초, Postgres만 확인)
+    'HEALTH_CHECK_INTERVAL': env.int('DATABASE_REPLICA_HEALTH_CHECK_INTERVAL', default=10),
+    'MAX_LAG_SECONDS': env.int('DATABASE_REPLICA_MAX_LAG_SECONDS', default=30),
+}
+
+
+# Cache
+# REDIS_URL이 설정되어 있으면 Redis를, 없으면 프로세스 내부 메모리를 사용합니다.
+REDIS_URL = env('REDIS_URL', default=None)
+
+# accounts의 사용자/프로필 캐시는 'accounts' 캐시를 사용하며, Redis가 있으면 프로세스 메모리(L1)와 Redis(L2)의
+# 2단계로 저장합니다. (변경 시 Redis pub/sub으로 다른 프로세스의 L1 항목을 무효화, RePlay/cache.py)
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+        "accounts": {
+            "BACKEND": "RePlay.cache.TwoTierCache",
+            "LOCATION": REDIS_URL,
+            "OPTIONS": {
+                "L1_MAX_ENTRIES": env.int('ACCOUNTS_CACHE_L1_MAX_ENTRIES', default=10000),
+                "L1_TIMEOUT": env.int('ACCOUNTS_CACHE_L1_TIMEOUT', default=30),
+            },
+        },
+        # 복제본 읽기 고정 정보는 L1 없이 Redis에서 바로 읽음
+        "replica_pin": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "replica",
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+        "accounts": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "accounts",
+        },
+        # 프로세스 간 공유되지 않으므로 복제본을 설정하면 ReplicaRoutingMiddleware가 시작 시 오류를 냄
+        "replica_pin": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "replica_pin",
+        },
     }
+
+ACCOUNTS_CACHE_ALIAS = 'accounts'
+
+# 인증된 사용자 정보 캐시 유지 시간 (초)
+ACCOUNTS_USER_CACHE_TIMEOUT = env.int('ACCOUNTS_USER_CACHE_TIMEOUT', default=300)
+
+# 직렬화된 프로필 응답 캐시 유지 시간 (초)
+ACCOUNTS_PROFILE_CACHE_TIMEOUT = env.int('ACCOUNTS_PROFILE_CACHE_TIMEOUT', default=3600)
+
+# 공개 프로필 일괄 조회 (프로세스 메모리 LRU 캐시 항목 수, 유지 시간(초), 요청당 최대 사용자 수)
+ACCOUNTS_PUBLIC_PROFILE_CACHE_SIZE = env.int('ACCOUNTS_PUBLIC_PROFILE_CACHE_SIZE', default=10000)
+ACCOUNTS_PUBLIC_PROFILE_CACHE_TIMEOUT = env.int('ACCOUNTS_PUBLIC_PROFILE_CACHE_TIMEOUT', default=60)
+ACCOUNTS_PUBLIC_PROFILE_BATCH_SIZE = env.int('ACCOUNTS_PUBLIC_PROFILE_BATCH_SIZE', default=200)
+
+# 관리자 사용자 목록: 추정 행 수가 이보다 적으면 정확한 COUNT(*) 사용
+ACCOUNTS_ADMIN_EXACT_COUNT_LIMIT = env.int('ACCOUNTS_ADMIN_EXACT_COUNT_LIMIT', default=10000)
+
+
+# Authentication backends
+# 아이디/이메일/연락처로 로그인하며, 비동기 뷰에서는 비밀번호 검증을 해싱 풀로 넘기는 백엔드
+AUTHENTICATION_BACKENDS = [
+    'accounts.backends.EmailOrPhoneBackend',
+]
+
+# 비밀번호 해싱 풀 설정
+# EXECUTOR: 'thread' 또는 'process'
+# MAX_QUEUE: 실행 중인 작업 외에 대기할 수 있는 작업 수 (초과 시 503 응답)
+PASSWORD_HASHING_POOL = {
+    'EXECUTOR': env('PASSWORD_HASHING_EXECUTOR', default='thread'),
+    'MAX_WORKERS': env.int('PASSWORD_HASHING_MAX_WORKERS', default=4),
+    'MAX_QUEUE': env.int('PASSWORD_HASHING_MAX_QUEUE', default=32),
+}
+
+# 요청 계측 (Server-Timing 헤더, /metrics 지표, 느린 요청 로그)
+# METRICS_ALLOWED_IPS가 비어 있으면 /metrics 접근을 IP로 제한하지 않음
+INSTRUMENTATION = {
+    'ENABLED': env.bool('INSTRUMENTATION_ENABLED', default=False),
+    'SERVER_TIMING': env.bool('INSTRUMENTATION_SERVER_TIMING', default=True),
+    'SLOW_REQUEST_THRESHOLD_MS': env.int('SLOW_REQUEST_THRESHOLD_MS', default=500),
+    'METRICS_ALLOWED_IPS': env.list('METRICS_ALLOWED_IPS', default=['127.0.0.1', '::1']),
 }
 
 
@@ -112,13 +259,33 @@ AUTH_PASSWORD_VALIDATORS = [
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
     },
     {
-        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+        # 유출 비밀번호 Bloom 필터 (파일이 없으면 CommonPasswordValidator로 검사)
+        "NAME": "accounts.validators.BreachedPasswordValidator",
     },
     {
         "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
     },
 ]
 
+# 비밀번호 해셔 (첫 번째가 기본 해셔, 작업량은 calibrate_hashers 명령이 생성한 설정 파일 사용)
+PASSWORD_HASHERS = [
+    'accounts.hashers.CalibratedPBKDF2PasswordHasher',
+    'accounts.hashers.CalibratedScryptPasswordHasher',
+    'accounts.hashers.CalibratedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+PASSWORD_HASHER_CALIBRATION_PATH = env(
+    'PASSWORD_HASHER_CALIBRATION_PATH', default=os.path.join(BASE_DIR, 'password_hashers.json')
+)
+
+# 유출 비밀번호 필터 (build_password_filter 명령으로 생성, 워커 간 메모리 맵 공유)
+# FALSE_POSITIVE_RATE: 필터 생성 시 목표 오탐률 (낮을수록 파일이 커짐)
+BREACHED_PASSWORD_FILTER = {
+    'PATH': env('BREACHED_PASSWORD_FILTER_PATH', default=os.path.join(BASE_DIR, 'breached_passwords.bloom')),
+    'FALSE_POSITIVE_RATE': env.float('BREACHED_PASSWORD_FILTER_FP_RATE', default=0.001),
+}
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -140,6 +307,41 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# 파일 저장소
+# PROFILE_IMAGE_STORAGE: 'filesystem' (MEDIA_ROOT), 'cloudinary' (CLOUDINARY_URL 필요),
+#                        'cloudinary-local' (Cloudinary API를 흉내 내는 로컬 디스크, 테스트용)
+PROFILE_IMAGE_STORAGE = env('PROFILE_IMAGE_STORAGE', default='filesystem')
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+    # 프로필 이미지는 내용 해시 이름으로 저장 (중복 제거, 변경 불가 캐시 헤더로 서빙)
+    'profile_images': {
+        'filesystem': {
+            'BACKEND': 'accounts.storage.ContentAddressedFileSystemStorage',
+        },
+        'cloudinary': {
+            'BACKEND': 'accounts.storage.CloudinaryContentAddressedStorage',
+        },
+        'cloudinary-local': {
+            'BACKEND': 'accounts.storage.CloudinaryContentAddressedStorage',
+            'OPTIONS': {'client': 'accounts.storage.LocalCloudinaryClient'},
+        },
+    }[PROFILE_IMAGE_STORAGE],
+}
+
+# 내용 해시 이름이 아닌 미디어 파일(렌디션 등)의 브라우저 캐시 시간 (초)
+MEDIA_CACHE_MAX_AGE = env.int('MEDIA_CACHE_MAX_AGE', default=86400)
+
+# 프로필 이미지 업로드/렌디션 설정
+PROFILE_IMAGE_MAX_UPLOAD_SIZE = env.int('PROFILE_IMAGE_MAX_UPLOAD_SIZE', default=5 * 1024 * 1024)
+PROFILE_IMAGE_RENDITION_SIZES = (64, 256, 1024)
+PROFILE_IMAGE_RENDITION_FORMATS = ('webp', 'jpeg')
+PROFILE_IMAGE_RENDITION_WORKERS = env.int('PROFILE_IMAGE_RENDITION_WORKERS', default=2)
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -156,6 +358,8 @@ SWAGGER_SETTINGS = {
         }
     },
     'USE_SESSION_AUTH': False,
+    # UI는 미리 생성한 스키마 파일을 불러옴
+    'SPEC_URL': 'schema-json',
     'DEFAULT_AUTO_SCHEMA_CLASS': 'drf_yasg.inspectors.SwaggerAutoSchema',
     'DEFAULT_FIELD_INSPECTORS': [
         'drf_yasg.inspectors.CamelCaseJSONFilter',
@@ -169,14 +373,43 @@ SWAGGER_SETTINGS = {
     ],
 }
 
+REDOC_SETTINGS = {
+    'SPEC_URL': 'schema-json',
+}
+
+# 배포 시 build_openapi_schema 명령으로 생성하는 OpenAPI 스키마 파일
+OPENAPI_SCHEMA_PATH = env('OPENAPI_SCHEMA_PATH', default=os.path.join(BASE_DIR, 'openapi.json'))
+
 # REST Framework 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
-    )
+    ),
+    # 슬라이딩 윈도우 제한 ('뷰 throttle_scope.대상': '요청 수/기간')
+    'DEFAULT_THROTTLE_RATES': {
+        'login.ip': env('THROTTLE_LOGIN_IP', default='20/min'),
+        'login.username': env('THROTTLE_LOGIN_USERNAME', default='10/min'),
+        'login.route': env('THROTTLE_LOGIN_ROUTE', default='600/min'),
+        'register.ip': env('THROTTLE_REGISTER_IP', default='10/hour'),
+        'register.route': env('THROTTLE_REGISTER_ROUTE', default='300/min'),
+        'token_refresh.ip': env('THROTTLE_TOKEN_REFRESH_IP', default='60/min'),
+        'token_refresh.route': env('THROTTLE_TOKEN_REFRESH_ROUTE', default='3000/min'),
+        'availability.ip': env('THROTTLE_AVAILABILITY_IP', default='120/min'),
+        'availability.route': env('THROTTLE_AVAILABILITY_ROUTE', default='6000/min'),
+    },
+    # 프록시 뒤에서 실행할 경우 X-Forwarded-For에서 클라이언트 IP를 읽을 프록시 수
+    'NUM_PROXIES': env.int('NUM_PROXIES', default=None),
+}
+
+# 스로틀 카운터 백엔드 (REDIS_URL이 없으면 프로세스 메모리 사용)
+RATE_LIMIT = {
+    'BACKEND': (
+        'accounts.throttling.RedisRateLimiter' if REDIS_URL
+        else 'accounts.throttling.InMemoryRateLimiter'
+    ),
 }
 
 # JWT 설정
@@ -185,5 +418,79 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=2),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
+    # 로테이션된 이전 리프레시 토큰은 TOKEN_DENYLIST에 추가
+    'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'AUTH_TOKEN_CLASSES': ('accounts.tokens.AccessToken',),
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.serializers.TokenRefreshSerializer',
+}
+
+# Channels 레이어 (REDIS_URL이 없으면 단일 프로세스용 메모리 레이어 사용)
+if REDIS_URL:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {'hosts': [REDIS_URL]},
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'},
+    }
+
+# WebSocket 접속 상태 (TTL 안에 하트비트가 없으면 접속 종료로 간주)
+PRESENCE = {
+    'BACKEND': (
+        'accounts.presence.RedisPresenceBackend' if REDIS_URL
+        else 'accounts.presence.InMemoryPresenceBackend'
+    ),
+    'TTL': env.int('PRESENCE_TTL', default=60),
+    'HEARTBEAT_INTERVAL': env.int('PRESENCE_HEARTBEAT_INTERVAL', default=20),
+    'MAX_SUBSCRIPTIONS': env.int('PRESENCE_MAX_SUBSCRIPTIONS', default=200),
+    # 다른 사용자의 접속 상태를 구독할 수 있는지 판단하는 함수 (기본: 본인과 관리자만)
+    'POLICY': 'accounts.presence.self_or_staff_policy',
+}
+
+# 아이디/이메일 사용 가능 여부 Bloom 필터 (REDIS_URL이 없으면 프로세스 메모리 사용)
+# CAPACITY는 아이디와 이메일을 합친 항목 수
+AVAILABILITY_FILTER = {
+    'BACKEND': (
+        'accounts.availability.RedisAvailabilityFilter' if REDIS_URL
+        else 'accounts.availability.InMemoryAvailabilityFilter'
+    ),
+    'CAPACITY': env.int('AVAILABILITY_FILTER_CAPACITY', default=1_000_000),
+    'FALSE_POSITIVE_RATE': env.float('AVAILABILITY_FILTER_FALSE_POSITIVE_RATE', default=0.001),
+}
+
+# 로그인/마지막 활동 시각 버퍼 (REDIS_URL이 없으면 프로세스 메모리 사용)
+# FLUSH_INTERVAL초마다 DB에 일괄 저장하며, 버퍼에 MAX_SIZE명이 쌓이면 바로 저장합니다.
+# 같은 사용자의 활동은 SEEN_RESOLUTION초에 한 번만 기록합니다.
+ACTIVITY = {
+    'BACKEND': (
+        'accounts.activity.RedisActivityBuffer' if REDIS_URL
+        else 'accounts.activity.InMemoryActivityBuffer'
+    ),
+    'FLUSH_INTERVAL': env.int('ACTIVITY_FLUSH_INTERVAL', default=30),
+    'MAX_SIZE': env.int('ACTIVITY_MAX_SIZE', default=10000),
+    'SEEN_RESOLUTION': env.int('ACTIVITY_SEEN_RESOLUTION', default=60),
+}
+
+# 계정 감사 이벤트 기록 (accounts/audit.py)
+# 이벤트는 QUEUE_SIZE 크기의 큐를 거쳐 백그라운드에서 BATCH_SIZE개씩 저장하며,
+# 큐가 가득 차면 OVERFLOW가 'spill'이면 SPILL_PATH 파일에 기록하고 'drop'이면 버립니다.
+AUDIT_LOG = {
+    'ENABLED': env.bool('AUDIT_LOG_ENABLED', default=True),
+    'QUEUE_SIZE': env.int('AUDIT_LOG_QUEUE_SIZE', default=10000),
+    'BATCH_SIZE': env.int('AUDIT_LOG_BATCH_SIZE', default=500),
+    'FLUSH_INTERVAL': env.float('AUDIT_LOG_FLUSH_INTERVAL', default=1.0),
+    'OVERFLOW': env('AUDIT_LOG_OVERFLOW', default='spill'),
+    'SPILL_PATH': env('AUDIT_LOG_SPILL_PATH', default=str(BASE_DIR / 'audit_spill.jsonl')),
+}
+
+# 토큰 denylist 설정 (REDIS_URL이 없으면 프로세스 메모리 사용)
+TOKEN_DENYLIST = {
+    'BACKEND': (
+        'accounts.denylist.RedisDenylistBackend' if REDIS_URL
+        else 'accounts.denylist.InMemoryDenylistBackend'
+    ),
 }
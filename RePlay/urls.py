@@ -15,36 +15,32 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-from rest_framework import permissions
-
-# Swagger 설정
-schema_view = get_schema_view(
-    openapi.Info(
-        title="RePlay API",
-        default_version='v1',
-        description="RePlay 프로젝트의 API 문서",
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+from accounts.instrumentation import metrics_view
+from .media import serve_media
+from .schema import precomputed_schema_view, schema_ui_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     
-    # API 문서
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    # API 문서 (스키마는 build_openapi_schema 명령으로 미리 생성한 파일 사용)
+    path('swagger.json', precomputed_schema_view, name='schema-json'),
+    path('swagger/', schema_ui_view('swagger'), name='schema-swagger-ui'),
+    path('redoc/', schema_ui_view('redoc'), name='schema-redoc'),
+    
+    # 요청 계측 지표 (Prometheus)
+    path('metrics', metrics_view, name='metrics'),
     
     # accounts 앱 URLs
     path('api/accounts/', include('accounts.urls')),
 ]
 
-# 미디어 파일 서빙 설정
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# 미디어 파일 서빙 설정 (내용 해시 이름의 파일은 immutable 캐시 헤더로 제공)
+if settings.MEDIA_URL.startswith('/'):
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.+)$' % re.escape(settings.MEDIA_URL.lstrip('/')), serve_media, name='media'),
+    ]
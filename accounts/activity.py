@@ -0,0 +1,291 @@
+import atexit
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from .cache import LRUCache
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+# 기록하는 활동 종류와 저장할 User 필드
+FIELDS = {
+    'login': 'last_login',
+    'seen': 'last_seen',
+}
+
+# 현재 기록 해시를 저장 중 키로 옮기고 저장 중 키 목록(집합)에 등록한 뒤 목록 전체를 반환하는 Lua 스크립트
+# KEYS[1]: 기록 해시 / KEYS[2]: 새 저장 중 키 / KEYS[3]: 저장 중 키 집합
+DRAIN_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RENAME', KEYS[1], KEYS[2])
+    redis.call('SADD', KEYS[3], KEYS[2])
+end
+return redis.call('SMEMBERS', KEYS[3])
+"""
+
+
+class BaseActivityBuffer:
+    """
+    사용자 활동 시각 버퍼 인터페이스
+    요청마다 DB에 쓰지 않고 사용자별 최신 시각만 모아 두었다가 ActivityFlusher가 일괄 저장합니다.
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+
+    def record(self, user_id, kind, timestamp):
+        """
+        활동 시각 기록 (같은 사용자의 이전 기록은 덮어씀)
+        버퍼가 가득 찼으면 False 반환 (바로 저장하도록 알리는 용도이며, 메모리 버퍼는 새 사용자를 기록하지 않음)
+        """
+        raise NotImplementedError
+
+    def drain(self):
+        """
+        저장할 항목 {종류: {사용자 id: 시각}}과 저장 후 acknowledge()에 넘길 값을 반환
+        """
+        raise NotImplementedError
+
+    def acknowledge(self, receipt):
+        """
+        저장에 성공한 항목을 버퍼에서 삭제
+        """
+
+    def restore(self, entries):
+        """
+        저장에 실패한 항목을 다시 버퍼에 넣음 (이미 더 최신 기록이 있으면 유지)
+        """
+        raise NotImplementedError
+
+
+class RedisActivityBuffer(BaseActivityBuffer):
+    """
+    Redis 해시 기반 버퍼
+    프로세스가 비정상 종료되어도 기록이 Redis에 남으며, 저장 중이던 항목은 저장에 성공해야 삭제되므로
+    저장 도중 종료되거나 실패해도 다음 저장 때 다시 처리됩니다.
+    """
+
+    def __init__(self, max_size=10000, prefix='accounts:activity'):
+        super().__init__(max_size)
+        self.prefix = prefix
+        self._script = None
+
+    def _key(self, kind):
+        return f'{self.prefix}:{kind}'
+
+    def record(self, user_id, kind, timestamp):
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.hset(self._key(kind), user_id, timestamp)
+        pipe.hlen(self._key(kind))
+        _, size = pipe.execute()
+        return size < self.max_size
+
+    def _flushing_set(self, kind):
+        return f'{self._key(kind)}:flushing'
+
+    def drain(self):
+        redis = get_redis()
+        if self._script is None:
+            self._script = redis.register_script(DRAIN_SCRIPT)
+        entries = {}
+        receipt = {}
+        for kind in FIELDS:
+            # 저장할 항목을 별도 키로 옮긴 뒤 읽으므로 그 사이의 새 기록은 다음 저장에 포함됨
+            # (이전 저장에 실패했거나 도중에 종료되어 남은 키도 집합에 있으므로 함께 처리)
+            keys = self._script(keys=[
+                self._key(kind), f'{self._key(kind)}:flushing:{uuid.uuid4().hex}', self._flushing_set(kind),
+            ])
+            pipe = redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            values = {}
+            for mapping in pipe.execute():
+                for user_id, timestamp in mapping.items():
+                    user_id, timestamp = int(user_id), float(timestamp)
+                    values[user_id] = max(timestamp, values.get(user_id, timestamp))
+            entries[kind] = values
+            receipt[kind] = keys
+        return entries, receipt
+
+    def acknowledge(self, receipt):
+        pipe = get_redis().pipeline()
+        for kind, keys in receipt.items():
+            if keys:
+                pipe.srem(self._flushing_set(kind), *keys)
+                pipe.delete(*keys)
+        pipe.execute()
+
+    def restore(self, entries):
+        # 저장 중 키는 acknowledge()에서만 삭제되므로 다음 drain()에서 다시 읽힘
+        pass
+
+
+class InMemoryActivityBuffer(BaseActivityBuffer):
+    """
+    프로세스 메모리 기반 버퍼
+    정상 종료 시 atexit에서 남은 항목을 저장하지만, 비정상 종료되면 마지막 저장 이후 기록은 사라집니다.
+    """
+
+    def __init__(self, max_size=10000):
+        super().__init__(max_size)
+        self._entries = {kind: {} for kind in FIELDS}
+        self._lock = threading.Lock()
+
+    def record(self, user_id, kind, timestamp):
+        with self._lock:
+            values = self._entries[kind]
+            if user_id not in values and len(values) >= self.max_size:
+                return False
+            values[user_id] = timestamp
+            return True
+
+    def drain(self):
+        with self._lock:
+            entries = self._entries
+            self._entries = {kind: {} for kind in FIELDS}
+        return entries, None
+
+    def restore(self, entries):
+        with self._lock:
+            for kind, values in entries.items():
+                for user_id, timestamp in values.items():
+                    self._entries[kind].setdefault(user_id, timestamp)
+
+
+def save_activity(entries, batch_size=500):
+    """
+    {종류: {사용자 id: 시각}}을 bulk_update로 저장하고 저장한 사용자 수 반환
+    save()를 거치지 않으므로 회원정보 버전과 수정일시는 바뀌지 않습니다.
+    """
+    users = {}
+    for kind, values in entries.items():
+        for user_id, timestamp in values.items():
+            user = users.setdefault(user_id, {})
+            user[FIELDS[kind]] = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+    # 갱신할 필드 조합별로 나누어 저장 (로그인 없이 활동만 있는 사용자의 last_login은 건드리지 않음)
+    groups = {}
+    for user_id, values in users.items():
+        groups.setdefault(tuple(sorted(values)), []).append(User(pk=user_id, **values))
+    for fields, objs in groups.items():
+        User.objects.bulk_update(objs, fields, batch_size=batch_size)
+    return len(users)
+
+
+class ActivityFlusher:
+    """
+    버퍼를 주기적으로 비워서 DB에 저장하는 백그라운드 스레드
+    버퍼가 가득 차면 주기를 기다리지 않고 바로 저장하며, 프로세스 종료 시(atexit) 남은 항목을 저장합니다.
+    """
+
+    def __init__(self, buffer, interval=30, seen_resolution=60):
+        self.buffer = buffer
+        self.interval = interval
+        # 같은 사용자의 활동은 seen_resolution초에 한 번만 버퍼에 기록 (Redis 왕복 감소)
+        self.recent = LRUCache(max_size=buffer.max_size, timeout=seen_resolution)
+        self.overflowed = 0
+        self._wakeup = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stopped = False
+
+    def record(self, user_id, kind):
+        if kind == 'seen':
+            if self.recent.get_many([user_id]):
+                return
+            self.recent.set_many({user_id: True})
+        self._ensure_started()
+        if not self.buffer.record(user_id, kind, time.time()):
+            self.overflowed += 1
+            self._wakeup.set()
+
+    def flush(self):
+        with self._flush_lock:
+            entries, receipt = self.buffer.drain()
+            if not any(entries.values()):
+                self.buffer.acknowledge(receipt)
+                return 0
+            try:
+                count = save_activity(entries)
+            except Exception:
+                self.buffer.restore(entries)
+                raise
+            self.buffer.acknowledge(receipt)
+            return count
+
+    def _ensure_started(self):
+        if self._thread is not None or self._stopped:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='activity-flusher', daemon=True)
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def _run(self):
+        while not self._stopped:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('사용자 활동 시각 저장 실패')
+            finally:
+                # 이 스레드의 DB 연결은 요청 종료 시 정리되지 않으므로 직접 닫음
+                connections.close_all()
+
+    def stop(self):
+        """
+        스레드를 멈추고 남은 항목 저장
+        """
+        self._stopped = True
+        self._wakeup.set()
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('종료 시 사용자 활동 시각 저장 실패')
+
+
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def get_activity_flusher():
+    """
+    ACTIVITY 설정의 버퍼를 사용하는 ActivityFlusher 반환
+    """
+    global _flusher
+    if _flusher is None:
+        with _flusher_lock:
+            if _flusher is None:
+                options = getattr(settings, 'ACTIVITY', {})
+                buffer_class = import_string(
+                    options.get('BACKEND', 'accounts.activity.InMemoryActivityBuffer')
+                )
+                _flusher = ActivityFlusher(
+                    buffer_class(max_size=options.get('MAX_SIZE', 10000), **options.get('OPTIONS', {})),
+                    interval=options.get('FLUSH_INTERVAL', 30),
+                    seen_resolution=options.get('SEEN_RESOLUTION', 60),
+                )
+    return _flusher
+
+
+def record_login(user_id):
+    flusher = get_activity_flusher()
+    flusher.record(user_id, 'login')
+    flusher.record(user_id, 'seen')
+
+
+def record_seen(user_id):
+    get_activity_flusher().record(user_id, 'seen')
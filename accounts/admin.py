@@ -1,3 +1,194 @@
+import json
+
+from django.conf import settings
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.auth.admin import UserAdmin
+from django.contrib.auth.forms import AdminUserCreationForm, UserChangeForm
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils.functional import cached_property
+
+from .models import CustomUser
+
+# keyset 페이지 이동 파라미터 (id 기준, 목록은 최신 가입순)
+AFTER_VAR = 'after'
+BEFORE_VAR = 'before'
+
+# 이보다 짧은 검색어는 trigram 인덱스를 쓸 수 없어 접두어 검색으로 처리
+TRIGRAM_MIN_LENGTH = 3
+
+
+def estimate_count(queryset):
+    """
+    DB 통계/실행 계획 기준 추정 행 수 (지원하지 않는 DB면 None)
+    """
+    connection = connections[queryset.db]
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                sql, params = queryset.order_by().query.sql_with_params()
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]['Plan']['Plan Rows'])
+            if connection.vendor == 'mysql' and not queryset.query.where:
+                cursor.execute(
+                    'SELECT table_rows FROM information_schema.tables '
+                    'WHERE table_schema = DATABASE() AND table_name = %s',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                return int(row[0]) if row and row[0] is not None else None
+    except DatabaseError:
+        return None
+    return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    추정 행 수를 사용하는 Paginator
+    큰 테이블에서 COUNT(*) 전체 스캔을 피하고, 추정치가 작거나 추정할 수 없으면 정확히 셉니다.
+    """
+
+    estimated = False
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < getattr(settings, 'ACCOUNTS_ADMIN_EXACT_COUNT_LIMIT', 10000):
+            return super().count
+        self.estimated = True
+        return estimate
+
+
+def _parse_id(value):
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+class KeysetChangeList(ChangeList):
+    """
+    OFFSET 대신 id 기준 keyset으로 페이지를 나누는 변경 목록
+    ?after=<id>는 그 id보다 오래된 다음 페이지, ?before=<id>는 그보다 최근인 이전 페이지를 보여주므로
+    페이지가 깊어져도 (user_type, id) 또는 기본 키 인덱스 범위 조회 한 번으로 끝납니다.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        self.after = _parse_id(request.GET.get(AFTER_VAR))
+        self.before = _parse_id(request.GET.get(BEFORE_VAR))
+        self.keyset = False
+        self.next_url = self.previous_url = None
+        super().__init__(request, *args, **kwargs)
+        # 검색 폼의 숨은 필드에도 페이지 위치는 남기지 않음
+        for name in (AFTER_VAR, BEFORE_VAR):
+            self.params.pop(name, None)
+        self.first_url = self.get_query_string()
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        for name in (AFTER_VAR, BEFORE_VAR):
+            lookup_params.pop(name, None)
+        return lookup_params
+
+    def get_results(self, request):
+        super().get_results(request)
+        self.result_count_estimated = getattr(self.paginator, 'estimated', False)
+        if (self.show_all and self.can_show_all) or not self.multi_page:
+            return
+
+        queryset = self.queryset
+        if self.before is not None:
+            # 이전 페이지: before 바로 위 한 페이지의 경계 id를 오름차순으로 구한 뒤 범위로 조회
+            ids = list(
+                queryset.filter(pk__gt=self.before)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:self.list_per_page]
+            )
+            queryset = queryset.filter(pk__gt=self.before, pk__lte=ids[-1]) if ids else queryset.none()
+        elif self.after is not None:
+            queryset = queryset.filter(pk__lt=self.after)
+        result_list = queryset.order_by('-pk')[:self.list_per_page]
+
+        rows = list(result_list)
+        if rows:
+            first, last = rows[0].pk, rows[-1].pk
+            if self.queryset.filter(pk__gt=first).exists():
+                self.previous_url = self.get_query_string({BEFORE_VAR: first})
+            if self.queryset.filter(pk__lt=last).exists():
+                self.next_url = self.get_query_string({AFTER_VAR: last})
+        self.result_list = result_list
+        self.keyset = True
+
+    def get_query_string(self, new_params=None, remove=None):
+        # 필터/검색/정렬 링크는 첫 페이지부터 보도록 페이지 위치는 직접 지정한 이전/다음 링크에만 남김
+        new_params = {AFTER_VAR: None, BEFORE_VAR: None, **(new_params or {})}
+        return super().get_query_string(new_params, remove)
+
+
+class CustomUserCreationForm(AdminUserCreationForm):
+    class Meta(AdminUserCreationForm.Meta):
+        model = CustomUser
+        fields = ('username', 'email', 'user_type')
+
+
+class CustomUserChangeForm(UserChangeForm):
+    class Meta(UserChangeForm.Meta):
+        model = CustomUser
+
+
+@admin.register(CustomUser)
+class CustomUserAdmin(UserAdmin):
+    """
+    사용자 관리자
+    수백만 행에서도 목록이 느려지지 않도록 추정 행 수, 인덱스가 있는 필터/검색, keyset 페이지만 사용합니다.
+    """
+    form = CustomUserChangeForm
+    add_form = CustomUserCreationForm
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    list_display = ('username', 'email', 'user_type', 'is_staff', 'is_active', 'date_joined')
+    list_filter = ('user_type',)
+    # 정렬을 바꾸면 keyset 페이지를 쓸 수 없으므로 id 역순으로 고정
+    ordering = ('-id',)
+    sortable_by = ()
+    search_fields = ('username', 'email')
+    search_help_text = '아이디 접두어, 이메일 전체 주소 또는 3자 이상 아이디/이메일 일부로 검색'
+
+    # 그룹/권한은 전체 목록을 불러오는 선택 위젯 대신 id 입력
+    filter_horizontal = ()
+    raw_id_fields = ('groups', 'user_permissions')
+    readonly_fields = ('version', 'modified_at', 'last_seen')
+
+    fieldsets = UserAdmin.fieldsets + (
+        ('추가 정보', {'fields': ('user_type', 'phone_number', 'profile_image')}),
+        ('상태', {'fields': ('version', 'modified_at', 'last_seen')}),
+    )
+    add_fieldsets = (
+        (None, {
+            'classes': ('wide',),
+            'fields': ('username', 'email', 'user_type', 'usable_password', 'password1', 'password2'),
+        }),
+    )
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
 
-# Register your models here.
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        if '@' in term:
+            # 이메일 전체 주소는 대소문자 구분 없는 유일 인덱스(Lower(email))로 조회
+            return queryset.alias(email_ci=Lower('email')).filter(email_ci=term.lower()), False
+        if connections[queryset.db].vendor == 'postgresql' and len(term) >= TRIGRAM_MIN_LENGTH:
+            # 0007 마이그레이션의 trigram 인덱스 사용
+            return queryset.filter(Q(username__icontains=term) | Q(email__icontains=term)), False
+        # 아이디 유일 인덱스 범위 조회
+        return queryset.filter(username__startswith=term), False
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        # 아이디/이메일 사용 가능 여부 필터를 갱신하는 시그널 등록
+        from . import availability  # noqa: F401
+        # 사용자 저장/삭제 시 사용자 캐시를 무효화하는 시그널 등록
+        from . import cache  # noqa: F401
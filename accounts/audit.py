@@ -0,0 +1,269 @@
+import atexit
+import base64
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.throttling import BaseThrottle
+
+from .instrumentation import CallbackGauge, Counter, get_metrics_registry
+from .models import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AUDIT_LOG_SETTINGS = {
+    'ENABLED': True,
+    'QUEUE_SIZE': 10000,
+    'BATCH_SIZE': 500,
+    'FLUSH_INTERVAL': 1.0,
+    # 큐가 가득 찼을 때: 'spill'은 SPILL_PATH 파일에 기록, 'drop'은 버림
+    'OVERFLOW': 'spill',
+    'SPILL_PATH': 'audit_spill.jsonl',
+}
+
+
+def get_audit_log_settings():
+    return {**DEFAULT_AUDIT_LOG_SETTINGS, **getattr(settings, 'AUDIT_LOG', {})}
+
+
+def event_to_json(event):
+    return json.dumps({**event, 'timestamp': event['timestamp'].isoformat()}, ensure_ascii=False)
+
+
+def event_from_json(line):
+    event = json.loads(line)
+    event['timestamp'] = datetime.fromisoformat(event['timestamp'])
+    return event
+
+
+class AuditLog:
+    """
+    감사 이벤트 큐와 백그라운드 기록기
+    뷰는 emit()으로 이벤트를 크기가 제한된 큐에 넣기만 하고, 기록기 스레드가 모아서 bulk_create로 저장합니다.
+    큐가 가득 차면 OVERFLOW 정책에 따라 파일에 기록하거나 버리며, DB 저장에 실패한 묶음은 항상 파일에 기록합니다.
+    파일 기록도 요청(이벤트 루프)에서 하지 않도록 별도 큐에 넣고 파일 기록 스레드가 모아서 씁니다.
+    (파일에 기록된 이벤트는 load_audit_spill 명령으로 DB에 다시 저장)
+    """
+
+    def __init__(self, queue_size=10000, batch_size=500, flush_interval=1.0, overflow='spill', spill_path=None):
+        if overflow not in ('spill', 'drop'):
+            raise ValueError("overflow는 'spill' 또는 'drop'이어야 합니다.")
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.spill_queue = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.spill_path = spill_path
+        self._spill_lock = threading.Lock()
+        self._thread = None
+        self._spill_thread = None
+        self._thread_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+        registry = get_metrics_registry()
+        self.events = registry.register(Counter(
+            'replay_audit_events_total', '감사 이벤트 처리 결과별 개수', ('outcome',)
+        ))
+        self.write_seconds = registry.register(Counter(
+            'replay_audit_write_seconds_total', '감사 이벤트 bulk_create 누적 시간'
+        ))
+        registry.register(CallbackGauge(
+            'replay_audit_queue_depth', '저장 대기 중인 감사 이벤트 수', self.queue.qsize
+        ))
+
+    def emit(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            if self.overflow == 'spill':
+                self._enqueue_spill(event)
+            else:
+                self.events.inc('dropped')
+            return
+        self.events.inc('enqueued')
+        self._ensure_started()
+
+    def _enqueue_spill(self, event):
+        try:
+            self.spill_queue.put_nowait(event)
+        except queue.Full:
+            # 파일 기록도 밀려 있으면 요청을 기다리게 하지 않고 버림
+            self.events.inc('dropped')
+            return
+        self._ensure_spill_started()
+
+    def spill(self, events):
+        try:
+            with self._spill_lock, open(self.spill_path, 'a', encoding='utf-8') as file:
+                file.writelines(f'{event_to_json(event)}\n' for event in events)
+        except OSError:
+            logger.exception('감사 이벤트 %d개를 파일에 기록하지 못해 버립니다.', len(events))
+            self.events.inc('dropped', amount=len(events))
+        else:
+            self.events.inc('spilled', amount=len(events))
+
+    def write(self, events):
+        started = time.perf_counter()
+        try:
+            AuditEvent.objects.bulk_create(AuditEvent(**event) for event in events)
+        except Exception:
+            logger.exception('감사 이벤트 %d개를 저장하지 못해 파일에 기록합니다.', len(events))
+            self.spill(events)
+        else:
+            self.events.inc('written', amount=len(events))
+        finally:
+            self.write_seconds.inc(amount=time.perf_counter() - started)
+
+    def _next_batch(self, timeout, source=None):
+        source = source if source is not None else self.queue
+        try:
+            batch = [source.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(source.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self):
+        """
+        큐에 남은 이벤트를 모두 저장하고, 파일 기록 대기 중인 이벤트를 파일에 기록
+        """
+        while batch := self._next_batch(timeout=0):
+            self.write(batch)
+        while batch := self._next_batch(timeout=0, source=self.spill_queue):
+            self.spill(batch)
+
+    def _ensure_started(self):
+        if self._thread is not None or self._stopped.is_set():
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def _ensure_spill_started(self):
+        if self._spill_thread is not None or self._stopped.is_set():
+            return
+        with self._thread_lock:
+            if self._spill_thread is None:
+                self._spill_thread = threading.Thread(target=self._run_spill, name='audit-spill', daemon=True)
+                self._spill_thread.start()
+                atexit.register(self.stop)
+
+    def _run_spill(self):
+        while not self._stopped.is_set():
+            batch = self._next_batch(timeout=self.flush_interval, source=self.spill_queue)
+            if batch:
+                self.spill(batch)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            batch = self._next_batch(timeout=self.flush_interval)
+            if not batch:
+                continue
+            try:
+                self.write(batch)
+            finally:
+                # 이 스레드의 DB 연결은 요청 종료 시 정리되지 않으므로 직접 닫음
+                connections.close_all()
+
+    def stop(self, timeout=5):
+        """
+        기록기를 멈추고 남은 이벤트 저장 (프로세스 종료 시 atexit에서 호출)
+        """
+        self._stopped.set()
+        for thread in (self._thread, self._spill_thread):
+            if thread is not None:
+                thread.join(timeout)
+        self.flush()
+
+
+_audit_log = None
+_audit_log_lock = threading.Lock()
+
+
+def get_audit_log():
+    global _audit_log
+    if _audit_log is None:
+        with _audit_log_lock:
+            if _audit_log is None:
+                options = get_audit_log_settings()
+                _audit_log = AuditLog(
+                    queue_size=options['QUEUE_SIZE'],
+                    batch_size=options['BATCH_SIZE'],
+                    flush_interval=options['FLUSH_INTERVAL'],
+                    overflow=options['OVERFLOW'],
+                    spill_path=os.fspath(options['SPILL_PATH']),
+                )
+    return _audit_log
+
+
+def client_ip(request):
+    # 스로틀과 같은 방식으로 NUM_PROXIES를 고려해서 클라이언트 IP를 읽음
+    return BaseThrottle().get_ident(request) or None
+
+
+def audit(event_type, request=None, user=None, username='', **data):
+    """
+    감사 이벤트 기록 (큐에 넣기만 하므로 요청을 기다리게 하지 않음)
+    """
+    if not get_audit_log_settings()['ENABLED']:
+        return
+    get_audit_log().emit({
+        'timestamp': timezone.now(),
+        'event_type': event_type,
+        'user_id': getattr(user, 'pk', None),
+        'username': username or getattr(user, 'username', ''),
+        'ip_address': client_ip(request) if request is not None else None,
+        'user_agent': request.headers.get('User-Agent', '')[:255] if request is not None else '',
+        'data': data,
+    })
+
+
+def encode_cursor(event):
+    value = f'{event.timestamp.isoformat()}|{event.pk}'
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    다음 페이지 커서를 (시각, id)로 변환 (형식이 잘못되었으면 ValueError)
+    """
+    try:
+        timestamp, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(timestamp), int(pk)
+    except (UnicodeError, ValueError, TypeError) as exc:
+        raise ValueError('잘못된 커서입니다.') from exc
+
+
+def audit_events(user_id=None, event_types=None, since=None, until=None, cursor=None):
+    """
+    최신순 감사 이벤트 QuerySet
+    사용자를 지정하면 (user, timestamp) 인덱스를, 아니면 timestamp 인덱스를 사용하며,
+    OFFSET 대신 마지막 이벤트의 (시각, id) 커서로 다음 페이지를 조회합니다.
+    """
+    queryset = AuditEvent.objects.order_by('-timestamp', '-id')
+    if user_id is not None:
+        queryset = queryset.filter(user_id=user_id)
+    if event_types:
+        queryset = queryset.filter(event_type__in=event_types)
+    if since is not None:
+        queryset = queryset.filter(timestamp__gte=since)
+    if until is not None:
+        queryset = queryset.filter(timestamp__lt=until)
+    if cursor is not None:
+        timestamp, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=pk))
+    return queryset
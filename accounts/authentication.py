@@ -0,0 +1,104 @@
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from RePlay.routers import bind_user
+
+from .activity import record_seen
+from .cache import get_cached_user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    캐시된 사용자 정보를 사용하는 JWT 인증 클래스
+    매 요청마다 발생하던 사용자 SELECT 쿼리를 버전이 붙은 캐시 조회로 대체합니다.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = get_cached_user(user_id)
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        # 최근에 쓰기를 한 사용자면 이 요청의 읽기를 기본 DB로 고정
+        bind_user(user.pk)
+
+        # 마지막 활동 시각은 버퍼에 기록하고 주기적으로 일괄 저장
+        record_seen(user.pk)
+        return user
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    """
+    WebSocket 연결을 JWT access 토큰으로 인증하는 Channels Middleware
+    Authorization 헤더(Bearer)의 토큰을 사용하고, 헤더를 지정할 수 없는 브라우저는
+    Sec-WebSocket-Protocol로 보냅니다. (new WebSocket(url, ['bearer', token]))
+    URL(?token=)은 프록시/서버 접근 로그에 남으므로 사용하지 않습니다.
+    인증에 실패하면 scope['user']를 AnonymousUser로 설정합니다.
+    토큰 만료 시각(timestamp)은 scope['token_expires_at']에, 응답할 서브프로토콜은 scope['auth_subprotocol']에
+    기록합니다. (인증 실패 시 None)
+    """
+
+    authentication_class = CachedJWTAuthentication
+    subprotocol = 'bearer'
+
+    async def __call__(self, scope, receive, send):
+        scope = dict(scope)
+        raw_token, scope['auth_subprotocol'] = self.get_raw_token(scope)
+        # 토큰은 이후 단계(Consumer, 로그)에 서브프로토콜 목록으로 남기지 않음
+        scope['subprotocols'] = [
+            protocol for protocol in scope.get('subprotocols', ()) if protocol.encode() != raw_token
+        ]
+        scope['user'], scope['token_expires_at'] = await self.authenticate(raw_token)
+        if scope['user'].is_anonymous:
+            scope['auth_subprotocol'] = None
+        return await super().__call__(scope, receive, send)
+
+    def get_raw_token(self, scope):
+        """
+        (토큰, 응답할 서브프로토콜)
+        """
+        for name, value in scope.get('headers', ()):
+            if name == b'authorization':
+                parts = value.split()
+                if len(parts) == 2 and parts[0].decode('latin-1') in api_settings.AUTH_HEADER_TYPES:
+                    return parts[1], None
+        # Sec-WebSocket-Protocol: bearer, <토큰>
+        protocols = list(scope.get('subprotocols', ()))
+        if self.subprotocol in protocols:
+            index = protocols.index(self.subprotocol)
+            if index + 1 < len(protocols):
+                return protocols[index + 1].encode(), self.subprotocol
+        return None, None
+
+    @database_sync_to_async
+    def authenticate(self, raw_token):
+        if raw_token is None:
+            return AnonymousUser(), None
+        authentication = self.authentication_class()
+        try:
+            validated_token = authentication.get_validated_token(raw_token)
+            return authentication.get_user(validated_token), validated_token.get('exp')
+        except (AuthenticationFailed, InvalidToken, TokenError):
+            return AnonymousUser(), None
@@ -0,0 +1,306 @@
+import hashlib
+import logging
+import threading
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models.functions import Lower
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .bloom import bit_positions, optimal_parameters
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+def normalize(kind, value):
+    """
+    필터 키로 사용할 값 정규화 (이메일은 DB 유일성 제약과 같이 대소문자 구분 없음)
+    """
+    return value.lower() if kind == 'email' else value
+
+
+def item_digest(kind, value):
+    return hashlib.sha1(f'{kind}:{normalize(kind, value)}'.encode('utf-8')).digest()
+
+
+def user_items(user):
+    """
+    사용자가 차지하고 있는 (종류, 값) 목록
+    """
+    items = [('username', user.username)]
+    if user.email:
+        items.append(('email', user.email))
+    return items
+
+
+def iter_taken_items(queryset=None):
+    """
+    DB에 있는 모든 아이디/이메일을 (종류, 값)으로 순회 (필터 재생성용)
+    """
+    if queryset is None:
+        queryset = User.objects.all()
+    for username, email in queryset.values_list('username', 'email').iterator(chunk_size=2000):
+        yield 'username', username
+        if email:
+            yield 'email', email
+
+
+def _set_bits(bits, positions):
+    # Redis SETBIT/GETBIT과 같은 비트 순서 (바이트의 최상위 비트가 0번)
+    for bit in positions:
+        bits[bit >> 3] |= 0x80 >> (bit & 7)
+
+
+class BaseAvailabilityFilter:
+    """
+    사용 중인 아이디/이메일 Bloom 필터 인터페이스
+    필터에 없으면 확실히 사용 가능하고, 있으면 오탐일 수 있으므로 DB에서 다시 확인합니다.
+    탈퇴/변경으로 더 이상 쓰이지 않는 값은 재생성 전까지 남아 있지만, DB 확인으로 넘어갈 뿐 결과는 정확합니다.
+    """
+
+    def __init__(self, capacity=1_000_000, false_positive_rate=0.001):
+        self.num_bits, self.num_hashes = optimal_parameters(capacity, false_positive_rate)
+        self._build_thread = None
+        self._build_lock = threading.Lock()
+
+    def positions(self, kind, value):
+        return bit_positions(item_digest(kind, value), self.num_bits, self.num_hashes)
+
+    def build_bits(self, items):
+        bits = bytearray(self.num_bits // 8)
+        count = 0
+        for kind, value in items:
+            _set_bits(bits, self.positions(kind, value))
+            count += 1
+        return bits, count
+
+    def is_ready(self):
+        raise NotImplementedError
+
+    def add(self, items):
+        """
+        항목 추가 (필터가 아직 만들어지지 않았으면 무시하고, 재생성 시 반영)
+        """
+        raise NotImplementedError
+
+    def might_contain(self, items):
+        """
+        항목별 포함 가능 여부 목록 (False이면 확실히 없음)
+        """
+        raise NotImplementedError
+
+    def store(self, bits):
+        raise NotImplementedError
+
+    def rebuild(self):
+        """
+        DB 전체로 필터를 다시 만들고 기록한 항목 수 반환
+        재생성 중에 가입/수정된 사용자는 교체 후 다시 추가합니다.
+        """
+        started = timezone.now()
+        bits, count = self.build_bits(iter_taken_items())
+        self.store(bits)
+        self.add(list(iter_taken_items(User.objects.filter(modified_at__gte=started))))
+        return count
+
+    def ensure_ready(self):
+        """
+        필터가 없으면 DB로 생성하고, 사용할 수 있으면 True 반환
+        (다른 프로세스가 생성 중이라 아직 쓸 수 없으면 False)
+        """
+        if self.is_ready():
+            return True
+        self.rebuild()
+        return True
+
+    def build_in_background(self):
+        """
+        필터 생성을 백그라운드 스레드에서 시작 (이미 생성 중이면 무시)
+        전체 사용자를 읽는 생성이 요청을 막지 않도록 하며, 생성되는 동안 조회는 DB로 확인합니다.
+        """
+        with self._build_lock:
+            if self._build_thread is not None and self._build_thread.is_alive():
+                return
+            self._build_thread = threading.Thread(
+                target=self._build, name='availability-filter-build', daemon=True
+            )
+            self._build_thread.start()
+
+    def _build(self):
+        try:
+            self.ensure_ready()
+        except Exception:
+            logger.exception('사용 가능 여부 필터 생성 실패')
+        finally:
+            # 이 스레드의 DB 연결은 요청 종료 시 정리되지 않으므로 직접 닫음
+            connections.close_all()
+
+
+class RedisAvailabilityFilter(BaseAvailabilityFilter):
+    """
+    Redis 비트맵 기반 필터
+    모든 프로세스가 같은 비트맵을 공유하며, 크기가 바뀌면 다른 키를 사용하므로 새로 생성됩니다.
+    """
+
+    def __init__(self, capacity=1_000_000, false_positive_rate=0.001, prefix='accounts:availability'):
+        super().__init__(capacity, false_positive_rate)
+        self.key = f'{prefix}:{self.num_bits}:{self.num_hashes}'
+
+    def is_ready(self):
+        return bool(get_redis().exists(self.key))
+
+    def add(self, items):
+        redis = get_redis()
+        # 키가 없을 때 SETBIT을 하면 일부 항목만 있는 필터가 생기므로 재생성에 맡김
+        if not redis.exists(self.key):
+            return
+        pipe = redis.pipeline(transaction=False)
+        for kind, value in items:
+            for bit in self.positions(kind, value):
+                pipe.setbit(self.key, bit, 1)
+        pipe.execute()
+
+    def might_contain(self, items):
+        pipe = get_redis().pipeline(transaction=False)
+        for kind, value in items:
+            for bit in self.positions(kind, value):
+                pipe.getbit(self.key, bit)
+        bits = pipe.execute()
+        return [
+            all(bits[index * self.num_hashes:(index + 1) * self.num_hashes])
+            for index in range(len(items))
+        ]
+
+    def store(self, bits):
+        # 임시 키에 기록한 뒤 RENAME으로 교체해서 조회 중인 필터가 비어 보이지 않도록 함
+        temp_key = f'{self.key}:building'
+        pipe = get_redis().pipeline()
+        pipe.set(temp_key, bytes(bits))
+        pipe.rename(temp_key, self.key)
+        pipe.execute()
+
+    def ensure_ready(self):
+        if self.is_ready():
+            return True
+        lock = get_redis().lock(f'{self.key}:lock', timeout=600)
+        if not lock.acquire(blocking=False):
+            return False
+        try:
+            if not self.is_ready():
+                self.rebuild()
+        finally:
+            lock.release()
+        return True
+
+
+class InMemoryAvailabilityFilter(BaseAvailabilityFilter):
+    """
+    프로세스 메모리 기반 필터 (테스트 및 Redis 없는 로컬 개발용)
+    다른 프로세스에서 가입한 사용자는 반영되지 않으므로 여러 프로세스로 실행할 때는 Redis를 사용해야 합니다.
+    """
+
+    def __init__(self, capacity=1_000_000, false_positive_rate=0.001):
+        super().__init__(capacity, false_positive_rate)
+        self._bits = None
+        self._lock = threading.Lock()
+
+    def is_ready(self):
+        return self._bits is not None
+
+    def add(self, items):
+        with self._lock:
+            if self._bits is not None:
+                for kind, value in items:
+                    _set_bits(self._bits, self.positions(kind, value))
+
+    def might_contain(self, items):
+        bits = self._bits
+        return [
+            all(bits[bit >> 3] & (0x80 >> (bit & 7)) for bit in self.positions(kind, value))
+            for kind, value in items
+        ]
+
+    def store(self, bits):
+        with self._lock:
+            self._bits = bits
+
+    def ensure_ready(self):
+        with self._lock:
+            if self._bits is not None:
+                return True
+        return super().ensure_ready()
+
+    def clear(self):
+        with self._lock:
+            self._bits = None
+
+
+_filter = None
+_filter_lock = threading.Lock()
+
+
+def get_availability_filter():
+    """
+    AVAILABILITY_FILTER 설정의 필터 인스턴스 반환
+    """
+    global _filter
+    if _filter is None:
+        with _filter_lock:
+            if _filter is None:
+                options = getattr(settings, 'AVAILABILITY_FILTER', {})
+                filter_class = import_string(
+                    options.get('BACKEND', 'accounts.availability.InMemoryAvailabilityFilter')
+                )
+                _filter = filter_class(
+                    capacity=options.get('CAPACITY', 1_000_000),
+                    false_positive_rate=options.get('FALSE_POSITIVE_RATE', 0.001),
+                    **options.get('OPTIONS', {}),
+                )
+    return _filter
+
+
+def _taken_in_db(kind, value):
+    # 유일 인덱스(username, Lower(email))로 조회
+    if kind == 'username':
+        return User.objects.filter(username=value).exists()
+    return (
+        User.objects.alias(email_ci=Lower('email'))
+        .filter(email_ci=value.lower())
+        .exclude(email='')
+        .exists()
+    )
+
+
+def check_availability(items):
+    """
+    {종류: 사용 가능 여부}
+    필터에 없는 값은 DB 조회 없이 사용 가능으로, 있을 수도 있는 값만 DB에서 확인합니다.
+    필터가 아직 없으면 백그라운드에서 생성을 시작하고, 그동안은 모두 DB에서 확인합니다.
+    """
+    bloom = get_availability_filter()
+    if bloom.is_ready():
+        maybe_taken = bloom.might_contain(items)
+    else:
+        bloom.build_in_background()
+        maybe_taken = [True] * len(items)
+    return {
+        kind: not (maybe and _taken_in_db(kind, value))
+        for (kind, value), maybe in zip(items, maybe_taken)
+    }
+
+
+@receiver(post_save, sender=User, dispatch_uid='accounts.availability.record_user')
+def record_user(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    가입/정보 수정 시 아이디와 이메일을 필터에 추가
+    (로그인 시각/비밀번호만 저장하는 경우는 제외)
+    """
+    if raw or (update_fields and set(update_fields) <= User.UNVERSIONED_FIELDS):
+        return
+    get_availability_filter().add(user_items(instance))
@@ -0,0 +1,91 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models import Value
+from django.db.models.functions import Lower
+
+from .hashing import acheck_password, amake_password, check_password, make_password
+from .models import login_identifier_kind, normalize_phone_number, normalized_phone_number
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    비밀번호 검증을 해싱 풀에서 수행하는 인증 백엔드
+    Django 5.1의 django.contrib.auth.aauthenticate()는 동기 authenticate()를 스레드에서 실행하므로
+    동기 인증도 해싱 풀에서 검증하고 결과를 기다립니다. (풀 한도 초과 시 HashingPoolUnavailable)
+    백엔드의 aauthenticate()를 직접 호출하는 Django 5.2부터는 비동기 인증이 이벤트 루프를 막지 않습니다.
+    로그인 식별자에 여러 사용자가 일치하면 각 사용자의 비밀번호를 차례로 확인합니다.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        users = self.get_users_for_login(username)
+        if not users:
+            # 존재하지 않는 사용자도 해싱을 한 번 수행하여 응답 시간 차이를 줄입니다. (#20760)
+            make_password(password)
+        for user in users:
+            if check_password(user, password) and self.user_can_authenticate(user):
+                return user
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        users = await self.aget_users_for_login(username)
+        if not users:
+            await amake_password(password)
+        for user in users:
+            if await acheck_password(user, password) and self.user_can_authenticate(user):
+                return user
+
+    def get_login_queryset(self, identifier):
+        return UserModel._default_manager.filter(**{UserModel.USERNAME_FIELD: identifier})
+
+    def get_users_for_login(self, identifier):
+        """
+        로그인 식별자와 일치하는 사용자 목록 (먼저 확인할 사용자부터, 중복 없음)
+        """
+        return list({user.pk: user for user in self.get_login_queryset(identifier)}.values())
+
+    async def aget_users_for_login(self, identifier):
+        return list({user.pk: user async for user in self.get_login_queryset(identifier)}.values())
+
+
+class EmailOrPhoneBackend(PooledModelBackend):
+    """
+    아이디, 이메일(대소문자 무시), 연락처(구분 문자 무시) 중 하나로 로그인하는 인증 백엔드
+    세 조건을 한 번의 쿼리로 조회하며, 각 조건은 유일 인덱스(username, Lower(email),
+    정규화된 phone_number)를 사용합니다.
+    여러 사용자가 일치하면 식별자 형태(login_identifier_kind)에 맞는 필드로 찾은 사용자부터 확인하므로,
+    다른 사람의 이메일/연락처와 같은 아이디를 만들어도 그 사람의 로그인을 막을 수 없습니다.
+    """
+
+    def get_login_queryset(self, identifier):
+        manager = UserModel._default_manager
+        # 각 조건이 자기 인덱스를 타도록 UNION ALL로 묶음 (부분 인덱스 조건도 함께 지정)
+        by_username = manager.filter(**{UserModel.USERNAME_FIELD: identifier})
+        by_email = (
+            manager.alias(email_ci=Lower('email'))
+            .filter(email_ci=identifier.lower())
+            .exclude(email='')
+        )
+        by_phone = (
+            manager.alias(phone_normalized=normalized_phone_number())
+            .filter(phone_normalized=normalize_phone_number(identifier), phone_number__isnull=False)
+            .exclude(phone_number='')
+        )
+        kind = login_identifier_kind(identifier)
+        return (
+            by_username.annotate(login_match=Value(0 if kind == 'username' else 1))
+            .union(
+                by_email.annotate(login_match=Value(0 if kind == 'email' else 2)),
+                by_phone.annotate(login_match=Value(0 if kind == 'phone_number' else 3)),
+                all=True,
+            )
+            .order_by('login_match')
+        )
@@ -0,0 +1,115 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import tempfile
+
+# 파일 형식: 헤더(매직, 비트 수, 해시 함수 수, 항목 수) + 비트 배열
+MAGIC = b'RPBLOOM1'
+HEADER = struct.Struct('<8sQIQ4x')
+
+
+def password_digest(password):
+    """
+    필터 키로 사용하는 비밀번호 SHA-1 다이제스트 (유출 비밀번호 목록과 같은 형식)
+    """
+    return hashlib.sha1(password.encode('utf-8')).digest()
+
+
+def optimal_parameters(capacity, false_positive_rate):
+    """
+    항목 수와 목표 오탐률로 비트 수와 해시 함수 수 계산
+    """
+    if capacity < 1:
+        capacity = 1
+    if not 0 < false_positive_rate < 1:
+        raise ValueError('false_positive_rate는 0과 1 사이여야 합니다.')
+    num_bits = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+    num_bits = max(8, (num_bits + 7) // 8 * 8)
+    num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+    return num_bits, num_hashes
+
+
+def bit_positions(digest, num_bits, num_hashes):
+    """
+    다이제스트(16바이트 이상)에 대응하는 비트 위치 num_hashes개
+    두 해시 값을 잘라 k개의 위치를 만듭니다. (Kirsch-Mitzenmacher)
+    """
+    h1 = int.from_bytes(digest[:8], 'little')
+    h2 = int.from_bytes(digest[8:16], 'little') | 1
+    for i in range(num_hashes):
+        yield (h1 + i * h2) % num_bits
+
+
+class BloomFilter:
+    """
+    메모리 맵으로 여는 읽기 전용 Bloom 필터
+    같은 파일을 여는 모든 워커 프로세스가 OS 페이지 캐시를 공유합니다.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.inode = os.fstat(file.fileno()).st_ino
+        magic, self.num_bits, self.num_hashes, self.count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or len(self._mmap) < HEADER.size + self.num_bits // 8:
+            self._mmap.close()
+            raise ValueError(f'Bloom 필터 파일 형식이 올바르지 않습니다: {self.path}')
+        self._offset = HEADER.size
+
+    def __contains__(self, digest):
+        data = self._mmap
+        offset = self._offset
+        num_bits = self.num_bits
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        # 비트 하나라도 0이면 바로 종료하므로 목록에 없는 비밀번호는 대부분 1~2번 조회로 끝남
+        for i in range(self.num_hashes):
+            bit = (h1 + i * h2) % num_bits
+            if not data[offset + (bit >> 3)] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def contains_password(self, password):
+        return password_digest(password) in self
+
+    @property
+    def false_positive_rate(self):
+        """
+        저장된 항목 수 기준 예상 오탐률
+        """
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def close(self):
+        self._mmap.close()
+
+    @classmethod
+    def build(cls, path, digests, capacity, false_positive_rate):
+        """
+        다이제스트 목록으로 필터 파일 생성
+        임시 파일에 기록한 뒤 교체하므로, 실행 중인 워커는 다시 열 때까지 이전 필터를 계속 사용합니다.
+        """
+        num_bits, num_hashes = optimal_parameters(capacity, false_positive_rate)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.bloom-')
+        count = 0
+        try:
+            with os.fdopen(fd, 'w+b') as file:
+                file.truncate(HEADER.size + num_bits // 8)
+                with mmap.mmap(file.fileno(), 0) as data:
+                    for digest in digests:
+                        for bit in bit_positions(digest, num_bits, num_hashes):
+                            data[HEADER.size + (bit >> 3)] |= 1 << (bit & 7)
+                        count += 1
+                    HEADER.pack_into(data, 0, MAGIC, num_bits, num_hashes, count)
+                    data.flush()
+                os.fsync(file.fileno())
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return cls(path)
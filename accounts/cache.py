@@ -0,0 +1,188 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.connection import ConnectionProxy
+
+User = get_user_model()
+
+# 사용자/프로필 캐시 (settings.CACHES의 ACCOUNTS_CACHE_ALIAS, 운영에서는 2단계 캐시 RePlay.cache.TwoTierCache)
+cache = ConnectionProxy(caches, getattr(settings, 'ACCOUNTS_CACHE_ALIAS', 'default'))
+
+# 캐시된 사용자 정보 유지 시간 (초)
+USER_CACHE_TIMEOUT = getattr(settings, 'ACCOUNTS_USER_CACHE_TIMEOUT', 300)
+
+# 직렬화된 프로필 응답 유지 시간 (초)
+PROFILE_CACHE_TIMEOUT = getattr(settings, 'ACCOUNTS_PROFILE_CACHE_TIMEOUT', 3600)
+
+
+class LRUCache:
+    """
+    프로세스 메모리 LRU 캐시
+    항목 수(max_size)를 넘으면 가장 오래 사용되지 않은 항목부터 버리고, timeout이 지난 항목은 조회되지 않습니다.
+    """
+
+    def __init__(self, max_size, timeout):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                item = self._data.get(key)
+                if item is None:
+                    continue
+                expires_at, value = item
+                if expires_at <= now:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                found[key] = value
+        return found
+
+    def set_many(self, mapping):
+        expires_at = time.monotonic() + self.timeout
+        with self._lock:
+            for key, value in mapping.items():
+                self._data[key] = (expires_at, value)
+                self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# 공개 프로필 조회용 사용자 캐시 (사용자 id -> 공개 필드만 읽은 User)
+# 프로세스마다 따로 유지되므로 다른 프로세스에서 수정된 정보는 최대 TIMEOUT 동안 이전 값이 보일 수 있습니다.
+public_profile_cache = LRUCache(
+    max_size=getattr(settings, 'ACCOUNTS_PUBLIC_PROFILE_CACHE_SIZE', 10000),
+    timeout=getattr(settings, 'ACCOUNTS_PUBLIC_PROFILE_CACHE_TIMEOUT', 60),
+)
+
+
+def _version_key(user_id):
+    return f'accounts:user:{user_id}:version'
+
+
+def _user_key(user_id, version):
+    return f'accounts:user:{user_id}:v{version}'
+
+
+def _initial_version():
+    # 버전 키가 캐시에서 밀려난 뒤 다시 만들 때 예전 버전 번호(와 남아 있는 그 버전의 항목)를 재사용하지 않도록
+    # 고정값 대신 현재 시각으로 초기화
+    return time.time_ns()
+
+
+def get_user_version(user_id):
+    """
+    사용자 캐시 버전 조회
+    버전 정보가 없으면 새 값으로 초기화합니다.
+    """
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        initial = _initial_version()
+        cache.add(_version_key(user_id), initial, timeout=None)
+        version = cache.get(_version_key(user_id), initial)
+    return version
+
+
+def get_cached_user(user_id):
+    """
+    버전이 붙은 캐시에서 사용자를 조회하고, 없으면 DB에서 읽어 캐시에 저장
+    (2단계 캐시에서는 동시에 캐시가 비어도 DB 조회는 한 번만 실행)
+    사용자가 없으면 User.DoesNotExist 예외가 발생합니다.
+    """
+    key = _user_key(user_id, get_user_version(user_id))
+    # 복제본의 이전 값(비밀번호 해시, 버전)이 새 버전 키로 캐시되지 않도록 항상 기본 DB에서 읽음
+    return cache.get_or_set(
+        key, lambda: User.objects.using(DEFAULT_DB_ALIAS).get(pk=user_id), USER_CACHE_TIMEOUT
+    )
+
+
+def invalidate_user_cache(user_id):
+    """
+    사용자 캐시 무효화
+    버전을 올려서 이전 버전의 캐시 항목이 더 이상 조회되지 않도록 합니다.
+    (무효화 도중 이전 값을 읽은 요청이 캐시를 다시 채우더라도 이전 버전 키에만 기록됩니다.)
+    """
+    public_profile_cache.delete(user_id)
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        cache.set(_version_key(user_id), _initial_version(), timeout=None)
+
+
+# 저장해도 사용자 캐시를 무효화하지 않는 필드 (로그인/활동 시각, 인증에 영향 없음)
+CACHE_IRRELEVANT_FIELDS = frozenset({'last_login', 'last_seen'})
+
+
+@receiver(post_save, sender=User, dispatch_uid='accounts.cache.invalidate_saved_user')
+def invalidate_saved_user(sender, instance, update_fields=None, using=None, **kwargs):
+    """
+    사용자 저장 시 캐시 무효화 (API, 관리자, 셸 등 모든 저장 경로)
+    트랜잭션 안이면 커밋된 뒤에 무효화해서 커밋 전 값이 다시 캐시되지 않도록 합니다.
+    """
+    if update_fields and set(update_fields) <= CACHE_IRRELEVANT_FIELDS:
+        return
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user_cache(user_id), using=using)
+
+
+@receiver(post_delete, sender=User, dispatch_uid='accounts.cache.invalidate_deleted_user')
+def invalidate_deleted_user(sender, instance, using=None, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user_cache(user_id), using=using)
+
+
+def profile_cache_key(user, base_url=''):
+    """
+    직렬화된 프로필 캐시 키
+    회원정보 버전이 키에 포함되므로 정보가 수정되면 이전 항목은 더 이상 조회되지 않습니다.
+    이미지 URL이 요청 호스트 기준의 절대 URL이므로 base_url도 키에 포함합니다.
+    """
+    return f'accounts:profile:{user.pk}:v{user.version}:{base_url}'
+
+
+async def aget_cached_profile(user, base_url=''):
+    return await cache.aget(profile_cache_key(user, base_url))
+
+
+async def aset_cached_profile(user, data, base_url=''):
+    await cache.aset(profile_cache_key(user, base_url), data, PROFILE_CACHE_TIMEOUT)
+
+
+async def aget_public_users(user_ids):
+    """
+    공개 프로필용 사용자 일괄 조회 ({사용자 id: User})
+    캐시에 없는 사용자만 한 번의 id__in 쿼리로 공개 필드만 읽어 옵니다.
+    (없거나 비활성화된 사용자는 결과에 포함되지 않음)
+    """
+    users = public_profile_cache.get_many(user_ids)
+    missing = [user_id for user_id in user_ids if user_id not in users]
+    if missing:
+        queryset = User.objects.filter(pk__in=missing, is_active=True).only(
+            'id', 'username', 'user_type', 'profile_image'
+        )
+        fetched = {user.pk: user async for user in queryset}
+        # 없는 사용자도 None으로 캐시해서 같은 id가 반복해서 조회되지 않도록 함
+        fetched = {user_id: fetched.get(user_id) for user_id in missing}
+        public_profile_cache.set_many(fetched)
+        users.update(fetched)
+    return {user_id: user for user_id, user in users.items() if user is not None}
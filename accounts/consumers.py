@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import time
+import weakref
+
+from asgiref.sync import sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
+
+from .notifications import abroadcast_presence, presence_group, user_group
+from .presence import allowed_presence_ids, get_presence
+
+logger = logging.getLogger(__name__)
+
+# 인증 실패/토큰 폐기/토큰 만료 시 WebSocket 종료 코드
+CLOSE_UNAUTHORIZED = 4401
+
+
+def _presence_call(method, *args):
+    # Redis 호출이 이벤트 루프를 막지 않도록 스레드에서 실행
+    return sync_to_async(getattr(get_presence(), method), thread_sensitive=False)(*args)
+
+
+class PresenceSweeper:
+    """
+    하트비트가 끊긴 사용자의 접속 종료를 알리는 작업 (이벤트 루프마다 하나)
+    프로세스가 비정상 종료되는 등 disconnect()가 호출되지 않은 연결은 presence TTL이 지나면 여기서 알립니다.
+    알림을 받을 연결이 있는 동안만 HEARTBEAT_INTERVAL마다 실행하며, 여러 프로세스가 실행해도
+    사용자마다 한 번만 알립니다. (백엔드의 sweep())
+    """
+
+    def __init__(self):
+        self.consumers = 0
+        self.task = None
+
+    def start(self):
+        self.consumers += 1
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    def stop(self):
+        self.consumers -= 1
+        if self.consumers == 0 and self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(settings.PRESENCE['HEARTBEAT_INTERVAL'])
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception('만료된 접속 상태 정리 실패')
+
+    async def sweep(self):
+        for user_id in await _presence_call('sweep'):
+            await abroadcast_presence(user_id, False)
+
+
+_sweepers = weakref.WeakKeyDictionary()
+
+
+def get_presence_sweeper():
+    loop = asyncio.get_running_loop()
+    if loop not in _sweepers:
+        _sweepers[loop] = PresenceSweeper()
+    return _sweepers[loop]
+
+
+class NotificationConsumer(AsyncJsonWebsocketConsumer):
+    """
+    사용자별 알림 및 접속 상태 WebSocket
+    JWTAuthMiddleware가 LoginView에서 발급한 access 토큰으로 인증한 사용자만 연결할 수 있으며,
+    토큰이 만료되면 연결을 닫습니다. (클라이언트는 새 토큰으로 다시 연결)
+    다른 사용자의 접속 상태는 PRESENCE['POLICY']가 허용한 사용자만 구독할 수 있습니다.
+
+    클라이언트 메시지:
+        {"type": "heartbeat"}                              접속 상태 유지 (PRESENCE['HEARTBEAT_INTERVAL']마다)
+        {"type": "presence.subscribe", "user_ids": [...]}  다른 사용자 접속 상태 구독
+        {"type": "presence.unsubscribe", "user_ids": [...]}
+    서버 메시지:
+        {"type": "connected", "heartbeat_interval": 20}
+        {"type": "notification", "data": {...}}
+        {"type": "presence", "user_id": 1, "online": true}
+        {"type": "heartbeat"}
+        {"type": "error", "detail": "..."}
+        {"type": "error", "detail": "...", "user_ids": [...]}  구독이 허용되지 않은 사용자
+    """
+
+    user_id = None
+    expiry_task = None
+
+    async def connect(self):
+        user = self.scope.get('user')
+        if user is None or not user.is_authenticated:
+            await self.close(code=CLOSE_UNAUTHORIZED)
+            return
+
+        self.user = user
+        self.user_id = user.pk
+        self.subscriptions = set()
+        get_presence_sweeper().start()
+        await self.channel_layer.group_add(user_group(self.user_id), self.channel_name)
+        # Sec-WebSocket-Protocol로 토큰을 보낸 경우 브라우저가 연결을 끊지 않도록 인증 서브프로토콜을 응답
+        await self.accept(subprotocol=self.scope.get('auth_subprotocol'))
+        expires_at = self.scope.get('token_expires_at')
+        if expires_at is not None:
+            self.expiry_task = asyncio.create_task(self.close_at(expires_at))
+        await self.send_json({'type': 'connected', 'heartbeat_interval': settings.PRESENCE['HEARTBEAT_INTERVAL']})
+
+        if await _presence_call('touch', self.user_id, self.channel_name):
+            await abroadcast_presence(self.user_id, True)
+
+    async def disconnect(self, code):
+        if self.user_id is None:
+            return
+        if self.expiry_task is not None:
+            self.expiry_task.cancel()
+        get_presence_sweeper().stop()
+        await self.channel_layer.group_discard(user_group(self.user_id), self.channel_name)
+        for user_id in self.subscriptions:
+            await self.channel_layer.group_discard(presence_group(user_id), self.channel_name)
+        if await _presence_call('remove', self.user_id, self.channel_name):
+            await abroadcast_presence(self.user_id, False)
+
+    async def receive_json(self, content, **kwargs):
+        message_type = content.get('type') if isinstance(content, dict) else None
+
+        if message_type == 'heartbeat':
+            if await _presence_call('touch', self.user_id, self.channel_name):
+                await abroadcast_presence(self.user_id, True)
+            await self.send_json({'type': 'heartbeat'})
+
+        elif message_type in ('presence.subscribe', 'presence.unsubscribe'):
+            user_ids = content.get('user_ids')
+            if not isinstance(user_ids, list) or not all(isinstance(user_id, int) for user_id in user_ids):
+                await self.send_json({'type': 'error', 'detail': 'user_ids는 정수 목록이어야 합니다.'})
+                return
+            if message_type == 'presence.subscribe':
+                await self.subscribe(user_ids)
+            else:
+                await self.unsubscribe(user_ids)
+
+        else:
+            await self.send_json({'type': 'error', 'detail': '지원하지 않는 메시지입니다.'})
+
+    async def subscribe(self, user_ids):
+        limit = settings.PRESENCE['MAX_SUBSCRIPTIONS']
+        new_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id not in self.subscriptions]
+        if len(self.subscriptions) + len(new_ids) > limit:
+            await self.send_json({'type': 'error', 'detail': f'접속 상태는 최대 {limit}명까지 구독할 수 있습니다.'})
+            return
+        # 그룹에 추가하기 전에 구독 권한 확인 (허용되지 않은 사용자는 현재 상태도 보내지 않음)
+        allowed = await sync_to_async(allowed_presence_ids)(self.user, new_ids) if new_ids else set()
+        denied = [user_id for user_id in new_ids if user_id not in allowed]
+        if denied:
+            await self.send_json({
+                'type': 'error', 'detail': '접속 상태를 구독할 수 없는 사용자입니다.', 'user_ids': denied,
+            })
+        new_ids = [user_id for user_id in new_ids if user_id in allowed]
+        for user_id in new_ids:
+            await self.channel_layer.group_add(presence_group(user_id), self.channel_name)
+        self.subscriptions.update(new_ids)
+
+        # 현재 상태를 먼저 보내고 이후 변경 사항은 presence.update로 전달
+        requested = [user_id for user_id in dict.fromkeys(user_ids) if user_id in self.subscriptions]
+        if not requested:
+            return
+        statuses = await _presence_call('online', requested)
+        for user_id, online in statuses.items():
+            await self.send_json({'type': 'presence', 'user_id': user_id, 'online': online})
+
+    async def unsubscribe(self, user_ids):
+        for user_id in set(user_ids) & self.subscriptions:
+            await self.channel_layer.group_discard(presence_group(user_id), self.channel_name)
+            self.subscriptions.discard(user_id)
+
+    async def close_at(self, timestamp):
+        await asyncio.sleep(max(0, timestamp - time.time()))
+        await self.close(code=CLOSE_UNAUTHORIZED)
+
+    # 채널 레이어 이벤트 핸들러
+
+    async def notification(self, event):
+        await self.send_json({'type': 'notification', 'data': event['data']})
+
+    async def presence_update(self, event):
+        await self.send_json({'type': 'presence', 'user_id': event['user_id'], 'online': event['online']})
+
+    async def session_revoke(self, event):
+        await self.close(code=CLOSE_UNAUTHORIZED)
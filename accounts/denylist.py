@@ -0,0 +1,136 @@
+import threading
+import time
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .redis_client import get_redis
+
+
+class BaseDenylistBackend:
+    """
+    토큰 거부 목록(denylist) 백엔드 인터페이스
+    개별 토큰은 jti로, 사용자의 모든 토큰은 폐기 시각(이 시각까지 발급된 토큰 거부)으로 관리합니다.
+    폐기 직후 같은 초에 새 토큰을 발급할 수 있으므로 발급/폐기 시각은 epoch 마이크로초로 비교합니다.
+    """
+
+    def deny(self, jti, expires_at):
+        """
+        jti 토큰을 만료 시각(epoch 초)까지 거부
+        """
+        raise NotImplementedError
+
+    def revoke_user(self, user_id, revoked_at=None):
+        """
+        사용자에게 revoked_at(epoch 마이크로초, 기본값은 현재 시각)까지 발급된 모든 토큰을 거부
+        """
+        raise NotImplementedError
+
+    def is_denied(self, jti, user_id=None, issued_at=None):
+        raise NotImplementedError
+
+
+def now_us():
+    return time.time_ns() // 1000
+
+
+def _revocation_ttl():
+    # 사용자 폐기 정보는 가장 오래 유효한 토큰(리프레시 토큰)이 만료될 때까지만 필요
+    return int(settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds())
+
+
+class RedisDenylistBackend(BaseDenylistBackend):
+    """
+    Redis 기반 denylist
+    키마다 토큰 만료 시각에 맞춘 TTL을 설정하여 별도 정리 작업 없이 자동으로 삭제되며,
+    검사는 MGET 한 번(O(1))으로 끝납니다.
+    """
+
+    def __init__(self, prefix='accounts:denylist'):
+        self.prefix = prefix
+
+    def _jti_key(self, jti):
+        return f'{self.prefix}:jti:{jti}'
+
+    def _user_key(self, user_id):
+        return f'{self.prefix}:user:{user_id}'
+
+    def deny(self, jti, expires_at):
+        ttl = int(expires_at - time.time())
+        if ttl > 0:
+            get_redis().set(self._jti_key(jti), 1, ex=ttl)
+
+    def revoke_user(self, user_id, revoked_at=None):
+        revoked_at = int(revoked_at if revoked_at is not None else now_us())
+        get_redis().set(self._user_key(user_id), revoked_at, ex=_revocation_ttl())
+
+    def is_denied(self, jti, user_id=None, issued_at=None):
+        if user_id is None:
+            return bool(get_redis().exists(self._jti_key(jti)))
+        denied, revoked_at = get_redis().mget(self._jti_key(jti), self._user_key(user_id))
+        if denied is not None:
+            return True
+        return revoked_at is not None and issued_at is not None and issued_at <= int(revoked_at)
+
+
+class InMemoryDenylistBackend(BaseDenylistBackend):
+    """
+    프로세스 메모리 기반 denylist (테스트 및 Redis 없는 로컬 개발용)
+    """
+
+    def __init__(self):
+        self._denied = {}
+        self._revoked = {}
+        self._lock = threading.Lock()
+
+    def deny(self, jti, expires_at):
+        with self._lock:
+            self._denied[jti] = expires_at
+
+    def revoke_user(self, user_id, revoked_at=None):
+        revoked_at = int(revoked_at if revoked_at is not None else now_us())
+        with self._lock:
+            self._revoked[user_id] = (revoked_at, time.time() + _revocation_ttl())
+
+    def is_denied(self, jti, user_id=None, issued_at=None):
+        now = time.time()
+        with self._lock:
+            expires_at = self._denied.get(jti)
+            if expires_at is not None:
+                if expires_at > now:
+                    return True
+                del self._denied[jti]
+
+            revocation = self._revoked.get(user_id)
+            if revocation is not None:
+                revoked_at, expires_at = revocation
+                if expires_at <= now:
+                    del self._revoked[user_id]
+                elif issued_at is not None and issued_at <= revoked_at:
+                    return True
+        return False
+
+    def clear(self):
+        with self._lock:
+            self._denied.clear()
+            self._revoked.clear()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_denylist():
+    """
+    TOKEN_DENYLIST 설정의 백엔드 인스턴스 반환
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                options = getattr(settings, 'TOKEN_DENYLIST', {})
+                backend_class = import_string(
+                    options.get('BACKEND', 'accounts.denylist.InMemoryDenylistBackend')
+                )
+                _backend = backend_class(**options.get('OPTIONS', {}))
+    return _backend
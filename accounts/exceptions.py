@@ -0,0 +1,21 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HashingPoolUnavailable(APIException):
+    """
+    비밀번호 해싱 풀이 가득 찼을 때 발생하는 예외
+    대기열이 한도를 넘으면 지연을 무한정 늘리는 대신 즉시 503을 반환합니다.
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = '요청이 많아 잠시 후 다시 시도해주세요.'
+    default_code = 'hashing_pool_unavailable'
+
+
+class ProfileImageTooLarge(APIException):
+    """
+    업로드한 프로필 이미지가 허용 크기를 넘었을 때 발생하는 예외
+    """
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = '프로필 이미지 크기가 너무 큽니다.'
+    default_code = 'profile_image_too_large'
@@ -0,0 +1,70 @@
+import functools
+import json
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+@functools.lru_cache
+def load_calibration():
+    """
+    calibrate_hashers 명령이 생성한 해셔별 작업량 설정 읽기
+    파일이 없으면 빈 설정을 반환하며, 이 경우 Django 기본값을 사용합니다.
+    프로세스마다 한 번만 읽으므로 설정을 바꾼 뒤에는 워커를 다시 시작해야 합니다.
+    """
+    path = getattr(settings, 'PASSWORD_HASHER_CALIBRATION_PATH', None)
+    if not path:
+        return {}
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file).get('hashers', {})
+    except FileNotFoundError:
+        return {}
+
+
+@receiver(setting_changed)
+def reset_calibration(*, setting, **kwargs):
+    if setting in ('PASSWORD_HASHER_CALIBRATION_PATH', 'PASSWORD_HASHERS'):
+        load_calibration.cache_clear()
+
+
+def calibrated_value(algorithm, name, default):
+    """
+    보정 설정의 해셔 작업량 값 (설정이 없으면 default)
+    알고리즘 이름은 Django 해셔와 같으므로 기존 해시도 그대로 검증되고,
+    작업량이 바뀐 해시는 must_update()로 감지되어 로그인 성공 시 새 작업량으로 다시 해싱됩니다.
+    """
+    return load_calibration().get(algorithm, {}).get(name, default)
+
+
+class CalibratedPBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return calibrated_value(self.algorithm, 'iterations', super().iterations)
+
+
+class CalibratedScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return calibrated_value(self.algorithm, 'work_factor', super().work_factor)
+
+    @property
+    def maxmem(self):
+        # 기본 한도(32MiB)를 넘는 work_factor도 계산할 수 있도록 필요한 메모리의 2배를 허용
+        return 2 * 128 * self.block_size * (self.work_factor + self.parallelism)
+
+
+class CalibratedArgon2PasswordHasher(hashers.Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return calibrated_value(self.algorithm, 'time_cost', super().time_cost)
+
+    @property
+    def memory_cost(self):
+        return calibrated_value(self.algorithm, 'memory_cost', super().memory_cost)
+
+    @property
+    def parallelism(self):
+        return calibrated_value(self.algorithm, 'parallelism', super().parallelism)
@@ -0,0 +1,157 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from .exceptions import HashingPoolUnavailable
+from .instrumentation import timed
+
+DEFAULT_POOL_SETTINGS = {
+    'EXECUTOR': 'thread',  # 'thread' 또는 'process'
+    'MAX_WORKERS': 4,
+    'MAX_QUEUE': 32,
+}
+
+
+class PasswordHashingPool:
+    """
+    비밀번호 해싱/검증 전용 작업 풀
+    이벤트 루프를 막지 않도록 해싱을 별도의 스레드(또는 프로세스)에서 실행하며,
+    실행 중인 작업과 대기 중인 작업의 합이 한도를 넘으면 HashingPoolUnavailable을 발생시킵니다.
+    """
+
+    def __init__(self, executor='thread', max_workers=4, max_queue=32):
+        self.executor_type = executor
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        return self.max_workers + self.max_queue
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def _get_executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.executor_type == 'process':
+                        # 자식 프로세스에서도 Django 설정(PASSWORD_HASHERS 등)을 사용할 수 있도록 초기화
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers, initializer=django.setup
+                        )
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers, thread_name_prefix='password-hashing'
+                        )
+        return self._executor
+
+    def _acquire(self):
+        with self._lock:
+            if self._pending >= self.capacity:
+                raise HashingPoolUnavailable()
+            self._pending += 1
+
+    def _release(self, future=None):
+        with self._lock:
+            self._pending -= 1
+
+    def submit(self, func, *args, **kwargs):
+        """
+        작업을 풀에 제출하고 concurrent.futures.Future를 반환
+        """
+        self._acquire()
+        try:
+            future = self._get_executor().submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, func, *args, **kwargs):
+        """
+        작업을 풀에서 실행하고 결과를 기다림
+        """
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_hashing_pool():
+    """
+    PASSWORD_HASHING_POOL 설정으로 생성한 프로세스 전역 해싱 풀 반환
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                options = {**DEFAULT_POOL_SETTINGS, **getattr(settings, 'PASSWORD_HASHING_POOL', {})}
+                _pool = PasswordHashingPool(
+                    executor=options['EXECUTOR'],
+                    max_workers=options['MAX_WORKERS'],
+                    max_queue=options['MAX_QUEUE'],
+                )
+    return _pool
+
+
+async def amake_password(password):
+    """
+    해싱 풀에서 비밀번호 해시 생성
+    """
+    with timed('hash'):
+        return await get_hashing_pool().run(hashers.make_password, password)
+
+
+async def acheck_password(user, password):
+    """
+    해싱 풀에서 사용자 비밀번호 검증
+    해시 알고리즘/반복 횟수가 오래된 경우 새 해시로 교체하여 저장합니다.
+    """
+    pool = get_hashing_pool()
+    with timed('hash'):
+        is_correct, must_update = await pool.run(hashers.verify_password, password, user.password)
+    if is_correct and must_update:
+        with timed('hash'):
+            user.password = await pool.run(hashers.make_password, password)
+        await user.asave(update_fields=['password'])
+    return is_correct
+
+
+def make_password(password):
+    """
+    amake_password()의 동기 버전 (해싱 풀에서 실행하고 결과를 기다림)
+    """
+    with timed('hash'):
+        return get_hashing_pool().submit(hashers.make_password, password).result()
+
+
+def check_password(user, password):
+    """
+    acheck_password()의 동기 버전 (django.contrib.auth.aauthenticate()가 스레드에서 실행하는 인증 백엔드용)
+    """
+    pool = get_hashing_pool()
+    with timed('hash'):
+        is_correct, must_update = pool.submit(hashers.verify_password, password, user.password).result()
+    if is_correct and must_update:
+        with timed('hash'):
+            user.password = pool.submit(hashers.make_password, password).result()
+        user.save(update_fields=['password'])
+    return is_correct
@@ -0,0 +1,175 @@
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import magic
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+from .exceptions import ProfileImageTooLarge
+
+logger = logging.getLogger(__name__)
+
+# 렌디션을 저장하는 하위 디렉터리 이름
+RENDITIONS_DIRNAME = 'renditions'
+
+# 허용하는 이미지 형식 (파일 앞부분의 매직 바이트로 판별)
+ALLOWED_IMAGE_TYPES = ('image/jpeg', 'image/png', 'image/webp', 'image/gif')
+
+# 렌디션 형식별 확장자와 Pillow 저장 옵션
+RENDITION_FORMATS = {
+    'webp': ('webp', {'format': 'WEBP', 'quality': 80, 'method': 4}),
+    'jpeg': ('jpg', {'format': 'JPEG', 'quality': 85, 'optimize': True, 'progressive': True}),
+}
+
+
+def get_max_upload_size():
+    return getattr(settings, 'PROFILE_IMAGE_MAX_UPLOAD_SIZE', 5 * 1024 * 1024)
+
+
+def get_rendition_sizes():
+    return tuple(getattr(settings, 'PROFILE_IMAGE_RENDITION_SIZES', (64, 256, 1024)))
+
+
+def get_rendition_formats():
+    return tuple(getattr(settings, 'PROFILE_IMAGE_RENDITION_FORMATS', ('webp', 'jpeg')))
+
+
+class ProfileImageUploadHandler(TemporaryFileUploadHandler):
+    """
+    프로필 이미지 업로드 핸들러
+    업로드를 메모리에 모으지 않고 임시 파일로 바로 스트리밍하며,
+    크기 제한을 넘는 즉시 중단하고 첫 청크의 매직 바이트로 이미지 형식을 확인합니다.
+    """
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # 요청 전체 크기가 이미 제한을 크게 넘으면 본문을 읽기 전에 거절
+        if content_length and content_length > get_max_upload_size() + 64 * 1024:
+            raise ProfileImageTooLarge()
+
+    def receive_data_chunk(self, raw_data, start):
+        if start == 0:
+            content_type = magic.from_buffer(raw_data[:2048], mime=True)
+            if content_type not in ALLOWED_IMAGE_TYPES:
+                raise serializers.ValidationError({
+                    'profile_image': ['지원하지 않는 이미지 형식입니다.']
+                })
+            self.content_type = content_type
+
+        if start + len(raw_data) > get_max_upload_size():
+            raise ProfileImageTooLarge()
+
+        return super().receive_data_chunk(raw_data, start)
+
+
+def rendition_name(name, size, fmt):
+    """
+    원본 파일 이름으로부터 렌디션 파일 이름 생성
+    예) profile_images/a.png -> profile_images/renditions/a_256.webp
+    """
+    directory, filename = os.path.split(name)
+    stem = os.path.splitext(filename)[0]
+    extension = RENDITION_FORMATS[fmt][0]
+    return os.path.join(directory, RENDITIONS_DIRNAME, f'{stem}_{size}.{extension}')
+
+
+def rendition_urls(image_field, request=None):
+    """
+    프로필 이미지의 렌디션 URL 목록 ({크기: {형식: URL}})
+    렌디션은 백그라운드에서 생성되므로 업로드 직후에는 아직 존재하지 않을 수 있습니다.
+    """
+    if not image_field:
+        return None
+    storage = image_field.storage
+
+    def build_url(name):
+        url = storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+
+    return {
+        str(size): {
+            fmt: build_url(rendition_name(image_field.name, size, fmt))
+            for fmt in get_rendition_formats()
+        }
+        for size in get_rendition_sizes()
+    }
+
+
+def generate_renditions(name, storage):
+    """
+    원본 이미지로부터 크기/형식별 렌디션 생성
+    큰 크기부터 만들고, 이전 결과를 다시 줄여서 다음 크기를 만듭니다.
+    원본 이름이 내용 해시이므로 같은 이미지를 다시 올린 경우처럼 렌디션이 모두 있으면 건너뜁니다.
+    """
+    targets = [
+        rendition_name(name, size, fmt) for size in get_rendition_sizes() for fmt in get_rendition_formats()
+    ]
+    if all(storage.exists(target) for target in targets):
+        return
+
+    with storage.open(name, 'rb') as source:
+        image = Image.open(source)
+        largest = max(get_rendition_sizes())
+        # JPEG는 디코딩 단계에서 축소하여 메모리와 시간을 줄임
+        image.draft('RGB', (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+
+        for size in sorted(get_rendition_sizes(), reverse=True):
+            image.thumbnail((size, size), Image.LANCZOS)
+            for fmt in get_rendition_formats():
+                output = _flatten(image) if fmt == 'jpeg' else image
+                buffer = io.BytesIO()
+                output.save(buffer, **RENDITION_FORMATS[fmt][1])
+                target = rendition_name(name, size, fmt)
+                if storage.exists(target):
+                    storage.delete(target)
+                storage.save(target, ContentFile(buffer.getvalue()))
+
+
+def _flatten(image):
+    """
+    JPEG 저장을 위해 투명 배경을 흰색으로 합성
+    """
+    if image.mode == 'RGB':
+        return image
+    background = Image.new('RGB', image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel('A'))
+    return background
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'PROFILE_IMAGE_RENDITION_WORKERS', 2),
+                    thread_name_prefix='profile-image-renditions',
+                )
+    return _executor
+
+
+def _generate_renditions_safely(name, storage):
+    try:
+        generate_renditions(name, storage)
+    except Exception:
+        logger.exception('프로필 이미지 렌디션 생성 실패: %s', name)
+
+
+def schedule_renditions(image_field):
+    """
+    렌디션 생성을 백그라운드 작업 풀에 등록
+    """
+    if not image_field:
+        return None
+    return _get_executor().submit(_generate_renditions_safely, image_field.name, image_field.storage)
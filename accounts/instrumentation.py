@@ -0,0 +1,333 @@
+import bisect
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed, PermissionDenied
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INSTRUMENTATION_SETTINGS = {
+    'ENABLED': False,
+    'SERVER_TIMING': True,
+    'SLOW_REQUEST_THRESHOLD_MS': 500,
+    'METRICS_ALLOWED_IPS': ['127.0.0.1', '::1'],
+    'BUCKETS': (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+}
+
+# Server-Timing 헤더와 지표에 기록하는 구간
+PHASES = ('sql', 'hash', 'validate', 'serialize', 'jwt')
+
+_current = contextvars.ContextVar('request_timings', default=None)
+
+
+def get_instrumentation_settings():
+    return {**DEFAULT_INSTRUMENTATION_SETTINGS, **getattr(settings, 'INSTRUMENTATION', {})}
+
+
+class RequestTimings:
+    """
+    요청 하나의 구간별 누적 시간(초)과 호출 횟수
+    sync_to_async로 실행되는 코드에도 contextvar가 복사되므로 같은 객체에 기록됩니다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    def add(self, phase, seconds):
+        with self._lock:
+            total, count = self.phases.get(phase, (0.0, 0))
+            self.phases[phase] = (total + seconds, count + 1)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+@contextmanager
+def timed(phase):
+    """
+    현재 요청의 구간 시간 측정
+    계측 중인 요청이 아니면 시간을 재지 않습니다.
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - started)
+
+
+def _sql_wrapper(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add('sql', time.perf_counter() - started)
+
+
+def _install_sql_wrapper(sender=None, connection=None, **kwargs):
+    if _sql_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_sql_wrapper)
+
+
+class TimedSerializerMixin:
+    """
+    Serializer의 유효성 검사(is_valid)와 직렬화(data) 시간을 기록하는 Mixin
+    """
+
+    def is_valid(self, *args, **kwargs):
+        with timed('validate'):
+            return super().is_valid(*args, **kwargs)
+
+    @property
+    def data(self):
+        with timed('serialize'):
+            return super().data
+
+
+class Histogram:
+    """
+    Prometheus 형식 히스토그램 (레이블별 누적 버킷, 합계, 개수)
+    """
+
+    def __init__(self, name, documentation, label_names, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+        for labels, (counts, total, count) in sorted(series.items()):
+            label_text = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label_text},le="{le}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {total}')
+            lines.append(f'{self.name}_count{{{label_text}}} {count}')
+        return '\n'.join(lines)
+
+
+class Counter:
+    """
+    Prometheus 형식 카운터 (레이블별 누적 값)
+    """
+
+    def __init__(self, name, documentation, label_names=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            label_text = ','.join(f'{name}="{_escape(label)}"' for name, label in zip(self.label_names, labels))
+            lines.append(f'{self.name}{{{label_text}}} {value}' if label_text else f'{self.name} {value}')
+        return '\n'.join(lines)
+
+
+class CallbackGauge:
+    """
+    조회 시점에 함수를 호출해서 값을 읽는 게이지 (큐 길이 등)
+    """
+
+    def __init__(self, name, documentation, func):
+        self.name = name
+        self.documentation = documentation
+        self.func = func
+
+    def render(self):
+        return '\n'.join([
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} gauge',
+            f'{self.name} {self.func()}',
+        ])
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    """
+    요청 지표 저장소 (프로세스 단위로 집계)
+    """
+
+    def __init__(self, buckets):
+        self.request_duration = Histogram(
+            'replay_request_duration_seconds', '요청 처리 시간', ('view', 'method', 'status'), buckets
+        )
+        self.phase_duration = Histogram(
+            'replay_request_phase_seconds', '요청 안의 구간별 처리 시간', ('view', 'phase'), buckets
+        )
+        self.sql_queries = Histogram(
+            'replay_request_sql_queries', '요청당 SQL 쿼리 수', ('view',), (0, 1, 2, 5, 10, 20, 50, 100)
+        )
+        # 다른 모듈에서 추가하는 지표 (render()를 가진 객체)
+        self.collectors = []
+
+    def record(self, view, method, status, timings):
+        self.request_duration.observe(timings.elapsed, view, method, str(status))
+        for phase, (seconds, count) in timings.phases.items():
+            self.phase_duration.observe(seconds, view, phase)
+        self.sql_queries.observe(timings.phases.get('sql', (0.0, 0))[1], view)
+
+    def register(self, collector):
+        self.collectors.append(collector)
+        return collector
+
+    def render(self):
+        return '\n'.join(
+            collector.render()
+            for collector in (self.request_duration, self.phase_duration, self.sql_queries, *self.collectors)
+        ) + '\n'
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry():
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry(get_instrumentation_settings()['BUCKETS'])
+    return _registry
+
+
+def server_timing_header(timings, elapsed):
+    entries = []
+    for phase in PHASES:
+        if phase in timings.phases:
+            seconds, count = timings.phases[phase]
+            entries.append(f'{phase};dur={seconds * 1000:.2f};desc="{count}"')
+    entries.append(f'total;dur={elapsed * 1000:.2f}')
+    return ', '.join(entries)
+
+
+class InstrumentationMiddleware:
+    """
+    요청별 SQL/해싱/Serializer/JWT 처리 시간을 측정하는 Middleware
+    Server-Timing 헤더로 내보내고, /metrics 히스토그램에 집계하며, 느린 요청을 로그로 남깁니다.
+    INSTRUMENTATION['ENABLED']가 False이면 Middleware 체인에서 제외됩니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        options = get_instrumentation_settings()
+        if not options['ENABLED']:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.server_timing = options['SERVER_TIMING']
+        self.slow_threshold = options['SLOW_REQUEST_THRESHOLD_MS'] / 1000
+        self.registry = get_metrics_registry()
+
+        connection_created.connect(_install_sql_wrapper, dispatch_uid='accounts.instrumentation')
+        for connection in connections.all(initialized_only=True):
+            _install_sql_wrapper(connection=connection)
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = RequestTimings()
+        token = _current.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        timings = RequestTimings()
+        token = _current.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timings)
+
+    def finish(self, request, response, timings):
+        elapsed = timings.elapsed
+        match = request.resolver_match
+        view = match.view_name if match else 'unmatched'
+        self.registry.record(view, request.method, response.status_code, timings)
+
+        if self.server_timing:
+            response['Server-Timing'] = server_timing_header(timings, elapsed)
+
+        if self.slow_threshold and elapsed >= self.slow_threshold:
+            logger.warning(
+                '느린 요청 %s %s %.1fms (%s)',
+                request.method,
+                request.path,
+                elapsed * 1000,
+                ', '.join(
+                    f'{phase}={seconds * 1000:.1f}ms/{count}'
+                    for phase, (seconds, count) in sorted(timings.phases.items())
+                ),
+            )
+        return response
+
+
+def metrics_view(request):
+    """
+    Prometheus 텍스트 형식 지표
+    """
+    options = get_instrumentation_settings()
+    allowed_ips = options['METRICS_ALLOWED_IPS']
+    if allowed_ips and request.META.get('REMOTE_ADDR') not in allowed_ips:
+        raise PermissionDenied()
+    return HttpResponse(
+        get_metrics_registry().render(), content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
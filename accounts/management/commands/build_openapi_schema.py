@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from RePlay.schema import write_schema
+
+
+class Command(BaseCommand):
+    help = 'OpenAPI 스키마를 미리 생성하여 파일로 저장합니다. (배포 시 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', help='저장 경로 (기본값: OPENAPI_SCHEMA_PATH)')
+
+    def handle(self, *args, **options):
+        path = options['output'] or settings.OPENAPI_SCHEMA_PATH
+        content = write_schema(path)
+        self.stdout.write(self.style.SUCCESS(f'OpenAPI 스키마 생성 완료: {path} ({len(content)} bytes)'))
@@ -0,0 +1,98 @@
+import gzip
+import hashlib
+import sys
+import time
+from contextlib import contextmanager
+from itertools import chain
+
+from django.conf import settings
+from django.contrib.auth.password_validation import CommonPasswordValidator
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.bloom import BloomFilter, password_digest
+
+
+class Command(BaseCommand):
+    help = (
+        '유출 비밀번호 목록으로 BreachedPasswordValidator가 사용하는 Bloom 필터 파일을 생성합니다. '
+        '(SHA-1 형식은 "HASH" 또는 "HASH:count" 행, plain 형식은 한 행에 비밀번호 하나)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('sources', nargs='*', help='입력 파일 경로 (.gz 가능, - 이면 표준 입력)')
+        parser.add_argument('--format', choices=('sha1', 'plain'), default='sha1', help='입력 형식')
+        parser.add_argument('--capacity', type=int, help='예상 항목 수 (기본값: 입력 행 수를 먼저 셈)')
+        parser.add_argument(
+            '--false-positive-rate', type=float,
+            help='목표 오탐률 (기본값: BREACHED_PASSWORD_FILTER의 FALSE_POSITIVE_RATE)',
+        )
+        parser.add_argument('--include-common', action='store_true', help='Django 기본 흔한 비밀번호 목록 포함')
+        parser.add_argument('--output', help='저장 경로 (기본값: BREACHED_PASSWORD_FILTER의 PATH)')
+
+    def handle(self, *args, **options):
+        sources = options['sources']
+        if not sources and not options['include_common']:
+            raise CommandError('입력 파일을 지정하거나 --include-common을 사용하세요.')
+
+        common = CommonPasswordValidator().passwords if options['include_common'] else ()
+        capacity = options['capacity']
+        if capacity is None:
+            if '-' in sources:
+                raise CommandError('표준 입력을 사용할 때는 --capacity를 지정해야 합니다.')
+            capacity = len(common) + sum(self._count_lines(source) for source in sources)
+
+        rate = options['false_positive_rate'] or settings.BREACHED_PASSWORD_FILTER['FALSE_POSITIVE_RATE']
+        output = options['output'] or settings.BREACHED_PASSWORD_FILTER['PATH']
+        self.skipped = 0
+        started = time.perf_counter()
+
+        digests = chain(
+            (password_digest(password) for password in common),
+            chain.from_iterable(self._read_digests(source, options['format']) for source in sources),
+        )
+        try:
+            bloom = BloomFilter.build(output, digests, capacity, rate)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Bloom 필터 생성 완료: {output} '
+            f'(항목 {bloom.count}개, {bloom.num_bits // 8} bytes, 해시 {bloom.num_hashes}개, '
+            f'예상 오탐률 {bloom.false_positive_rate:.2e}, 건너뛴 행 {self.skipped}개, '
+            f'{time.perf_counter() - started:.1f}초)'
+        ))
+        if bloom.count > capacity:
+            self.stderr.write(f'항목 수가 --capacity({capacity})를 넘어서 오탐률이 목표보다 높습니다.')
+
+    @contextmanager
+    def _open(self, source):
+        if source == '-':
+            yield sys.stdin.buffer
+        elif source.endswith('.gz'):
+            with gzip.open(source, 'rb') as stream:
+                yield stream
+        else:
+            with open(source, 'rb') as stream:
+                yield stream
+
+    def _count_lines(self, source):
+        with self._open(source) as stream:
+            return sum(1 for _ in stream)
+
+    def _read_digests(self, source, input_format):
+        with self._open(source) as stream:
+            for line in stream:
+                line = line.rstrip(b'\r\n')
+                if input_format == 'plain':
+                    # 원본 바이트 그대로 해싱 (UTF-8 비밀번호는 password_digest와 같은 값)
+                    if line:
+                        yield hashlib.sha1(line).digest()
+                    continue
+                try:
+                    digest = bytes.fromhex(line.split(b':', 1)[0].decode('ascii'))
+                except (UnicodeDecodeError, ValueError):
+                    digest = b''
+                if len(digest) != 20:
+                    self.skipped += 1
+                    continue
+                yield digest
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.management.base import BaseCommand, CommandError
+
+PASSWORD = 'calibration-password'
+SALT = 'calibrationsalt0'
+
+
+def measure(func, samples):
+    """
+    함수 실행 시간의 중앙값(초)
+    """
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+class Command(BaseCommand):
+    help = (
+        '이 서버에서 해셔별 작업량을 측정하여 해시 1회가 목표 시간에 가깝도록 하는 설정 파일을 생성합니다. '
+        '(accounts.hashers의 Calibrated*PasswordHasher가 사용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target-ms', type=float, default=250, help='해시 1회 목표 시간 (밀리초)')
+        parser.add_argument(
+            '--hashers', nargs='+', choices=('pbkdf2_sha256', 'scrypt', 'argon2'),
+            default=('pbkdf2_sha256', 'scrypt', 'argon2'), help='보정할 해셔',
+        )
+        parser.add_argument('--samples', type=int, default=3, help='측정 반복 횟수')
+        parser.add_argument(
+            '--allow-below-default', action='store_true',
+            help='Django 기본값보다 낮은 작업량 허용 (기본값: Django 기본값을 하한으로 사용)',
+        )
+        parser.add_argument('--output', help='저장 경로 (기본값: PASSWORD_HASHER_CALIBRATION_PATH)')
+
+    def handle(self, *args, **options):
+        output = options['output'] or settings.PASSWORD_HASHER_CALIBRATION_PATH
+        if not output:
+            raise CommandError('--output 또는 PASSWORD_HASHER_CALIBRATION_PATH를 지정하세요.')
+
+        self.target = options['target_ms'] / 1000
+        self.samples = options['samples']
+        self.allow_below_default = options['allow_below_default']
+
+        results = {}
+        for algorithm in options['hashers']:
+            calibrate = getattr(self, f'calibrate_{algorithm}')
+            params = calibrate()
+            if params is None:
+                continue
+            results[algorithm] = params
+            self.stdout.write(f"{algorithm}: {params} ({params['measured_ms']:.1f}ms)")
+
+        config = {
+            'target_ms': options['target_ms'],
+            'calibrated_at': datetime.now(timezone.utc).isoformat(),
+            'host': platform.node(),
+            'cpu_count': os.cpu_count(),
+            'hashers': results,
+        }
+        directory = os.path.dirname(os.path.abspath(output))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.hashers-', suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(config, file, indent=2)
+        os.replace(temp_path, output)
+        self.stdout.write(self.style.SUCCESS(f'해셔 보정 설정 저장 완료: {output}'))
+
+    def _floor(self, value, default, algorithm, name):
+        if value < default and not self.allow_below_default:
+            self.stderr.write(
+                f'{algorithm}: 목표 시간에 맞춘 {name}({value})가 Django 기본값보다 낮아 기본값({default})을 사용합니다.'
+            )
+            return default
+        return value
+
+    def calibrate_pbkdf2_sha256(self):
+        hasher = hashers.PBKDF2PasswordHasher()
+        default = hashers.PBKDF2PasswordHasher.iterations
+
+        # 반복 횟수에 비례하므로 기준 측정값으로 목표 반복 횟수를 추정
+        base = 100_000
+        elapsed = measure(lambda: hasher.encode(PASSWORD, SALT, base), self.samples)
+        iterations = max(1000, int(round(base * self.target / elapsed, -3)))
+        iterations = self._floor(iterations, default, hasher.algorithm, 'iterations')
+
+        measured = measure(lambda: hasher.encode(PASSWORD, SALT, iterations), self.samples)
+        return {'iterations': iterations, 'measured_ms': measured * 1000}
+
+    def calibrate_scrypt(self):
+        hasher = hashers.ScryptPasswordHasher()
+        default = hashers.ScryptPasswordHasher.work_factor
+        block_size, parallelism = hasher.block_size, hasher.parallelism
+
+        def run(work_factor):
+            hashlib.scrypt(
+                PASSWORD.encode(), salt=SALT.encode(), n=work_factor, r=block_size, p=parallelism,
+                maxmem=2 * 128 * block_size * (work_factor + parallelism), dklen=64,
+            )
+
+        # work_factor는 2의 거듭제곱이어야 하므로 목표 시간을 넘지 않는 가장 큰 값을 선택
+        work_factor = 2 ** 10
+        measured = measure(lambda: run(work_factor), self.samples)
+        while True:
+            candidate = work_factor * 2
+            elapsed = measure(lambda: run(candidate), self.samples)
+            if elapsed > self.target:
+                break
+            work_factor, measured = candidate, elapsed
+
+        floored = self._floor(work_factor, default, hasher.algorithm, 'work_factor')
+        if floored != work_factor:
+            work_factor, measured = floored, measure(lambda: run(floored), self.samples)
+        return {'work_factor': work_factor, 'measured_ms': measured * 1000}
+
+    def calibrate_argon2(self):
+        try:
+            import argon2
+        except ImportError:
+            self.stderr.write('argon2: argon2-cffi가 설치되어 있지 않아 건너뜁니다.')
+            return None
+
+        hasher = hashers.Argon2PasswordHasher
+        memory_cost, parallelism = hasher.memory_cost, hasher.parallelism
+
+        def run(time_cost):
+            argon2.PasswordHasher(
+                time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism,
+            ).hash(PASSWORD)
+
+        # 메모리 사용량은 기본값으로 고정하고 time_cost만 조정 (시간은 time_cost에 거의 비례)
+        elapsed = measure(lambda: run(1), self.samples)
+        time_cost = max(1, round(self.target / elapsed))
+        time_cost = self._floor(time_cost, hasher.time_cost, hasher.algorithm, 'time_cost')
+
+        measured = measure(lambda: run(time_cost), self.samples)
+        return {
+            'time_cost': time_cost,
+            'memory_cost': memory_cost,
+            'parallelism': parallelism,
+            'measured_ms': measured * 1000,
+        }
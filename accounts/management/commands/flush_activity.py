@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from accounts.activity import get_activity_flusher
+
+
+class Command(BaseCommand):
+    help = (
+        '버퍼에 쌓인 로그인/마지막 활동 시각을 DB에 저장합니다. '
+        '(Redis 버퍼 사용 시 웹 프로세스가 모두 종료된 상태에서 남은 기록 저장용)'
+    )
+
+    def handle(self, *args, **options):
+        count = get_activity_flusher().flush()
+        self.stdout.write(self.style.SUCCESS(f'사용자 {count}명의 활동 시각 저장 완료'))
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.images import get_rendition_formats, get_rendition_sizes, rendition_name
+from accounts.storage import get_profile_image_storage
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        '어떤 사용자도 참조하지 않는 프로필 이미지와 렌디션, 남은 임시 업로드 파일을 삭제합니다. '
+        '(업로드 직후 DB 저장 전 파일을 지우지 않도록 --grace-hours보다 오래된 파일만 대상)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-hours', type=float, default=24, help='이보다 최근에 만든 파일은 유지')
+        parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상만 출력')
+
+    def handle(self, *args, **options):
+        storage = get_profile_image_storage()
+        directory = User._meta.get_field('profile_image').upload_to.rstrip('/')
+        cutoff = timezone.now() - timedelta(hours=options['grace_hours'])
+
+        referenced = set()
+        images = User.objects.exclude(profile_image='').exclude(profile_image__isnull=True)
+        for name in images.values_list('profile_image', flat=True).iterator(chunk_size=2000):
+            referenced.add(name)
+            referenced.update(
+                rendition_name(name, size, fmt) for size in get_rendition_sizes() for fmt in get_rendition_formats()
+            )
+
+        scanned = deleted = 0
+        for name, modified_at in storage.walk_files(directory):
+            scanned += 1
+            if name in referenced or modified_at > cutoff:
+                continue
+            deleted += 1
+            if options['dry_run']:
+                self.stdout.write(f'삭제 대상: {name}')
+            else:
+                storage.delete(name)
+
+        action = '삭제 대상' if options['dry_run'] else '삭제'
+        self.stdout.write(self.style.SUCCESS(f'파일 {scanned}개 검사, {deleted}개 {action}'))
@@ -0,0 +1,245 @@
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+import django
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+from rest_framework.utils.encoders import JSONEncoder
+
+from accounts.availability import get_availability_filter, user_items
+from accounts.models import normalize_phone_number, normalized_phone_number
+from accounts.serializers import RegisterSerializer
+
+User = get_user_model()
+
+
+class ImportUserSerializer(RegisterSerializer):
+    """
+    일괄 가입용 Serializer
+    RegisterSerializer의 필드 규칙을 그대로 사용하고, 중복 검사는 배치 단위로 한 번에 수행합니다.
+    """
+
+    def to_internal_value(self, data):
+        # 이관 데이터에는 비밀번호 확인 값이 없으므로 password로 채움
+        data = {**data}
+        data.setdefault('password2', data.get('password'))
+        return super().to_internal_value(data)
+
+
+class Command(BaseCommand):
+    help = 'CSV/NDJSON 파일에서 사용자를 일괄 생성합니다. (비밀번호 해싱은 프로세스 풀에서 병렬 수행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='입력 파일 경로 (- 이면 표준 입력)')
+        parser.add_argument('--format', choices=('csv', 'ndjson'), help='입력 형식 (기본값: 확장자로 판단)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create 배치 크기')
+        parser.add_argument('--workers', type=int, default=None, help='해싱 프로세스 수 (기본값: CPU 수)')
+        parser.add_argument('--checkpoint', help='재시작용 체크포인트 파일 경로')
+        parser.add_argument('--errors', help='행 단위 오류 리포트(CSV) 경로')
+
+    def handle(self, *args, **options):
+        input_format = options['format'] or ('ndjson' if options['path'].endswith(('.ndjson', '.jsonl')) else 'csv')
+        checkpoint_path = Path(options['checkpoint']) if options['checkpoint'] else None
+        resume_from = self._read_checkpoint(checkpoint_path)
+
+        self.workers = options['workers'] or os.cpu_count() or 1
+        stats = {'read': 0, 'skipped': 0, 'created': 0, 'failed': 0, 'hash_seconds': 0.0}
+        started = time.perf_counter()
+
+        error_file = open(options['errors'], 'a', newline='', encoding='utf-8') if options['errors'] else None
+        error_writer = csv.writer(error_file) if error_file else None
+        if error_file and error_file.tell() == 0:
+            error_writer.writerow(('line', 'username', 'errors'))
+
+        try:
+            with self._open_input(options['path']) as stream, \
+                    ProcessPoolExecutor(max_workers=self.workers, initializer=django.setup) as executor:
+                rows = self._read_rows(stream, input_format)
+                while True:
+                    batch = list(islice(rows, options['batch_size']))
+                    if not batch:
+                        break
+                    stats['read'] += len(batch)
+                    last_line = batch[-1][0]
+
+                    pending = [(line, row) for line, row in batch if line > resume_from]
+                    stats['skipped'] += len(batch) - len(pending)
+                    if pending:
+                        created, errors, hash_seconds = self._import_batch(pending, executor)
+                        stats['created'] += created
+                        stats['failed'] += len(errors)
+                        stats['hash_seconds'] += hash_seconds
+                        if error_writer:
+                            for line, username, detail in sorted(errors, key=lambda error: error[0]):
+                                error_writer.writerow((line, username, json.dumps(detail, cls=JSONEncoder, ensure_ascii=False)))
+                            error_file.flush()
+
+                    self._write_checkpoint(checkpoint_path, last_line)
+        finally:
+            if error_file:
+                error_file.close()
+
+        elapsed = time.perf_counter() - started
+        processed = stats['created'] + stats['failed']
+        self.stdout.write(self.style.SUCCESS(
+            f"읽은 행 {stats['read']} / 생성 {stats['created']} / 실패 {stats['failed']} / "
+            f"건너뜀 {stats['skipped']} (체크포인트)"
+        ))
+        self.stdout.write(
+            f"소요 시간 {elapsed:.2f}s, 처리량 {processed / elapsed if elapsed else 0:.1f} rows/s, "
+            f"해싱 {stats['hash_seconds']:.2f}s"
+        )
+
+    def _import_batch(self, batch, executor):
+        """
+        배치 검증 → 병렬 해싱 → bulk_create
+        생성된 수, 오류 목록 [(행 번호, 아이디, 오류)], 해싱 소요 시간을 반환합니다.
+        """
+        errors = []
+        valid = []
+        for line, row in batch:
+            if not isinstance(row, dict):
+                errors.append((line, None, {'non_field_errors': ['올바른 JSON 객체가 아닙니다.']}))
+                continue
+            serializer = ImportUserSerializer(data=row)
+            if serializer.is_valid():
+                valid.append((line, serializer.validated_data))
+            else:
+                errors.append((line, row.get('username'), serializer.errors))
+
+        valid = self._exclude_duplicates(valid, errors)
+        if not valid:
+            return 0, errors, 0.0
+
+        hash_started = time.perf_counter()
+        chunksize = max(1, len(valid) // (self.workers * 4))
+        password_hashes = list(executor.map(make_password, (data['password'] for _, data in valid), chunksize=chunksize))
+        hash_seconds = time.perf_counter() - hash_started
+
+        rows = []
+        for (line, data), password_hash in zip(valid, password_hashes):
+            rows.append((line, User(
+                username=User.normalize_username(data['username']),
+                email=User.objects.normalize_email(data.get('email', '')),
+                user_type=data.get('user_type', 'buyer'),
+                phone_number=data.get('phone_number'),
+                password=password_hash,
+            )))
+
+        created = self._create_users(rows, errors)
+        if created:
+            # bulk_create는 post_save를 보내지 않으므로 아이디/이메일 가입 여부 필터에 직접 추가
+            get_availability_filter().add([item for user in created for item in user_items(user)])
+        return len(created), errors, hash_seconds
+
+    def _create_users(self, rows, errors):
+        """
+        배치를 한 번에 생성하고, 중복 검사 이후 다른 곳에서 같은 값으로 가입하는 등 제약 위반이 생기면
+        한 행씩 다시 시도합니다. 생성된 사용자 목록을 반환하며 실패한 행은 errors에 추가합니다.
+        """
+        users = [user for _, user in rows]
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=len(users))
+            return users
+        except IntegrityError:
+            pass
+
+        created = []
+        for line, user in rows:
+            try:
+                with transaction.atomic():
+                    User.objects.bulk_create([user])
+            except IntegrityError as exc:
+                errors.append((line, user.username, {'non_field_errors': [str(exc)]}))
+            else:
+                created.append(user)
+        return created
+
+    def _exclude_duplicates(self, valid, errors):
+        """
+        아이디/이메일/연락처 중복을 배치당 한 번씩의 쿼리로 검사 (DB에 있거나 같은 배치 안에서 중복)
+        이메일은 대소문자, 연락처는 구분 문자를 무시하며 CustomUser의 유일성 제약과 같은 규칙을 따릅니다.
+        """
+        usernames = [data['username'] for _, data in valid]
+        emails = [data['email'].lower() for _, data in valid if data.get('email')]
+        phone_numbers = [normalize_phone_number(data['phone_number']) for _, data in valid if data.get('phone_number')]
+
+        taken_usernames = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        taken_emails = set(
+            User.objects.annotate(email_ci=Lower('email'))
+            .filter(email_ci__in=emails).values_list('email_ci', flat=True)
+        ) if emails else set()
+        taken_phone_numbers = set(
+            User.objects.annotate(phone_normalized=normalized_phone_number())
+            .filter(phone_normalized__in=phone_numbers).values_list('phone_normalized', flat=True)
+        ) if phone_numbers else set()
+
+        unique = []
+        for line, data in valid:
+            email = data['email'].lower() if data.get('email') else None
+            phone_number = normalize_phone_number(data['phone_number']) if data.get('phone_number') else None
+            detail = {}
+            if data['username'] in taken_usernames:
+                detail['username'] = [User._meta.get_field('username').error_messages['unique']]
+            if email and email in taken_emails:
+                detail['email'] = ['이미 사용중인 이메일입니다.']
+            if phone_number and phone_number in taken_phone_numbers:
+                detail['phone_number'] = ['이미 사용중인 연락처입니다.']
+            if detail:
+                errors.append((line, data['username'], detail))
+                continue
+            taken_usernames.add(data['username'])
+            if email:
+                taken_emails.add(email)
+            if phone_number:
+                taken_phone_numbers.add(phone_number)
+            unique.append((line, data))
+        return unique
+
+    def _open_input(self, path):
+        if path == '-':
+            return open(sys.stdin.fileno(), encoding='utf-8', closefd=False)
+        try:
+            return open(path, encoding='utf-8', newline='')
+        except OSError as exc:
+            raise CommandError(f'입력 파일을 열 수 없습니다: {exc}')
+
+    def _read_rows(self, stream, input_format):
+        """
+        (행 번호, dict) 스트림 (헤더 제외, 1부터 시작)
+        """
+        if input_format == 'csv':
+            for line, row in enumerate(csv.DictReader(stream), start=1):
+                yield line, {key: value for key, value in row.items() if value not in (None, '')}
+            return
+
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                yield line, json.loads(text)
+            except json.JSONDecodeError:
+                yield line, None
+
+    def _read_checkpoint(self, path):
+        if path is None or not path.exists():
+            return 0
+        return json.loads(path.read_text())['line']
+
+    def _write_checkpoint(self, path, line):
+        if path is None:
+            return
+        # 임시 파일에 쓴 뒤 교체하여 중간에 종료되어도 체크포인트가 깨지지 않도록 함
+        temp_path = path.with_suffix(path.suffix + '.tmp')
+        temp_path.write_text(json.dumps({'line': line}))
+        temp_path.replace(path)
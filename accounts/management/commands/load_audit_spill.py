@@ -0,0 +1,45 @@
+import glob
+import os
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.audit import event_from_json, get_audit_log_settings
+from accounts.models import AuditEvent
+
+
+class Command(BaseCommand):
+    help = (
+        '큐가 가득 차거나 DB 저장에 실패해서 파일(AUDIT_LOG의 SPILL_PATH)에 기록된 감사 이벤트를 DB에 저장합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', help='파일 경로 (기본값: AUDIT_LOG의 SPILL_PATH)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create 단위')
+
+    def handle(self, *args, **options):
+        path = options['path'] or os.fspath(get_audit_log_settings()['SPILL_PATH'])
+        # 기록 중인 파일을 옮긴 뒤 읽으므로, 그 사이의 새 이벤트는 새 파일에 기록됨
+        # (이전 실행이 중단되어 남은 파일도 함께 처리)
+        if os.path.exists(path):
+            os.replace(path, f'{path}.loading-{os.getpid()}')
+
+        total = 0
+        for loading_path in sorted(glob.glob(f'{glob.escape(path)}.loading-*')):
+            # 파일 단위로 저장하므로 중간에 실패해도 다시 실행하면 중복 없이 저장됨
+            with transaction.atomic(), open(loading_path, encoding='utf-8') as file:
+                batch = []
+                for line in file:
+                    if not line.strip():
+                        continue
+                    batch.append(AuditEvent(**event_from_json(line)))
+                    if len(batch) >= options['batch_size']:
+                        AuditEvent.objects.bulk_create(batch)
+                        total += len(batch)
+                        batch = []
+                if batch:
+                    AuditEvent.objects.bulk_create(batch)
+                    total += len(batch)
+            os.unlink(loading_path)
+
+        self.stdout.write(self.style.SUCCESS(f'감사 이벤트 {total}개 저장 완료'))
@@ -0,0 +1,65 @@
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, get_hasher, identify_hasher
+from django.core.management.base import BaseCommand
+
+User = get_user_model()
+
+# 해시 종류를 구분할 때 사용하는 작업량 항목
+PARAM_KEYS = ('iterations', 'work_factor', 'block_size', 'parallelism', 'time_cost', 'memory_cost', 'rounds')
+
+
+class Command(BaseCommand):
+    help = '사용자 비밀번호 해시를 알고리즘/작업량별로 집계하고, 현재 설정보다 오래된 해시 수를 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 읽을 행 수')
+
+    def handle(self, *args, **options):
+        preferred = get_hasher('default')
+        groups = Counter()
+        outdated = Counter()
+        unusable = 0
+        unknown = 0
+
+        passwords = User.objects.values_list('password', flat=True).iterator(chunk_size=options['chunk_size'])
+        for encoded in passwords:
+            if not encoded or encoded.startswith(UNUSABLE_PASSWORD_PREFIX):
+                unusable += 1
+                continue
+            try:
+                hasher = identify_hasher(encoded)
+                decoded = hasher.decode(encoded)
+            except ValueError:
+                unknown += 1
+                continue
+
+            params = tuple((key, decoded[key]) for key in PARAM_KEYS if key in decoded)
+            key = (hasher.algorithm, params)
+            groups[key] += 1
+            if hasher.algorithm != preferred.algorithm or preferred.must_update(encoded):
+                outdated[key] += 1
+
+        total = sum(groups.values())
+        self.stdout.write(f'기본 해셔: {preferred.algorithm} ({self._format_params(preferred)})')
+        for (algorithm, params), count in groups.most_common():
+            status = '갱신 필요' if outdated[(algorithm, params)] else '최신'
+            summary = ', '.join(f'{name}={value}' for name, value in params)
+            self.stdout.write(f'  {algorithm} [{summary}]: {count}명 ({status})')
+        if unusable:
+            self.stdout.write(f'  사용할 수 없는 비밀번호: {unusable}명')
+        if unknown:
+            self.stdout.write(f'  알 수 없는 해시 형식: {unknown}명')
+
+        outdated_total = sum(outdated.values())
+        ratio = outdated_total / total * 100 if total else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f'전체 {total}명 중 {outdated_total}명({ratio:.1f}%)이 이전 작업량 해시를 사용 중입니다. '
+            f'(다음 로그인 시 자동으로 다시 해싱됩니다.)'
+        ))
+
+    def _format_params(self, hasher):
+        return ', '.join(
+            f'{name}={getattr(hasher, name)}' for name in PARAM_KEYS if hasattr(hasher, name)
+        )
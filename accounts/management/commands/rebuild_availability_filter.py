@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.availability import get_availability_filter
+
+
+class Command(BaseCommand):
+    help = (
+        '사용 중인 아이디/이메일로 사용 가능 여부 Bloom 필터를 다시 생성합니다. '
+        '(탈퇴/변경으로 더 이상 쓰이지 않는 값 정리, Redis 필터 초기 생성)'
+    )
+
+    def handle(self, *args, **options):
+        bloom = get_availability_filter()
+        started = time.perf_counter()
+        count = bloom.rebuild()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'항목 {count}개로 필터 생성 완료 '
+            f'(비트 {bloom.num_bits}개, 해시 함수 {bloom.num_hashes}개, {elapsed:.2f}초)'
+        ))
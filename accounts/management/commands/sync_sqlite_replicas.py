@@ -0,0 +1,38 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+SQLITE_ENGINE = 'django.db.backends.sqlite3'
+
+
+class Command(BaseCommand):
+    help = (
+        '기본 SQLite DB를 SQLite 복제본 파일로 복사합니다. '
+        '(로컬에서 DATABASE_REPLICA_URLS의 SQLite 파일을 복제본 대용으로 사용할 때, 복제 지연을 흉내 내려면 원하는 시점에 실행)'
+    )
+
+    def handle(self, *args, **options):
+        if settings.DATABASES[DEFAULT_DB_ALIAS]['ENGINE'] != SQLITE_ENGINE:
+            raise CommandError('기본 DB가 SQLite가 아닙니다. 실제 복제본은 DB 서버의 복제 기능을 사용하세요.')
+
+        aliases = [
+            alias for alias in settings.DATABASE_REPLICAS['ALIASES']
+            if settings.DATABASES[alias]['ENGINE'] == SQLITE_ENGINE
+        ]
+        if not aliases:
+            raise CommandError('SQLite 복제본이 없습니다. DATABASE_REPLICA_URLS를 설정하세요.')
+
+        source = connections[DEFAULT_DB_ALIAS]
+        source.ensure_connection()
+        for alias in aliases:
+            # 복사하는 동안 열려 있는 복제본 연결은 닫음
+            connections[alias].close()
+            target = sqlite3.connect(settings.DATABASES[alias]['NAME'])
+            try:
+                # 온라인 백업 API로 복사하므로 기본 DB를 사용 중이어도 일관된 스냅샷이 복사됨
+                source.connection.backup(target)
+            finally:
+                target.close()
+            self.stdout.write(self.style.SUCCESS(f'{alias}: {settings.DATABASES[alias]["NAME"]}'))
@@ -0,0 +1,115 @@
+# Generated by Django 5.1.3 on 2026-10-18 18:18
+
+import accounts.models
+import django.db.models.functions.text
+from django.core.management.base import CommandError
+from django.db import migrations, models
+from django.db.models import Count
+
+# 이 마이그레이션 전에는 이메일/연락처 중복을 막지 않았으므로 유일 인덱스를 만들기 전에 중복을 확인하고,
+# 중복이 있으면 어떤 계정을 남길지 정할 수 있도록 목록을 보여주고 중단합니다.
+# PostgreSQL에서는 사용자 테이블 쓰기를 막지 않도록 유일 인덱스를 CONCURRENTLY로 생성 (atomic = False)
+
+DUPLICATE_REPORT_LIMIT = 20
+
+
+def _duplicates(queryset, expression):
+    return list(
+        queryset.annotate(value=expression)
+        .values("value")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("value", flat=True)[:DUPLICATE_REPORT_LIMIT]
+    )
+
+
+def check_duplicates(apps, schema_editor):
+    User = apps.get_model("accounts", "CustomUser")
+    users = User.objects.using(schema_editor.connection.alias)
+    emails = _duplicates(users.exclude(email=""), django.db.models.functions.text.Lower("email"))
+    phone_numbers = _duplicates(
+        users.exclude(phone_number__isnull=True).exclude(phone_number=""),
+        accounts.models.NormalizedPhoneNumber("phone_number"),
+    )
+    if not emails and not phone_numbers:
+        return
+
+    lines = ["이메일(대소문자 무시) 또는 연락처(구분 문자 무시)가 중복된 사용자가 있어 유일성 제약을 추가할 수 없습니다."]
+    for label, values, lookup in (
+        ("이메일", emails, "email__iexact"),
+        ("연락처", phone_numbers, None),
+    ):
+        for value in values:
+            if lookup:
+                ids = list(users.filter(**{lookup: value}).values_list("id", flat=True))
+            else:
+                ids = list(
+                    users.annotate(value=accounts.models.NormalizedPhoneNumber("phone_number"))
+                    .filter(value=value).values_list("id", flat=True)
+                )
+            lines.append(f"  {label} {value}: 사용자 id {ids}")
+    lines.append("중복 계정을 정리(값 변경 또는 비우기)한 뒤 다시 migrate 하세요.")
+    raise CommandError("\n".join(lines))
+
+
+class AddConstraintConcurrentlyIfPostgres(migrations.AddConstraint):
+    """
+    PostgreSQL에서는 유일 제약(함수/조건부 유일 인덱스)을 CREATE UNIQUE INDEX CONCURRENTLY로 생성
+    다른 DB에서는 일반 AddConstraint와 같습니다.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        # 이전 실행이 중간에 실패해 남은 INVALID 인덱스는 지우고 다시 생성
+        name = schema_editor.quote_name(self.constraint.name)
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        sql = str(self.constraint.create_sql(model, schema_editor))
+        schema_editor.execute(sql.replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX CONCURRENTLY", 1), params=None)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.execute(
+                f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(self.constraint.name)}"
+            )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicates, migrations.RunPython.noop),
+        AddConstraintConcurrentlyIfPostgres(
+            model_name="customuser",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                condition=models.Q(("email", ""), _negated=True),
+                name="accounts_user_email_ci_uniq",
+                violation_error_message="이미 사용중인 이메일입니다.",
+            ),
+        ),
+        AddConstraintConcurrentlyIfPostgres(
+            model_name="customuser",
+            constraint=models.UniqueConstraint(
+                accounts.models.NormalizedPhoneNumber("phone_number"),
+                condition=models.Q(
+                    ("phone_number__isnull", False),
+                    models.Q(("phone_number", ""), _negated=True),
+                ),
+                name="accounts_user_phone_uniq",
+                violation_error_message="이미 사용중인 연락처입니다.",
+            ),
+        ),
+    ]
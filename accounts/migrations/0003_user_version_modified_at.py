@@ -0,0 +1,31 @@
+# Generated by Django 5.1.3 on 2026-10-18 19:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_user_email_phone_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1, editable=False, verbose_name="정보 버전"
+            ),
+        ),
+        migrations.AddField(
+            model_name="customuser",
+            name="modified_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                verbose_name="수정일시",
+            ),
+            preserve_default=False,
+        ),
+    ]
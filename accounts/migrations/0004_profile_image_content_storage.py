@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-18 18:44
+
+import accounts.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_user_version_modified_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customuser",
+            name="profile_image",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                storage=accounts.storage.get_profile_image_storage,
+                upload_to="profile_images/",
+                verbose_name="프로필 이미지",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.3 on 2026-10-18 18:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_profile_image_content_storage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="last_seen",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="마지막 활동일시"
+            ),
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.1.3 on 2026-10-18 18:53
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_user_last_seen"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="발생일시"
+                    ),
+                ),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("register", "회원가입"),
+                            ("login_success", "로그인 성공"),
+                            ("login_failure", "로그인 실패"),
+                            ("password_change", "비밀번호 변경"),
+                            ("profile_update", "회원정보 수정"),
+                        ],
+                        max_length=20,
+                        verbose_name="이벤트 유형",
+                    ),
+                ),
+                (
+                    "username",
+                    models.CharField(blank=True, max_length=150, verbose_name="아이디"),
+                ),
+                (
+                    "ip_address",
+                    models.GenericIPAddressField(
+                        blank=True, null=True, verbose_name="IP 주소"
+                    ),
+                ),
+                (
+                    "user_agent",
+                    models.CharField(
+                        blank=True, max_length=255, verbose_name="User-Agent"
+                    ),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="추가 정보"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "감사 이벤트",
+                "verbose_name_plural": "감사 이벤트들",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "timestamp"], name="accounts_audit_user_ts_idx"
+                    ),
+                    models.Index(fields=["timestamp"], name="accounts_audit_ts_idx"),
+                ],
+            },
+        ),
+    ]
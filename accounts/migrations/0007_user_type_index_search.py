@@ -0,0 +1,75 @@
+# Generated by Django 5.1.3 on 2026-10-18 19:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+# 큰 사용자 테이블에서 쓰기를 막지 않도록 PostgreSQL에서는 CREATE INDEX CONCURRENTLY로 생성
+# (트랜잭션 안에서는 실행할 수 없으므로 atomic = False)
+
+# 관리자 검색(icontains)용 trigram 인덱스 (PostgreSQL 전용, 다른 DB는 접두어 검색만 사용)
+# Django의 icontains는 UPPER("컬럼"::text) LIKE UPPER(...)로 변환되므로 같은 식으로 인덱스 생성
+TRIGRAM_INDEXES = {
+    "accounts_user_username_trgm": "username",
+    "accounts_user_email_trgm": "email",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    table = schema_editor.quote_name(
+        apps.get_model("accounts", "CustomUser")._meta.db_table
+    )
+    for name, column in TRIGRAM_INDEXES.items():
+        # 이전 실행이 중간에 실패해 남은 INVALID 인덱스는 지우고 다시 생성
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(name)}")
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY {schema_editor.quote_name(name)} "
+            f"ON {table} USING gin ((UPPER({schema_editor.quote_name(column)}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(name)}")
+
+
+class AddIndexConcurrentlyIfPostgres(AddIndexConcurrently):
+    """
+    PostgreSQL에서는 CREATE INDEX CONCURRENTLY, 다른 DB(로컬 SQLite 등)에서는 일반 CREATE INDEX
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0006_auditevent"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name="customuser",
+            index=models.Index(
+                fields=["user_type", "id"], name="accounts_user_type_id_idx"
+            ),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.3 on 2026-10-18 21:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+# 증분 내보내기(?since=)가 전체 테이블을 읽지 않도록 modified_at 인덱스 추가
+# PostgreSQL에서는 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY로 생성 (atomic = False)
+
+
+class AddIndexConcurrentlyIfPostgres(AddIndexConcurrently):
+    """
+    PostgreSQL에서는 CREATE INDEX CONCURRENTLY, 다른 DB(로컬 SQLite 등)에서는 일반 CREATE INDEX
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0007_user_type_index_search"),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgres(
+            model_name="customuser",
+            index=models.Index(fields=["modified_at"], name="accounts_user_modified_idx"),
+        ),
+    ]
@@ -0,0 +1,93 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from rest_framework import serializers
+
+from .instrumentation import timed
+
+
+class AsyncAPIViewMixin:
+    """
+    DRF APIView를 비동기 핸들러(async def get/post/...)로 실행하기 위한 Mixin
+    인증/권한/스로틀 검사(initial)는 스레드에서 실행하고, 핸들러는 이벤트 루프에서 직접 await합니다.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(),
+                                  self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class SequentialThrottleMixin:
+    """
+    스로틀을 순서대로 검사하다가 처음 거부된 곳에서 멈추는 Mixin
+    DRF 기본 동작은 모든 스로틀을 검사하므로, 이미 IP 단위로 거부된 요청도 경로 전체 한도를 소모합니다.
+    throttle_classes는 좁은 범위(IP, 아이디)부터 넓은 범위(경로) 순으로 지정합니다.
+    """
+
+    def check_throttles(self, request):
+        for throttle in self.get_throttles():
+            if not throttle.allow_request(request, self):
+                self.throttled(request, throttle.wait())
+
+
+class AsyncValidationMixin:
+    """
+    비동기 뷰에서 사용하는 Serializer Mixin
+    DB 조회가 없는 검사는 is_valid()로, DB 조회가 필요한 검사는 avalidate()에서 async ORM으로 수행하고,
+    저장은 acreate()/aupdate()로 수행합니다.
+    """
+
+    async def ais_valid(self, *, raise_exception=False):
+        if self.is_valid():
+            try:
+                with timed('validate'):
+                    self._validated_data = await self.avalidate(self._validated_data)
+            except serializers.ValidationError as exc:
+                self._validated_data = {}
+                self._errors = serializers.as_serializer_error(exc)
+
+        if self._errors and raise_exception:
+            raise serializers.ValidationError(self.errors)
+
+        return not bool(self._errors)
+
+    async def avalidate(self, attrs):
+        return attrs
+
+    async def asave(self, **kwargs):
+        validated_data = {**self.validated_data, **kwargs}
+
+        if self.instance is not None:
+            self.instance = await self.aupdate(self.instance, validated_data)
+        else:
+            self.instance = await self.acreate(validated_data)
+
+        return self.instance
+
+    async def acreate(self, validated_data):
+        raise NotImplementedError('`acreate()` must be implemented.')
+
+    async def aupdate(self, instance, validated_data):
+        raise NotImplementedError('`aupdate()` must be implemented.')
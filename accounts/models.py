@@ -1,5 +1,61 @@
+import functools
+import re
+
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
+from django.conf import settings
+from django.utils import timezone
+
+from .storage import get_profile_image_storage
+
+# 연락처 정규화 시 제거하는 구분 문자
+PHONE_NUMBER_SEPARATORS = ('-', ' ', '.')
+
+# 정규화한 연락처 형식 (국가 번호 '+' 허용)
+PHONE_NUMBER_PATTERN = re.compile(r'\+?\d{7,15}')
+
+
+def normalize_phone_number(value):
+    """
+    연락처에서 구분 문자를 제거 (normalized_phone_number()와 같은 규칙)
+    """
+    if value is None:
+        return None
+    return re.sub('[%s]' % re.escape(''.join(PHONE_NUMBER_SEPARATORS)), '', value)
+
+
+def login_identifier_kind(value):
+    """
+    로그인 식별자의 형태 ('email', 'phone_number' 또는 'username')
+    """
+    if '@' in value:
+        return 'email'
+    if PHONE_NUMBER_PATTERN.fullmatch(normalize_phone_number(value)):
+        return 'phone_number'
+    return 'username'
+
+
+class NormalizedPhoneNumber(models.Func):
+    """
+    연락처에서 구분 문자를 제거하는 DB 함수
+    구분 문자를 SQL 리터럴로 넣어서 함수 인덱스와 조회 쿼리가 같은 식이 되도록 합니다.
+    """
+    template = functools.reduce(
+        lambda sql, separator: "REPLACE(%s, '%s', '')" % (sql, separator),
+        PHONE_NUMBER_SEPARATORS,
+        '%(expressions)s',
+    )
+    output_field = models.CharField()
+
+
+def normalized_phone_number(field='phone_number'):
+    """
+    연락처 정규화 DB 표현식 (함수 인덱스와 조회에서 함께 사용)
+    """
+    return NormalizedPhoneNumber(field)
+
 
 # Create your models here.
 class CustomUser(AbstractUser):
@@ -36,8 +92,10 @@ class CustomUser(AbstractUser):
     )
     
     # 프로필 이미지
+    # 내용 해시 이름으로 저장하여 같은 이미지는 한 번만 저장
     profile_image = models.ImageField(
         upload_to='profile_images/',
+        storage=get_profile_image_storage,
         null=True,
         blank=True,
         verbose_name='프로필 이미지'
@@ -51,6 +109,164 @@ class CustomUser(AbstractUser):
         verbose_name='연락처'
     )
     
+    # 회원정보 버전 (프로필 ETag와 서버 캐시 키에 사용)
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        verbose_name='정보 버전'
+    )
+    
+    modified_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+    
+    # 마지막 활동 시각 (인증된 요청 기준, accounts/activity.py에서 일괄 저장)
+    last_seen = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='마지막 활동일시'
+    )
+    
+    # 저장해도 회원정보 버전을 올리지 않는 필드
+    UNVERSIONED_FIELDS = frozenset({'password', 'last_login', 'last_seen'})
+    
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        bump = not self._state.adding and (
+            update_fields is None or not set(update_fields) <= self.UNVERSIONED_FIELDS
+        )
+        if not bump:
+            return super().save(*args, **kwargs)
+
+        # 동시에 저장해도 증가가 누락되지 않도록 DB에서 올리고, 올린 값은 version만 다시 읽음
+        previous_version = self.version
+        self.version = F('version') + 1
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version', 'modified_at'}
+        try:
+            super().save(*args, **kwargs)
+            self.refresh_from_db(using=self._state.db, fields=['version'])
+        except BaseException:
+            # 저장에 실패하면 인스턴스에 F() 식이 남지 않도록 이전 값으로 되돌림
+            self.version = previous_version
+            raise
+    
     class Meta:
         verbose_name = '사용자'
-        verbose_name_plural = '사용자들'
\ No newline at end of file
+        verbose_name_plural = '사용자들'
+        constraints = [
+            # 이메일은 대소문자를 구분하지 않고 유일 (빈 값은 제외)
+            models.UniqueConstraint(
+                Lower('email'),
+                condition=~Q(email=''),
+                name='accounts_user_email_ci_uniq',
+                violation_error_message='이미 사용중인 이메일입니다.',
+            ),
+            # 연락처는 구분 문자를 제거한 값 기준으로 유일
+            models.UniqueConstraint(
+                normalized_phone_number(),
+                condition=Q(phone_number__isnull=False) & ~Q(phone_number=''),
+                name='accounts_user_phone_uniq',
+                violation_error_message='이미 사용중인 연락처입니다.',
+            ),
+        ]
+        indexes = [
+            # 관리자 목록의 사용자 유형 필터 + id 순 keyset 페이지
+            models.Index(fields=['user_type', 'id'], name='accounts_user_type_id_idx'),
+            # 증분 내보내기(?since=)의 modified_at 범위 조회
+            models.Index(fields=['modified_at'], name='accounts_user_modified_idx'),
+        ]
+
+
+class AuditEventQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        raise TypeError('감사 이벤트는 수정할 수 없습니다.')
+
+
+class AuditEvent(models.Model):
+    """
+    계정 보안 감사 이벤트 (추가만 가능)
+    accounts/audit.py의 백그라운드 기록기가 bulk_create로 저장합니다.
+    사용자 FK에 DB 제약을 두지 않고 시각 컬럼을 기준으로 조회하므로,
+    Postgres에서는 timestamp 기준 범위 파티션 테이블로 옮길 수 있습니다.
+    """
+
+    REGISTER = 'register'
+    LOGIN_SUCCESS = 'login_success'
+    LOGIN_FAILURE = 'login_failure'
+    PASSWORD_CHANGE = 'password_change'
+    PROFILE_UPDATE = 'profile_update'
+
+    EVENT_TYPE_CHOICES = (
+        (REGISTER, '회원가입'),
+        (LOGIN_SUCCESS, '로그인 성공'),
+        (LOGIN_FAILURE, '로그인 실패'),
+        (PASSWORD_CHANGE, '비밀번호 변경'),
+        (PROFILE_UPDATE, '회원정보 수정'),
+    )
+
+    timestamp = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='발생일시'
+    )
+    
+    event_type = models.CharField(
+        max_length=20,
+        choices=EVENT_TYPE_CHOICES,
+        verbose_name='이벤트 유형'
+    )
+    
+    # 탈퇴한 사용자의 기록도 남도록 DB 제약 없이 id만 참조
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='+',
+        verbose_name='사용자'
+    )
+    
+    # 로그인 실패 등 사용자를 알 수 없는 경우 입력한 아이디
+    username = models.CharField(
+        max_length=150,
+        blank=True,
+        verbose_name='아이디'
+    )
+    
+    ip_address = models.GenericIPAddressField(
+        null=True,
+        blank=True,
+        verbose_name='IP 주소'
+    )
+    
+    user_agent = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name='User-Agent'
+    )
+    
+    data = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='추가 정보'
+    )
+
+    objects = AuditEventQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise TypeError('감사 이벤트는 수정할 수 없습니다.')
+        super().save(*args, **kwargs)
+
+    class Meta:
+        verbose_name = '감사 이벤트'
+        verbose_name_plural = '감사 이벤트들'
+        indexes = [
+            # 사용자별 이력 조회 (user_id = ? ORDER BY timestamp DESC)
+            models.Index(fields=['user', 'timestamp'], name='accounts_audit_user_ts_idx'),
+            # 기간별 조회 및 보존 기간이 지난 이벤트 정리
+            models.Index(fields=['timestamp'], name='accounts_audit_ts_idx'),
+        ]
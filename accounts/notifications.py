@@ -0,0 +1,43 @@
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+
+def user_group(user_id):
+    """
+    사용자의 모든 WebSocket 연결이 속한 그룹
+    """
+    return f'accounts.user.{user_id}'
+
+
+def presence_group(user_id):
+    """
+    사용자의 접속 상태를 구독하는 연결 그룹
+    """
+    return f'accounts.presence.{user_id}'
+
+
+async def anotify_user(user_id, data):
+    """
+    사용자의 모든 연결에 알림 전송 (채널 레이어를 통해 다른 프로세스의 연결에도 전달)
+    """
+    await get_channel_layer().group_send(user_group(user_id), {'type': 'notification', 'data': data})
+
+
+def notify_user(user_id, data):
+    """
+    anotify_user()의 동기 버전
+    """
+    async_to_sync(anotify_user)(user_id, data)
+
+
+async def arevoke_user_connections(user_id):
+    """
+    사용자의 모든 연결 종료 (비밀번호 변경 등으로 토큰이 폐기된 경우)
+    """
+    await get_channel_layer().group_send(user_group(user_id), {'type': 'session.revoke'})
+
+
+async def abroadcast_presence(user_id, online):
+    await get_channel_layer().group_send(
+        presence_group(user_id), {'type': 'presence.update', 'user_id': user_id, 'online': online}
+    )
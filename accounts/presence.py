@@ -0,0 +1,227 @@
+import threading
+import time
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .redis_client import get_redis
+
+# 연결 제거 후 남은 연결이 없으면 만료 목록에서도 제거하는 Lua 스크립트
+# KEYS[1]: 사용자 연결 ZSET / KEYS[2]: 사용자별 만료 시각 ZSET / ARGV: 연결 id, 현재 시각, 사용자 id
+# 반환값: 접속 종료가 되었으면 1
+REMOVE_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[2])
+if redis.call('ZCARD', KEYS[1]) == 0 then
+    redis.call('ZREM', KEYS[2], ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# 만료 시각이 지난 사용자 중 남은 연결이 없는 사용자를 만료 목록에서 제거하고 반환하는 Lua 스크립트
+# (남은 연결이 있으면 가장 늦은 만료 시각으로 다시 등록)
+# KEYS[1]: 사용자별 만료 시각 ZSET / ARGV: 현재 시각, 사용자 연결 키 접두어, 최대 처리 수
+SWEEP_SCRIPT = """
+local offline = {}
+for _, user_id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])) do
+    local key = ARGV[2] .. user_id
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', ARGV[1])
+    local latest = redis.call('ZRANGE', key, -1, -1, 'WITHSCORES')
+    if latest[1] then
+        redis.call('ZADD', KEYS[1], latest[2], user_id)
+    else
+        redis.call('ZREM', KEYS[1], user_id)
+        table.insert(offline, user_id)
+    end
+end
+return offline
+"""
+
+
+class BasePresenceBackend:
+    """
+    접속 상태(presence) 백엔드 인터페이스
+    사용자별로 열려 있는 WebSocket 연결(channel name)을 만료 시각과 함께 기록하며,
+    하트비트가 끊긴 연결은 TTL이 지나면 접속 종료로 간주합니다.
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+
+    def touch(self, user_id, connection_id):
+        """
+        연결의 만료 시각을 갱신하고, 사용자가 새로 접속 상태가 되었으면 True 반환
+        """
+        raise NotImplementedError
+
+    def remove(self, user_id, connection_id):
+        """
+        연결을 제거하고, 사용자의 남은 연결이 없으면 True 반환
+        """
+        raise NotImplementedError
+
+    def online(self, user_ids):
+        """
+        {사용자 id: 접속 여부}
+        """
+        raise NotImplementedError
+
+    def sweep(self):
+        """
+        하트비트가 끊겨 접속 종료가 된 사용자 id 목록 (remove()로 종료된 사용자는 제외)
+        여러 프로세스에서 호출해도 사용자마다 한 번만 반환합니다.
+        """
+        raise NotImplementedError
+
+
+class RedisPresenceBackend(BasePresenceBackend):
+    """
+    Redis 기반 presence
+    사용자별 ZSET에 연결을 만료 시각(score)과 함께 저장하고, 키에도 TTL을 걸어서
+    모든 연결의 하트비트가 끊기면 별도 정리 작업 없이 삭제됩니다.
+    접속 종료 알림을 위해 사용자별 가장 늦은 만료 시각도 별도 ZSET에 기록합니다. (sweep())
+    """
+
+    def __init__(self, ttl=60, prefix='accounts:presence', sweep_batch_size=1000):
+        super().__init__(ttl)
+        self.prefix = prefix
+        self.sweep_batch_size = sweep_batch_size
+        self._scripts = {}
+
+    def _key(self, user_id):
+        return f'{self.prefix}:user:{user_id}'
+
+    @property
+    def _expiry_key(self):
+        return f'{self.prefix}:expiry'
+
+    def _script(self, source):
+        if source not in self._scripts:
+            self._scripts[source] = get_redis().register_script(source)
+        return self._scripts[source]
+
+    def touch(self, user_id, connection_id):
+        key = self._key(user_id)
+        now = time.time()
+        pipe = get_redis().pipeline()
+        pipe.zremrangebyscore(key, '-inf', now)
+        pipe.zcard(key)
+        pipe.zadd(key, {connection_id: now + self.ttl})
+        pipe.expire(key, self.ttl)
+        pipe.zadd(self._expiry_key, {user_id: now + self.ttl})
+        _, active_before, _, _, _ = pipe.execute()
+        return active_before == 0
+
+    def remove(self, user_id, connection_id):
+        offline = self._script(REMOVE_SCRIPT)(
+            keys=[self._key(user_id), self._expiry_key], args=[connection_id, time.time(), user_id],
+        )
+        return offline == 1
+
+    def online(self, user_ids):
+        user_ids = list(user_ids)
+        now = time.time()
+        pipe = get_redis().pipeline()
+        for user_id in user_ids:
+            pipe.zcount(self._key(user_id), now, '+inf')
+        return {user_id: count > 0 for user_id, count in zip(user_ids, pipe.execute())}
+
+    def sweep(self):
+        user_ids = self._script(SWEEP_SCRIPT)(
+            keys=[self._expiry_key], args=[time.time(), self._key(''), self.sweep_batch_size],
+        )
+        return [int(user_id) for user_id in user_ids]
+
+
+class InMemoryPresenceBackend(BasePresenceBackend):
+    """
+    프로세스 메모리 기반 presence (테스트 및 Redis 없는 로컬 개발용)
+    """
+
+    def __init__(self, ttl=60):
+        super().__init__(ttl)
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def _active(self, user_id, now):
+        connections = self._connections.get(user_id, {})
+        for connection_id in [key for key, expires_at in connections.items() if expires_at <= now]:
+            del connections[connection_id]
+        return connections
+
+    def touch(self, user_id, connection_id):
+        now = time.time()
+        with self._lock:
+            connections = self._active(user_id, now)
+            became_online = not connections
+            connections[connection_id] = now + self.ttl
+            self._connections[user_id] = connections
+        return became_online
+
+    def remove(self, user_id, connection_id):
+        with self._lock:
+            connections = self._active(user_id, time.time())
+            connections.pop(connection_id, None)
+            if not connections:
+                self._connections.pop(user_id, None)
+                return True
+        return False
+
+    def online(self, user_ids):
+        now = time.time()
+        with self._lock:
+            return {user_id: bool(self._active(user_id, now)) for user_id in user_ids}
+
+    def sweep(self):
+        now = time.time()
+        with self._lock:
+            offline = [user_id for user_id in self._connections if not self._active(user_id, now)]
+            for user_id in offline:
+                del self._connections[user_id]
+        return offline
+
+    def clear(self):
+        with self._lock:
+            self._connections.clear()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_presence():
+    """
+    PRESENCE 설정의 백엔드 인스턴스 반환
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                options = getattr(settings, 'PRESENCE', {})
+                backend_class = import_string(
+                    options.get('BACKEND', 'accounts.presence.InMemoryPresenceBackend')
+                )
+                _backend = backend_class(ttl=options.get('TTL', 60), **options.get('OPTIONS', {}))
+    return _backend
+
+
+def self_or_staff_policy(user, user_ids):
+    """
+    기본 접속 상태 구독 정책: 본인 상태만 구독할 수 있고, 관리자는 모든 사용자를 구독할 수 있음
+    친구/팔로우 등의 관계를 사용하려면 (사용자, id 목록)을 받아 허용할 id 집합을 반환하는 함수를
+    PRESENCE['POLICY']에 지정합니다. (DB 조회 가능, 스레드에서 실행)
+    """
+    if user.is_staff:
+        return set(user_ids)
+    return {user.pk} & set(user_ids)
+
+
+def allowed_presence_ids(user, user_ids):
+    """
+    PRESENCE['POLICY']로 user가 접속 상태를 구독할 수 있는 id 집합 반환
+    """
+    policy = import_string(
+        getattr(settings, 'PRESENCE', {}).get('POLICY', 'accounts.presence.self_or_staff_policy')
+    )
+    return set(policy(user, user_ids))
@@ -0,0 +1,12 @@
+import functools
+
+import redis
+from django.conf import settings
+
+
+@functools.lru_cache(maxsize=None)
+def get_redis():
+    """
+    REDIS_URL 설정으로 생성한 프로세스 전역 Redis 클라이언트 (커넥션 풀 공유)
+    """
+    return redis.Redis.from_url(settings.REDIS_URL)
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from . import consumers
+
+websocket_urlpatterns = [
+    path('ws/accounts/notifications/', consumers.NotificationConsumer.as_asgi(), name='notifications'),
+]
@@ -1,20 +1,110 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer as BaseTokenRefreshSerializer
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+
+from .audit import decode_cursor
+from .hashing import amake_password, get_hashing_pool
+from .images import rendition_urls, schedule_renditions
+from .instrumentation import TimedSerializerMixin, timed
+from .mixins import AsyncValidationMixin
+from .models import AuditEvent, login_identifier_kind
+from .tokens import RefreshToken
 
 User = get_user_model()
 
-class UserSerializer(serializers.ModelSerializer):
+# DB 유일성 제약 위반 시 오류를 표시할 필드
+UNIQUE_CONSTRAINT_FIELDS = {
+    'accounts_user_email_ci_uniq': 'email',
+    'accounts_user_phone_uniq': 'phone_number',
+}
+
+
+def unique_violation_error(exc):
+    """
+    유일성 제약 위반(IntegrityError)을 필드별 ValidationError로 변환
+    중복 검사를 미리 하지 않고 DB 제약에 맡긴 뒤, 위반된 제약 이름으로 필드를 찾습니다.
+    """
+    message = str(exc)
+    for constraint in User._meta.constraints:
+        if constraint.name in message and constraint.name in UNIQUE_CONSTRAINT_FIELDS:
+            return serializers.ValidationError({
+                UNIQUE_CONSTRAINT_FIELDS[constraint.name]: [constraint.violation_error_message]
+            })
+    if 'username' in message:
+        return serializers.ValidationError({
+            'username': [User._meta.get_field('username').error_messages['unique']]
+        })
+    return None
+
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     일반적인 사용자 정보 Serializer
     """
+    profile_image_renditions = serializers.SerializerMethodField()
+
     class Meta:
         model = User
-        fields = ('id', 'username', 'email', 'user_type', 'profile_image', 'phone_number')
+        fields = ('id', 'username', 'email', 'user_type', 'profile_image', 'profile_image_renditions', 'phone_number')
         read_only_fields = ('id',)
 
-class RegisterSerializer(serializers.ModelSerializer):
+    def get_profile_image_renditions(self, obj):
+        return rendition_urls(obj.profile_image, self.context.get('request'))
+
+class PublicUserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    다른 사용자에게 공개되는 사용자 정보 Serializer (읽기 전용)
+    """
+    profile_image_renditions = serializers.SerializerMethodField()
+
+    class Meta:
+        model = User
+        fields = ('id', 'username', 'user_type', 'profile_image', 'profile_image_renditions')
+        read_only_fields = fields
+
+    def get_profile_image_renditions(self, obj):
+        return rendition_urls(obj.profile_image, self.context.get('request'))
+
+
+class PublicProfileQuerySerializer(serializers.Serializer):
+    """
+    공개 프로필 일괄 조회 파라미터 (?ids=1,2,3)
+    """
+    ids = serializers.CharField()
+
+    def validate_ids(self, value):
+        try:
+            user_ids = [int(user_id) for user_id in value.split(',') if user_id.strip()]
+        except ValueError:
+            raise serializers.ValidationError("쉼표로 구분된 사용자 id 목록이어야 합니다.")
+        # 요청 순서를 유지하면서 중복 제거
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            raise serializers.ValidationError("사용자 id를 하나 이상 입력해야 합니다.")
+        limit = getattr(settings, 'ACCOUNTS_PUBLIC_PROFILE_BATCH_SIZE', 200)
+        if len(user_ids) > limit:
+            raise serializers.ValidationError(f"한 번에 최대 {limit}명까지 조회할 수 있습니다.")
+        return user_ids
+
+class AvailabilityQuerySerializer(serializers.Serializer):
+    """
+    아이디/이메일 사용 가능 여부 조회 파라미터 (?username=...&email=...)
+    """
+    username = serializers.CharField(
+        required=False, max_length=150, validators=[User.username_validator]
+    )
+    email = serializers.EmailField(required=False)
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError("username 또는 email을 입력해야 합니다.")
+        return attrs
+
+class RegisterSerializer(TimedSerializerMixin, AsyncValidationMixin, serializers.ModelSerializer):
     """
     회원가입을 위한 Serializer
     """
@@ -31,6 +121,14 @@ class RegisterSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('username', 'password', 'password2', 'email', 'user_type', 'phone_number')
+        # 아이디/이메일/연락처 중복은 DB 유일성 제약으로 검사 (acreate 참고)
+        extra_kwargs = {'username': {'validators': [User.username_validator]}}
+
+    def validate_username(self, value):
+        # 다른 사용자의 이메일/연락처와 같은 아이디로 로그인 식별자가 겹치지 않도록 거부
+        if login_identifier_kind(value) != 'username':
+            raise serializers.ValidationError('이메일 또는 연락처 형식의 아이디는 사용할 수 없습니다.')
+        return value
 
     def validate(self, attrs):
         if attrs['password'] != attrs['password2']:
@@ -42,8 +140,31 @@ class RegisterSerializer(serializers.ModelSerializer):
         user = User.objects.create_user(**validated_data)
         return user
 
+    async def acreate(self, validated_data):
+        """
+        create()의 비동기 버전 (비밀번호 해싱은 해싱 풀에서 수행)
+        """
+        validated_data.pop('password2')
+        password = validated_data.pop('password')
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        user.email = User.objects.normalize_email(user.email)
+        user.password = await amake_password(password)
+        try:
+            await user.asave()
+        except IntegrityError as exc:
+            error = unique_violation_error(exc)
+            if error is None:
+                raise
+            raise error
+        return user
 
-class ChangePasswordSerializer(serializers.ModelSerializer):
+
+class ChangePasswordSerializer(TimedSerializerMixin, AsyncValidationMixin, serializers.ModelSerializer):
+    """
+    비밀번호 변경 Serializer
+    현재 비밀번호 확인(해싱)은 avalidate()에서 해싱 풀로 수행하므로 ais_valid()로 검증합니다.
+    """
     old_password = serializers.CharField(write_only=True, required=True)
     new_password = serializers.CharField(write_only=True, required=True)
     confirm_new_password = serializers.CharField(write_only=True, required=True)
@@ -52,11 +173,6 @@ class ChangePasswordSerializer(serializers.ModelSerializer):
         model = User
         fields = ('old_password', 'new_password', 'confirm_new_password')
 
-    def validate_old_password(self, value):
-        user = self.context['request'].user
-        if not user.check_password(value):
-            raise serializers.ValidationError('현재 비밀번호가 일치하지 않습니다.')
-        return value
 
     def validate(self, data):
         if data['new_password'] != data['confirm_new_password']:
@@ -73,6 +189,15 @@ class ChangePasswordSerializer(serializers.ModelSerializer):
             
         return data
 
+    async def avalidate(self, attrs):
+        user = self.context['request'].user
+        # 해시 값만 풀에 넘겨 검증 (해시 업그레이드/DB 저장 없음, 프로세스 풀에서도 실행 가능)
+        with timed('hash'):
+            is_correct = await get_hashing_pool().run(check_password, attrs['old_password'], user.password)
+        if not is_correct:
+            raise serializers.ValidationError({'old_password': '현재 비밀번호가 일치하지 않습니다.'})
+        return attrs
+
     def save(self, **kwargs):
         password = self.validated_data['new_password']
         user = self.context['request'].user
@@ -80,31 +205,127 @@ class ChangePasswordSerializer(serializers.ModelSerializer):
         user.save()
         return user
 
-class LoginSerializer(serializers.Serializer):
+    async def asave(self):
+        """
+        save()의 비동기 버전 (새 비밀번호 해싱은 해싱 풀에서 수행)
+        """
+        user = self.context['request'].user
+        user.password = await amake_password(self.validated_data['new_password'])
+        await user.asave(update_fields=['password'])
+        return user
+
+class LoginSerializer(TimedSerializerMixin, serializers.Serializer):
     """
     로그인을 위한 Serializer
     """
     username = serializers.CharField(required=True)
     password = serializers.CharField(required=True, write_only=True)
 
-class UpdateUserSerializer(serializers.ModelSerializer):
+class UpdateUserSerializer(TimedSerializerMixin, AsyncValidationMixin, serializers.ModelSerializer):
     """
     회원정보 수정을 위한 Serializer
     """
+    # 저장할 필드 (캐시된 사용자 객체의 이전 last_login/last_seen 값을 덮어쓰지 않도록 지정)
+    UPDATE_FIELDS = ('email', 'user_type', 'phone_number', 'profile_image')
+
+    profile_image_renditions = serializers.SerializerMethodField()
+
     class Meta:
         model = User
-        fields = ('email', 'user_type', 'phone_number', 'profile_image')
-        
-    def validate_email(self, value):
-        user = self.context['request'].user
-        if User.objects.exclude(pk=user.pk).filter(email=value).exists():
-            raise serializers.ValidationError("이미 사용중인 이메일입니다.")
-        return value
+        fields = ('email', 'user_type', 'phone_number', 'profile_image', 'profile_image_renditions')
 
+    def get_profile_image_renditions(self, obj):
+        return rendition_urls(obj.profile_image, self.context.get('request'))
+        
     def update(self, instance, validated_data):
         instance.email = validated_data.get('email', instance.email)
         instance.user_type = validated_data.get('user_type', instance.user_type)
         instance.phone_number = validated_data.get('phone_number', instance.phone_number)
         instance.profile_image = validated_data.get('profile_image', instance.profile_image)
-        instance.save()
+        try:
+            instance.save(update_fields=self.UPDATE_FIELDS)
+        except IntegrityError as exc:
+            error = unique_violation_error(exc)
+            if error is None:
+                raise
+            raise error
+        if 'profile_image' in validated_data:
+            schedule_renditions(instance.profile_image)
+        return instance
+
+    async def aupdate(self, instance, validated_data):
+        """
+        update()의 비동기 버전
+        """
+        instance.email = validated_data.get('email', instance.email)
+        instance.user_type = validated_data.get('user_type', instance.user_type)
+        instance.phone_number = validated_data.get('phone_number', instance.phone_number)
+        instance.profile_image = validated_data.get('profile_image', instance.profile_image)
+        # 이메일/연락처 중복은 DB 유일성 제약으로 검사
+        try:
+            await instance.asave(update_fields=self.UPDATE_FIELDS)
+        except IntegrityError as exc:
+            error = unique_violation_error(exc)
+            if error is None:
+                raise
+            raise error
+        if 'profile_image' in validated_data:
+            schedule_renditions(instance.profile_image)
         return instance
+
+
+class TokenRefreshSerializer(TimedSerializerMixin, BaseTokenRefreshSerializer):
+    """
+    토큰 갱신 Serializer
+    denylist에 있는 리프레시 토큰을 거부하고, 로테이션된 이전 토큰을 denylist에 추가합니다.
+    """
+    token_class = RefreshToken
+
+
+class AuditEventSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    감사 이벤트 Serializer (읽기 전용)
+    """
+    # DRF 3.14의 IPAddressField는 Django 5.1의 검사기와 호환되지 않으므로 문자열로 출력
+    ip_address = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = AuditEvent
+        fields = ('id', 'timestamp', 'event_type', 'user', 'username', 'ip_address', 'user_agent', 'data')
+        read_only_fields = fields
+
+
+class AuditEventQuerySerializer(serializers.Serializer):
+    """
+    감사 이벤트 조회 파라미터
+    """
+    user = serializers.IntegerField(required=False)
+    event_type = serializers.CharField(required=False)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=100, default=50)
+
+    def validate_event_type(self, value):
+        event_types = [event_type for event_type in value.split(',') if event_type]
+        valid = dict(AuditEvent.EVENT_TYPE_CHOICES)
+        invalid = [event_type for event_type in event_types if event_type not in valid]
+        if invalid:
+            raise serializers.ValidationError(f"지원하지 않는 이벤트 유형입니다: {', '.join(invalid)}")
+        return event_types
+
+    def validate_cursor(self, value):
+        try:
+            decode_cursor(value)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc))
+        return value
+
+
+class UserExportQuerySerializer(serializers.Serializer):
+    """
+    사용자 내보내기 파라미터 (?type=csv|ndjson&since=...&gzip=true)
+    """
+    type = serializers.ChoiceField(choices=('csv', 'ndjson'), required=False, default='csv')
+    since = serializers.DateTimeField(required=False)
+    gzip = serializers.BooleanField(required=False, default=False)
@@ -0,0 +1,357 @@
+import hashlib
+import os
+import posixpath
+import shutil
+import tempfile
+import urllib.request
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage, Storage, storages
+from django.utils.module_loading import import_string
+
+from .images import RENDITIONS_DIRNAME
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def content_name(name, digest):
+    """
+    내용 해시로 저장 이름 생성
+    예) profile_images/photo.PNG -> profile_images/3f/3fa9...c1.png
+    """
+    directory = posixpath.dirname(name)
+    extension = posixpath.splitext(name)[1].lower()
+    return posixpath.join(directory, digest[:2], f'{digest}{extension}')
+
+
+def is_derived_name(name):
+    """
+    렌디션처럼 원본 이름에서 만들어지는 파일인지 여부
+    (이미 원본 해시가 이름에 들어 있으므로 주어진 이름 그대로 저장)
+    """
+    return RENDITIONS_DIRNAME in posixpath.dirname(name).split('/')
+
+
+def is_immutable_name(name):
+    """
+    이름이 곧 내용인 파일인지 여부 (내용 해시 이름인 원본 파일)
+    """
+    stem = posixpath.splitext(posixpath.basename(name))[0]
+    return (
+        not is_derived_name(name)
+        and len(stem) == 64
+        and posixpath.basename(posixpath.dirname(name)) == stem[:2]
+    )
+
+
+def _hash_chunks(chunks):
+    hasher = hashlib.sha256()
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class ContentAddressedFileSystemStorage(FileSystemStorage):
+    """
+    내용 해시(SHA-256)로 파일 이름을 정하는 로컬 디스크 저장소
+    같은 내용의 파일은 한 번만 저장되며(중복 제거), 업로드는 청크 단위로 해싱하면서 기록하므로
+    파일 전체를 메모리에 올리지 않습니다.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # 저장 이름은 _save()에서 내용 해시로 정하므로 이름 충돌 처리를 하지 않음
+        return name
+
+    def _save(self, name, content):
+        if is_derived_name(name):
+            return self._save_exact(name, content)
+
+        # 업로드 핸들러가 이미 디스크에 쓴 임시 파일은 해싱 후 이동만 함
+        if hasattr(content, 'temporary_file_path'):
+            temp_path = content.temporary_file_path()
+            with open(temp_path, 'rb') as file:
+                digest = _hash_chunks(iter(lambda: file.read(HASH_CHUNK_SIZE), b''))
+            final_name = content_name(name, digest)
+            if self._touch(final_name):
+                return final_name
+            self._make_parent(final_name)
+            try:
+                file_move_safe(temp_path, self.path(final_name), allow_overwrite=False)
+            except FileExistsError:
+                self._touch(final_name)
+            else:
+                self._set_permissions(final_name)
+            return final_name
+
+        temp_path, digest = self._write_temp(name, content)
+        final_name = content_name(name, digest)
+        try:
+            self._make_parent(final_name)
+            # 같은 내용이 이미 있으면(동시 업로드 포함) 기존 파일을 그대로 사용
+            os.link(temp_path, self.path(final_name))
+        except FileExistsError:
+            self._touch(final_name)
+        else:
+            self._set_permissions(final_name)
+        finally:
+            os.unlink(temp_path)
+        return final_name
+
+    def _touch(self, name):
+        """
+        기존 파일을 다시 쓰게 되면 수정 시각을 갱신 (gc_media의 유예 시간을 새로 적용받도록)
+        파일이 없으면 False를 반환합니다.
+        """
+        try:
+            os.utime(self.path(name))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _save_exact(self, name, content):
+        temp_path, _ = self._write_temp(name, content)
+        self._make_parent(name)
+        os.replace(temp_path, self.path(name))
+        self._set_permissions(name)
+        return name
+
+    def _write_temp(self, name, content):
+        """
+        저장소 디렉터리 안의 임시 파일에 청크 단위로 기록하면서 해시 계산
+        """
+        directory = self._make_parent(name)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.upload-')
+        hasher = hashlib.sha256()
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    hasher.update(chunk)
+                    file.write(chunk)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return temp_path, hasher.hexdigest()
+
+    def _make_parent(self, name):
+        directory = os.path.dirname(self.path(name))
+        if self.directory_permissions_mode is not None:
+            old_umask = os.umask(0o777 & ~self.directory_permissions_mode)
+            try:
+                os.makedirs(directory, self.directory_permissions_mode, exist_ok=True)
+            finally:
+                os.umask(old_umask)
+        else:
+            os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def _set_permissions(self, name):
+        os.chmod(self.path(name), self.file_permissions_mode or 0o644)
+
+    def walk_files(self, directory=''):
+        """
+        디렉터리 아래 모든 파일의 (이름, 수정 시각) 목록 (gc_media에서 사용)
+        """
+        directories, files = self.listdir(directory)
+        for filename in files:
+            name = posixpath.join(directory, filename)
+            yield name, self.get_modified_time(name)
+        for subdirectory in directories:
+            yield from self.walk_files(posixpath.join(directory, subdirectory))
+
+
+class CloudinaryClient:
+    """
+    Cloudinary SDK 클라이언트 (CLOUDINARY_URL 환경 변수로 설정)
+    """
+
+    def __init__(self):
+        import cloudinary.api
+        import cloudinary.uploader
+        import cloudinary.utils
+
+        self.api = cloudinary.api
+        self.uploader = cloudinary.uploader
+        self.utils = cloudinary.utils
+
+    def upload(self, file, public_id, fmt, overwrite):
+        self.uploader.upload(
+            file, public_id=public_id, format=fmt, overwrite=overwrite,
+            resource_type='image', unique_filename=False, use_filename=False,
+        )
+
+    def exists(self, public_id):
+        try:
+            self.api.resource(public_id)
+        except self.api.NotFound:
+            return False
+        return True
+
+    def delete(self, public_id):
+        self.uploader.destroy(public_id, invalidate=True)
+
+    def url(self, public_id, fmt):
+        return self.utils.cloudinary_url(public_id, format=fmt, secure=True)[0]
+
+    def list(self, prefix):
+        cursor = None
+        while True:
+            response = self.api.resources(
+                type='upload', prefix=prefix, max_results=500, next_cursor=cursor
+            )
+            for resource in response['resources']:
+                created_at = datetime.fromisoformat(resource['created_at'].replace('Z', '+00:00'))
+                yield resource['public_id'], resource['format'], created_at
+            cursor = response.get('next_cursor')
+            if not cursor:
+                break
+
+
+class LocalCloudinaryClient:
+    """
+    Cloudinary API를 흉내 내는 로컬 디스크 클라이언트 (테스트 및 로컬 개발용)
+    public_id와 형식으로 파일을 저장하고, overwrite=False이면 기존 파일을 유지합니다.
+    """
+
+    def __init__(self, location=None, base_url=None):
+        self._location = location
+        self._base_url = base_url
+
+    @property
+    def location(self):
+        return self._location or os.path.join(settings.MEDIA_ROOT, 'cloudinary')
+
+    @property
+    def base_url(self):
+        return self._base_url or f"{settings.MEDIA_URL.rstrip('/')}/cloudinary/"
+
+    def _path(self, public_id, fmt=None):
+        path = os.path.join(self.location, *public_id.split('/'))
+        return f'{path}.{fmt}' if fmt else path
+
+    def _find(self, public_id):
+        directory, stem = os.path.split(self._path(public_id))
+        if os.path.isdir(directory):
+            for filename in os.listdir(directory):
+                if os.path.splitext(filename)[0] == stem:
+                    return os.path.join(directory, filename)
+        return None
+
+    def upload(self, file, public_id, fmt, overwrite):
+        path = self._path(public_id, fmt)
+        if not overwrite and os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.upload-')
+        with os.fdopen(fd, 'wb') as output:
+            shutil.copyfileobj(file, output, HASH_CHUNK_SIZE)
+        os.replace(temp_path, path)
+
+    def exists(self, public_id):
+        return self._find(public_id) is not None
+
+    def delete(self, public_id):
+        path = self._find(public_id)
+        if path is not None:
+            os.unlink(path)
+
+    def url(self, public_id, fmt):
+        return f'{self.base_url}{public_id}.{fmt}'
+
+    def open(self, public_id, fmt):
+        return open(self._path(public_id, fmt), 'rb')
+
+    def list(self, prefix):
+        for root, _, filenames in os.walk(self.location):
+            for filename in filenames:
+                if filename.startswith('.'):
+                    continue
+                path = os.path.join(root, filename)
+                stem, extension = os.path.splitext(os.path.relpath(path, self.location))
+                public_id = stem.replace(os.sep, '/')
+                if public_id.startswith(prefix):
+                    created_at = datetime.fromtimestamp(os.path.getmtime(path), tz=timezone.utc)
+                    yield public_id, extension[1:], created_at
+
+
+class CloudinaryContentAddressedStorage(Storage):
+    """
+    Cloudinary에 내용 해시 이름으로 저장하는 저장소
+    해시를 먼저 계산해야 하므로 업로드 내용을 임시 파일로 스트리밍한 뒤,
+    같은 public_id가 없을 때만 업로드합니다. (overwrite=False)
+    """
+
+    def __init__(self, client=None, client_options=None):
+        client_class = import_string(client) if isinstance(client, str) else (client or CloudinaryClient)
+        self.client = client_class(**(client_options or {}))
+
+    @staticmethod
+    def _split(name):
+        public_id, extension = posixpath.splitext(name)
+        fmt = extension[1:].lower()
+        # Cloudinary의 public_id는 형식과 관계없이 유일하므로 형식별 렌디션은 public_id에 형식을 붙임
+        if is_derived_name(name):
+            public_id = f'{public_id}-{fmt}'
+        return public_id, fmt
+
+    @staticmethod
+    def _join(public_id, fmt):
+        if is_derived_name(public_id) and public_id.endswith(f'-{fmt}'):
+            public_id = public_id[:-len(fmt) - 1]
+        return f'{public_id}.{fmt}'
+
+    def get_available_name(self, name, max_length=None):
+        return name
+
+    def _save(self, name, content):
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as buffer:
+            hasher = hashlib.sha256()
+            for chunk in content.chunks():
+                hasher.update(chunk)
+                buffer.write(chunk)
+            buffer.seek(0)
+
+            if is_derived_name(name):
+                final_name, overwrite = name, True
+            else:
+                final_name, overwrite = content_name(name, hasher.hexdigest()), False
+                if self.exists(final_name):
+                    return final_name
+            public_id, fmt = self._split(final_name)
+            self.client.upload(buffer, public_id, fmt, overwrite)
+        return final_name
+
+    def _open(self, name, mode='rb'):
+        public_id, fmt = self._split(name)
+        if hasattr(self.client, 'open'):
+            return File(self.client.open(public_id, fmt), name)
+        buffer = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        with urllib.request.urlopen(self.client.url(public_id, fmt)) as response:
+            shutil.copyfileobj(response, buffer, HASH_CHUNK_SIZE)
+        buffer.seek(0)
+        return File(buffer, name)
+
+    def exists(self, name):
+        return self.client.exists(self._split(name)[0])
+
+    def delete(self, name):
+        self.client.delete(self._split(name)[0])
+
+    def url(self, name):
+        return self.client.url(*self._split(name))
+
+    def walk_files(self, directory=''):
+        prefix = f'{directory.rstrip("/")}/' if directory else ''
+        for public_id, fmt, created_at in self.client.list(prefix):
+            yield self._join(public_id, fmt), created_at
+
+
+def get_profile_image_storage():
+    """
+    프로필 이미지 저장소 (STORAGES['profile_images'])
+    """
+    return storages['profile_images']
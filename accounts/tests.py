@@ -1,3 +1,1627 @@
-from django.test import TestCase
+import asyncio
+import csv
+import gzip
+import importlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+import fakeredis
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.contrib.auth import get_user_model, user_login_failed
+from django.contrib.auth import hashers as django_hashers
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from drf_yasg import openapi
+from drf_yasg.generators import OpenAPISchemaGenerator
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+
+from benchmarks import accounts_api
+from benchmarks import common as benchmark_common
+from RePlay import cache as tiered_cache
+from RePlay import routers, schema
+from RePlay.cache import LocalTier, TwoTierCache
+from RePlay.middleware import AuthenticationMiddleware as RePlayAuthenticationMiddleware
+from RePlay.middleware import ReplicaRoutingMiddleware
+from RePlay.middleware import SessionMiddleware as RePlaySessionMiddleware
+
+from . import (
+    activity, audit, availability, consumers, denylist, hashing, images, instrumentation, presence, throttling, tokens,
+    views,
+)
+from . import serializers as serializers_module
+from .activity import ActivityFlusher, InMemoryActivityBuffer, RedisActivityBuffer
+from .audit import AuditLog
+from .authentication import JWTAuthMiddleware
+from .availability import InMemoryAvailabilityFilter, get_availability_filter
+from .bloom import bit_positions
+from .cache import cache as user_cache
+from .cache import (
+    LRUCache, aget_public_users, get_cached_user, get_user_version, invalidate_user_cache, public_profile_cache,
+)
+from .export import UserExporter
+from .hashing import PasswordHashingPool
+from .models import AuditEvent
+from .management.commands.import_users import Command as ImportUsersCommand
+from .notifications import presence_group
+from .presence import InMemoryPresenceBackend, RedisPresenceBackend
+from .routing import websocket_urlpatterns
+from .serializers import PublicUserSerializer
+from .storage import ContentAddressedFileSystemStorage
+from .throttling import InMemoryRateLimiter, get_rate_limiter
+from .tokens import AccessToken, RefreshToken
+from .validators import BreachedPasswordValidator
+
+User = get_user_model()
+
+PASSWORD = 'Zx9!kq2mPl#v'
+NEW_PASSWORD = 'Qm4$wn7Rt!zp'
+
+
+def two_tier_cache_settings(server, **options):
+    return {
+        'BACKEND': 'RePlay.cache.TwoTierCache',
+        'LOCATION': 'redis://localhost:6379/0',
+        'OPTIONS': {'connection_class': fakeredis.FakeConnection, 'server': server, **options},
+    }
+
+
+def redis_cache_settings(server, **options):
+    return {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://localhost:6379/0',
+        'OPTIONS': {'connection_class': fakeredis.FakeConnection, 'server': server, **options},
+    }
+
+
+def open_two_tier_cache(server, **options):
+    # 다른 프로세스처럼 L1과 무효화 구독 스레드를 따로 사용
+    tiered_cache._stores.clear()
+    params = two_tier_cache_settings(server, **options)
+    backend = TwoTierCache(params['LOCATION'], params)
+    if not backend._store.subscribed.wait(2):
+        raise AssertionError('캐시 무효화 채널을 구독하지 못했습니다.')
+    return backend
+
+
+def auth_client(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+    return client
+
+
+@override_settings(AUDIT_LOG={'ENABLED': False})
+class AccountsTestCase(TestCase):
+    """
+    백그라운드 기록 스레드(감사 로그, 활동 시각) 없이 실행하는 테스트
+    """
+
+    def setUp(self):
+        super().setUp()
+        # 테스트마다 DB가 되돌려지므로 (같은 id가 다시 쓰일 수 있음) 캐시도 비움
+        user_cache.clear()
+        public_profile_cache.clear()
+        get_rate_limiter().clear()
+        patcher = mock.patch.object(ActivityFlusher, '_ensure_started')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class ChangePasswordTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        self.url = reverse('accounts:change_password')
+
+    def change_password(self, old_password):
+        return auth_client(self.user).put(self.url, {
+            'old_password': old_password,
+            'new_password': NEW_PASSWORD,
+            'confirm_new_password': NEW_PASSWORD,
+        }, format='json')
+
+    def test_change_password(self):
+        response = self.change_password(PASSWORD)
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password(NEW_PASSWORD))
+
+    def test_wrong_old_password(self):
+        response = self.change_password('wrong-password')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('old_password', response.data)
+
+    def test_process_pool(self):
+        # 프로세스 풀에는 Serializer(요청 포함)가 아니라 해시 검증만 전달되어야 함
+        pool = PasswordHashingPool(executor='process', max_workers=1)
+        self.addCleanup(pool.shutdown)
+        with mock.patch.object(hashing, '_pool', pool):
+            self.assertEqual(self.change_password('wrong-password').status_code, 400)
+            self.assertEqual(self.change_password(PASSWORD).status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password(NEW_PASSWORD))
+
+
+class LoginIdentifierTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.victim = User.objects.create_user(
+            'victim', 'Victim@example.com', PASSWORD, phone_number='010-1234-5678'
+        )
+        # 가입 검사가 생기기 전에 만들어진, 다른 사람의 이메일/연락처와 같은 아이디
+        self.attackers = [
+            User.objects.create_user('victim@example.com', 'a1@example.com', NEW_PASSWORD),
+            User.objects.create_user('01012345678', 'a2@example.com', NEW_PASSWORD),
+        ]
+
+    def login(self, username, password):
+        return APIClient().post(reverse('accounts:login'), {'username': username, 'password': password}, format='json')
+
+    def test_email_and_phone_login_not_hijacked(self):
+        for identifier in ('victim@example.com', 'VICTIM@example.com', '01012345678', '010.1234.5678'):
+            with self.subTest(identifier=identifier):
+                response = self.login(identifier, PASSWORD)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data['user']['id'], self.victim.pk)
+
+    def test_colliding_username_still_logs_in(self):
+        for attacker in self.attackers:
+            response = self.login(attacker.username, NEW_PASSWORD)
+            self.assertEqual(response.data['user']['id'], attacker.pk)
+
+    def test_wrong_password(self):
+        self.assertEqual(self.login('victim@example.com', 'wrong-password').status_code, 401)
+
+    def test_login_hashes_on_pool(self):
+        # django.contrib.auth.aauthenticate()가 실행하는 동기 인증도 해싱 풀에서 검증하고 실패 시그널을 보냄
+        pool = PasswordHashingPool(max_workers=1)
+        self.addCleanup(pool.shutdown)
+        failed = mock.Mock()
+        user_login_failed.connect(failed)
+        self.addCleanup(user_login_failed.disconnect, failed)
+        with mock.patch.object(hashing, '_pool', pool), mock.patch.object(pool, 'submit', wraps=pool.submit) as submit:
+            self.assertEqual(self.login('victim', PASSWORD).status_code, 200)
+            self.assertEqual(self.login('nobody', PASSWORD).status_code, 401)
+        self.assertEqual(submit.call_count, 2)
+        failed.assert_called_once()
+
+    def test_login_pool_full(self):
+        pool = PasswordHashingPool(max_workers=1, max_queue=0)
+        with mock.patch.object(hashing, '_pool', pool), mock.patch.object(pool, '_pending', 1):
+            self.assertEqual(self.login('victim', PASSWORD).status_code, 503)
+
+    def test_register_rejects_identifier_shaped_username(self):
+        for username in ('victim@example.com', '01012345678', '+82-10-1234-5678'):
+            with self.subTest(username=username):
+                response = APIClient().post(reverse('accounts:register'), {
+                    'username': username, 'email': 'new@example.com',
+                    'password': PASSWORD, 'password2': PASSWORD,
+                }, format='json')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('username', response.data)
+
+
+class UniqueContactMigrationTests(AccountsTestCase):
+    migration = importlib.import_module('accounts.migrations.0002_user_email_phone_unique')
+
+    def check_duplicates(self):
+        self.migration.check_duplicates(django_apps, connection.schema_editor())
+
+    def test_duplicates_reported(self):
+        # 제약이 생기기 전 데이터처럼 유일 인덱스를 지우고 중복 생성 (테스트 트랜잭션과 함께 되돌려짐)
+        with connection.cursor() as cursor:
+            cursor.execute('DROP INDEX accounts_user_email_ci_uniq')
+            cursor.execute('DROP INDEX accounts_user_phone_uniq')
+        first = User.objects.create_user('leo', 'Leo@example.com', PASSWORD, phone_number='010-1111-2222')
+        second = User.objects.create_user('mia', 'leo@EXAMPLE.com', PASSWORD, phone_number='01011112222')
+        with self.assertRaises(CommandError) as context:
+            self.check_duplicates()
+        message = str(context.exception)
+        self.assertIn(f'leo@example.com: 사용자 id {[first.pk, second.pk]}', message)
+        self.assertIn(f'01011112222: 사용자 id {[first.pk, second.pk]}', message)
+
+    def test_no_duplicates(self):
+        User.objects.create_user('leo', 'leo@example.com', PASSWORD, phone_number='010-1111-2222')
+        User.objects.create_user('mia', 'mia@example.com', PASSWORD)
+        self.check_duplicates()
+
+
+class UserCacheInvalidationTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('bob', 'bob@example.com', PASSWORD)
+        self.client = auth_client(self.user)
+        self.url = reverse('accounts:profile')
+
+    def test_save_outside_api_invalidates(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.get(pk=self.user.pk)
+            user.is_active = False
+            user.save()
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_delete_invalidates(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.get(pk=self.user.pk).delete()
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_invalidation_waits_for_commit(self):
+        get_cached_user(self.user.pk)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            User.objects.filter(pk=self.user.pk).update(user_type='seller')
+            User.objects.get(pk=self.user.pk).save()
+            self.assertEqual(get_cached_user(self.user.pk).user_type, 'buyer')
+        for callback in callbacks:
+            callback()
+        self.assertEqual(get_cached_user(self.user.pk).user_type, 'seller')
+
+    def test_activity_fields_do_not_invalidate(self):
+        version = get_user_version(self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save(update_fields=['last_login'])
+        self.assertEqual(get_user_version(self.user.pk), version)
+
+    def test_evicted_version_does_not_revive_old_entries(self):
+        # 버전 키가 밀려난 뒤 다시 만들어져도 이전 버전 번호의 항목이 조회되지 않아야 함
+        old_version = get_user_version(self.user.pk)
+        get_cached_user(self.user.pk)
+        invalidate_user_cache(self.user.pk)
+        User.objects.filter(pk=self.user.pk).update(user_type='seller')
+        user_cache.delete(f'accounts:user:{self.user.pk}:version')
+        invalidate_user_cache(self.user.pk)
+        self.assertNotIn(get_user_version(self.user.pk), (old_version, old_version + 1))
+        self.assertEqual(get_cached_user(self.user.pk).user_type, 'seller')
+
+
+@override_settings(DATABASE_REPLICAS={'ALIASES': ('default',), 'PATHS': ('/',), 'PIN_SECONDS': 30})
+@override_settings(CACHES={
+    **settings.CACHES,
+    'accounts': two_tier_cache_settings(fakeredis.FakeServer()),
+    'replica_pin': redis_cache_settings(fakeredis.FakeServer()),
+})
+class TwoTierUserCacheInvalidationTests(UserCacheInvalidationTests):
+    """
+    같은 무효화 경로를 2단계 캐시(L1 + Redis)에서 실행
+    """
+
+    def setUp(self):
+        patcher = mock.patch.dict(tiered_cache._stores)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+        self.assertIsInstance(caches['accounts'], TwoTierCache)
+
+    def test_version_bump_reaches_other_process(self):
+        # 다른 프로세스의 L1에 남은 사용자 정보도 저장 후에는 쓰이지 않아야 함
+        other = open_two_tier_cache(settings.CACHES['accounts']['OPTIONS']['server'])
+        version_key = user_cache.make_key(f'accounts:user:{self.user.pk}:version')
+        get_cached_user(self.user.pk)
+        old_version = other.get(f'accounts:user:{self.user.pk}:version')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.user_type = 'seller'
+            self.user.save()
+        self.assertEqual(self.user.version, 2)
+        wait_until(lambda: other._store.l1.get(version_key) is tiered_cache._MISSING)
+        self.assertNotEqual(other.get(f'accounts:user:{self.user.pk}:version'), old_version)
+        self.assertEqual(get_cached_user(self.user.pk).user_type, 'seller')
+
+
+@override_settings(DATABASE_REPLICAS={
+    'ALIASES': ('default',), 'PATHS': ('/',), 'PIN_SECONDS': 30, 'PIN_CACHE': 'replica_pin',
+})
+@override_settings(CACHES={**settings.CACHES, 'replica_pin': redis_cache_settings(fakeredis.FakeServer())})
+class ReplicaPinTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pin_cache = routers.get_pin_cache()
+        self.pin_cache.clear()
+        self.user = User.objects.create_user('carol', 'carol@example.com', PASSWORD)
+
+    def request(self, user_id, write=False):
+        state, token = routers.begin_request(True)
+        try:
+            routers.bind_user(user_id)
+            # 테스트 트랜잭션 밖의 요청처럼 라우팅 (트랜잭션 안의 읽기는 항상 기본 DB)
+            with mock.patch.object(connection, 'in_atomic_block', False):
+                state.read_alias = routers.ReplicaRouter().db_for_read(User)
+            if write:
+                routers.ReplicaRouter().db_for_write(User)
+        finally:
+            routers.end_request(token)
+        routers.pin_user(state)
+        return state
+
+    def test_write_pins_user_not_token(self):
+        self.assertFalse(self.request(self.user.pk).pinned)
+        self.request(self.user.pk, write=True)
+        # 다른 토큰(예: 비밀번호 변경 후 새로 발급)으로 온 같은 사용자의 요청도 기본 DB에서 읽음
+        self.assertTrue(self.request(self.user.pk).pinned)
+        self.assertFalse(self.request(self.user.pk + 1).pinned)
+
+    def test_pin_routes_reads_to_default(self):
+        self.assertEqual(self.request(self.user.pk, write=True).read_alias, 'default')
+        # 고정된 요청의 읽기는 라우터가 복제본을 고르지 않음 (None = 기본 DB)
+        self.assertIsNone(self.request(self.user.pk).read_alias)
+        # 고정 시간이 지나면(키 만료) 다시 복제본에서 읽음
+        self.pin_cache.delete(routers.pin_key(self.user.pk))
+        self.assertEqual(self.request(self.user.pk).read_alias, 'default')
+
+    def test_pin_expires_after_pin_seconds(self):
+        self.request(self.user.pk, write=True)
+        server = settings.CACHES['replica_pin']['OPTIONS']['server']
+        ttl = fakeredis.FakeRedis(server=server).ttl(self.pin_cache.make_key(routers.pin_key(self.user.pk)))
+        self.assertTrue(0 < ttl <= 30)
+
+    def test_pin_shared_between_processes(self):
+        # 다른 워커 프로세스(별도 캐시 연결)로 간 다음 요청도 고정되어야 함
+        self.request(self.user.pk, write=True)
+        other = RedisCache(settings.CACHES['replica_pin']['LOCATION'], settings.CACHES['replica_pin'])
+        self.assertTrue(other.get(routers.pin_key(self.user.pk)))
+
+    def test_pinned_read_does_not_extend_pin(self):
+        self.request(self.user.pk, write=True)
+        self.pin_cache.delete(routers.pin_key(self.user.pk))
+        self.request(self.user.pk)
+        self.assertIsNone(self.pin_cache.get(routers.pin_key(self.user.pk)))
+
+    def test_process_local_pin_cache_rejected(self):
+        replicas = {**settings.DATABASE_REPLICAS, 'PIN_CACHE': 'default'}
+        with override_settings(DATABASE_REPLICAS=replicas):
+            with self.assertRaises(ImproperlyConfigured):
+                ReplicaRoutingMiddleware(lambda request: None)
+
+    def test_cached_user_reads_default(self):
+        state, token = routers.begin_request(True)
+        try:
+            with mock.patch.object(routers.ReplicaRouter, 'db_for_read', return_value='replica') as db_for_read:
+                get_cached_user(self.user.pk)
+        finally:
+            routers.end_request(token)
+        db_for_read.assert_not_called()
+
+
+class BreachedPasswordValidatorTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / 'passwords.bloom'
+        call_command('build_password_filter', include_common=True, output=str(path), stdout=mock.Mock())
+        self.validator = BreachedPasswordValidator(path)
+
+    def test_common_passwords_any_case(self):
+        for password in ('password1', 'Password1', 'PASSWORD123', 'Qwerty123', ' qwerty123 '):
+            with self.subTest(password=password), self.assertRaises(ValidationError):
+                self.validator.validate(password)
+
+    def test_uncommon_password(self):
+        self.validator.validate(PASSWORD)
+
+
+class UserVersionTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('dave', 'dave@example.com', PASSWORD)
+
+    def test_save_bumps_version(self):
+        self.assertEqual(self.user.version, 1)
+        self.user.first_name = 'Dave'
+        self.user.save()
+        self.assertEqual(self.user.version, 2)
+        self.user.save(update_fields=['first_name'])
+        self.assertEqual(self.user.version, 3)
+
+    def test_unversioned_fields(self):
+        self.user.save(update_fields=['last_login', 'last_seen'])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.version, 1)
+
+    def test_concurrent_saves_both_counted(self):
+        # 같은 버전을 읽은 두 인스턴스가 각각 저장해도 버전이 두 번 올라야 함
+        first = User.objects.get(pk=self.user.pk)
+        second = User.objects.get(pk=self.user.pk)
+        first.save(update_fields=['first_name'])
+        second.save(update_fields=['last_name'])
+        self.assertEqual((first.version, second.version), (2, 3))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.version, 3)
+
+    def test_failed_save_restores_version(self):
+        User.objects.create_user('erin', 'erin@example.com', PASSWORD)
+        self.user.email = 'ERIN@example.com'
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.user.save(update_fields=['email'])
+        # 실패한 저장 뒤에도 F() 식이 아닌 이전 버전이 남아 있어야 다시 저장할 수 있음
+        self.assertEqual(self.user.version, 1)
+        self.user.email = 'dave2@example.com'
+        self.user.save(update_fields=['email'])
+        self.assertEqual(self.user.version, 2)
+
+    def test_save_queries(self):
+        # UPDATE와 올린 version 조회만 실행
+        with self.assertNumQueries(2):
+            self.user.save(update_fields=['first_name'])
+
+
+class ImportUsersTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.bloom = get_availability_filter()
+        self.bloom.ensure_ready()
+
+    def import_users(self, rows):
+        path = self.directory / 'users.ndjson'
+        path.write_text(''.join(json.dumps(row) + '\n' for row in rows))
+        errors = self.directory / 'errors.csv'
+        call_command('import_users', str(path), workers=1, errors=str(errors), stdout=mock.Mock())
+        with open(errors, newline='', encoding='utf-8') as file:
+            return list(csv.DictReader(file))
+
+    def test_imported_users_added_to_availability_filter(self):
+        self.assertEqual(self.import_users([{'username': 'erin', 'email': 'erin@example.com', 'password': PASSWORD}]), [])
+        self.assertTrue(User.objects.filter(username='erin').exists())
+        self.assertEqual(self.bloom.might_contain([('username', 'erin'), ('email', 'ERIN@example.com')]), [True, True])
+
+    def test_integrity_error_retries_rows(self):
+        # 중복 검사 이후 생긴 충돌(다른 곳에서 가입 등)은 배치 전체가 아니라 해당 행만 실패
+        rows = [
+            {'username': 'frank', 'email': 'frank@example.com', 'password': PASSWORD},
+            {'username': 'frank', 'email': 'frank2@example.com', 'password': PASSWORD},
+            {'username': 'grace', 'email': 'grace@example.com', 'password': PASSWORD},
+        ]
+        with mock.patch.object(ImportUsersCommand, '_exclude_duplicates', lambda self, valid, errors: valid):
+            errors = self.import_users(rows)
+        self.assertEqual([(error['line'], error['username']) for error in errors], [('2', 'frank')])
+        self.assertEqual(set(User.objects.values_list('email', flat=True)), {'frank@example.com', 'grace@example.com'})
+
+
+class ContentAddressedStorageTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.storage = ContentAddressedFileSystemStorage(location=directory.name)
+
+    def age(self, name):
+        os.utime(self.storage.path(name), (0, 0))
+
+    def test_dedupe_refreshes_modified_time(self):
+        name = self.storage.save('profile_images/a.png', ContentFile(b'image'))
+        self.age(name)
+        self.assertEqual(self.storage.save('profile_images/b.PNG', ContentFile(b'image')), name)
+        self.assertGreater(os.path.getmtime(self.storage.path(name)), 0)
+
+    def test_dedupe_from_temporary_upload(self):
+        name = self.storage.save('profile_images/a.png', ContentFile(b'image'))
+        self.age(name)
+        upload = TemporaryUploadedFile('b.png', 'image/png', 5, None)
+        self.addCleanup(upload.close)
+        upload.write(b'image')
+        upload.seek(0)
+        self.assertEqual(self.storage.save('profile_images/b.png', upload), name)
+        self.assertGreater(os.path.getmtime(self.storage.path(name)), 0)
+
+
+class ActivityBufferTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('heidi', 'heidi@example.com', PASSWORD)
+        self.redis = fakeredis.FakeRedis()
+        patcher = mock.patch.object(activity, 'get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_flushes(self, buffer):
+        flusher = ActivityFlusher(buffer)
+        buffer.record(self.user.pk, 'seen', 1_700_000_000)
+        with mock.patch.object(activity, 'save_activity', side_effect=RuntimeError), self.assertRaises(RuntimeError):
+            flusher.flush()
+        # 저장에 실패한 항목은 다음 저장에 다시 포함됨
+        self.assertEqual(flusher.flush(), 1)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_seen.timestamp(), 1_700_000_000)
+        self.assertEqual(flusher.flush(), 0)
+
+    def test_redis_buffer(self):
+        self.assert_flushes(RedisActivityBuffer())
+        self.assertEqual(self.redis.keys('accounts:activity:*'), [])
+
+    def test_redis_keys_kept_until_saved(self):
+        buffer = RedisActivityBuffer()
+        buffer.record(self.user.pk, 'seen', 1)
+        entries, receipt = buffer.drain()
+        # 저장 전에 다른 프로세스가 비워도 저장 중 항목은 다시 읽힘
+        self.assertEqual(buffer.drain()[0], entries)
+        buffer.acknowledge(receipt)
+        self.assertEqual(buffer.drain()[0], {'login': {}, 'seen': {}})
+
+    def test_in_memory_buffer(self):
+        self.assert_flushes(InMemoryActivityBuffer())
+
+    def test_in_memory_buffer_full(self):
+        buffer = InMemoryActivityBuffer(max_size=1)
+        self.assertTrue(buffer.record(1, 'seen', 1))
+        self.assertTrue(buffer.record(1, 'seen', 2))
+        self.assertFalse(buffer.record(2, 'seen', 3))
+        buffer.restore({'seen': {1: 0}})
+        self.assertEqual(buffer.drain()[0]['seen'], {1: 2})
+
+
+class PresenceBackendTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(presence, 'get_redis', return_value=fakeredis.FakeRedis())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_sweeps_expired(self, backend):
+        with mock.patch.object(presence.time, 'time', return_value=1000):
+            self.assertTrue(backend.touch(1, 'a'))
+            self.assertTrue(backend.touch(2, 'b'))
+            self.assertTrue(backend.touch(3, 'c'))
+            # 정상 종료한 연결은 disconnect()에서 이미 알렸으므로 대상이 아님
+            self.assertTrue(backend.remove(3, 'c'))
+        with mock.patch.object(presence.time, 'time', return_value=1050):
+            self.assertFalse(backend.touch(2, 'b'))
+            self.assertEqual(backend.sweep(), [])
+        with mock.patch.object(presence.time, 'time', return_value=1070):
+            self.assertEqual(backend.sweep(), [1])
+            self.assertEqual(backend.sweep(), [])
+            self.assertEqual(backend.online([1, 2]), {1: False, 2: True})
+        with mock.patch.object(presence.time, 'time', return_value=1200):
+            self.assertEqual(backend.sweep(), [2])
+
+    def test_redis_backend(self):
+        self.assert_sweeps_expired(RedisPresenceBackend(ttl=60))
+
+    def test_in_memory_backend(self):
+        self.assert_sweeps_expired(InMemoryPresenceBackend(ttl=60))
+
+
+class NotificationConsumerTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('ivan', 'ivan@example.com', PASSWORD)
+        self.other = User.objects.create_user('olivia', 'olivia@example.com', PASSWORD)
+
+    def communicator(self, token, path='/ws/accounts/notifications/', **kwargs):
+        kwargs.setdefault('headers', [(b'authorization', f'Bearer {token}'.encode())])
+        return WebsocketCommunicator(JWTAuthMiddleware(URLRouter(websocket_urlpatterns)), path, **kwargs)
+
+    async def connect(self, communicator):
+        connected, subprotocol = await communicator.connect()
+        self.assertTrue(connected)
+        self.assertEqual((await communicator.receive_json_from())['type'], 'connected')
+        return subprotocol
+
+    async def test_token_in_subprotocol(self):
+        # 헤더를 지정할 수 없는 브라우저는 Sec-WebSocket-Protocol로 토큰 전달
+        token = str(RefreshToken.for_user(self.user).access_token)
+        communicator = self.communicator(token, headers=[], subprotocols=['bearer', token])
+        self.assertEqual(await self.connect(communicator), 'bearer')
+        await communicator.disconnect()
+
+    async def test_query_string_token_rejected(self):
+        token = RefreshToken.for_user(self.user).access_token
+        communicator = self.communicator(token, f'/ws/accounts/notifications/?token={token}', headers=[])
+        connected, code = await communicator.connect()
+        self.assertFalse(connected)
+        self.assertEqual(code, 4401)
+
+    async def test_presence_subscription_requires_permission(self):
+        other = self.other
+        communicator = self.communicator(RefreshToken.for_user(self.user).access_token)
+        await self.connect(communicator)
+        await communicator.send_json_to({'type': 'presence.subscribe', 'user_ids': [other.pk, self.user.pk]})
+        error = await communicator.receive_json_from()
+        self.assertEqual((error['type'], error['user_ids']), ('error', [other.pk]))
+        # 허용된 본인 상태만 전달되고 다른 사용자의 접속 변경은 받지 않음
+        self.assertEqual(
+            await communicator.receive_json_from(), {'type': 'presence', 'user_id': self.user.pk, 'online': True}
+        )
+        await consumers.abroadcast_presence(other.pk, True)
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
+
+    async def test_staff_can_subscribe_to_anyone(self):
+        other = self.other
+        self.user.is_staff = True
+        await self.user.asave()
+        communicator = self.communicator(RefreshToken.for_user(self.user).access_token)
+        await self.connect(communicator)
+        await communicator.send_json_to({'type': 'presence.subscribe', 'user_ids': [other.pk]})
+        self.assertEqual(
+            await communicator.receive_json_from(), {'type': 'presence', 'user_id': other.pk, 'online': False}
+        )
+        await consumers.abroadcast_presence(other.pk, True)
+        self.assertEqual(
+            await communicator.receive_json_from(), {'type': 'presence', 'user_id': other.pk, 'online': True}
+        )
+        await communicator.disconnect()
+
+    async def test_closes_when_token_expires(self):
+        token = RefreshToken.for_user(self.user).access_token
+        token.set_exp(lifetime=timedelta(seconds=2))
+        communicator = self.communicator(token)
+        await self.connect(communicator)
+        started = time.monotonic()
+        self.assertEqual(await communicator.receive_output(timeout=5), {'type': 'websocket.close', 'code': 4401})
+        self.assertGreater(time.monotonic() - started, 0.5)
+        await communicator.disconnect()
+
+    async def test_sweeper_broadcasts_offline(self):
+        backend = InMemoryPresenceBackend(ttl=60)
+        with mock.patch.object(presence.time, 'time', return_value=1000):
+            backend.touch(self.user.pk, 'a')
+        layer = get_channel_layer()
+        channel = await layer.new_channel()
+        await layer.group_add(presence_group(self.user.pk), channel)
+        with mock.patch.object(consumers, 'get_presence', return_value=backend):
+            await consumers.PresenceSweeper().sweep()
+        self.assertEqual(
+            await layer.receive(channel),
+            {'type': 'presence.update', 'user_id': self.user.pk, 'online': False},
+        )
+
+
+def wait_until(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            raise AssertionError('조건이 시간 안에 충족되지 않았습니다.')
+        time.sleep(0.01)
+
+
+class TwoTierCacheTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(tiered_cache._stores)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.server = fakeredis.FakeServer()
+        self.first = open_two_tier_cache(self.server)
+        self.second = open_two_tier_cache(self.server)
+
+    def l1(self, backend, key):
+        return backend._store.l1.get(backend.make_key(key))
+
+    def test_invalidation_across_stores(self):
+        self.first.set('key', 1)
+        self.assertEqual(self.second.get('key'), 1)
+        self.assertEqual(self.l1(self.second, 'key'), 1)
+
+        self.first.set('key', 2)
+        wait_until(lambda: self.l1(self.second, 'key') is tiered_cache._MISSING)
+        self.assertEqual(self.second.get('key'), 2)
+
+        self.first.delete('key')
+        wait_until(lambda: self.l1(self.second, 'key') is tiered_cache._MISSING)
+        self.assertIsNone(self.second.get('key'))
+
+    def test_invalidated_read_not_filled(self):
+        self.first.set('key', 1)
+        key = self.second.make_key('key')
+        store = self.second._store
+        original_get = self.second._cache.get
+
+        def get_then_invalidate(*args, **kwargs):
+            # L2에서 읽은 직후(L1에 채우기 전) 다른 프로세스의 무효화가 도착한 경우
+            value = original_get(*args, **kwargs)
+            store._drop([key], 'remote')
+            return value
+
+        with mock.patch.object(self.second._cache, 'get', side_effect=get_then_invalidate):
+            self.assertEqual(self.second.get('key'), 1)
+        self.assertIs(self.l1(self.second, 'key'), tiered_cache._MISSING)
+
+    def test_unsubscribed_store_skips_l1(self):
+        self.second.set('key', 1)
+        self.second._cache.set(self.second.make_key('key'), 2, None)  # 무효화 메시지 없이 변경
+        self.assertEqual(self.second.get('key'), 1)
+        self.second._store.subscribed.clear()
+        try:
+            self.assertEqual(self.second.get('key'), 2)
+        finally:
+            self.second._store.subscribed.set()
+
+    def test_get_or_set_computes_once(self):
+        calls = []
+        started = threading.Barrier(6)
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.3)
+            return 'value'
+
+        results = []
+
+        def worker(backend):
+            started.wait()
+            results.append(backend.get_or_set('key', compute, 60))
+
+        threads = [
+            threading.Thread(target=worker, args=(backend,))
+            for backend in (self.first, self.first, self.first, self.second, self.second, self.second)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['value'] * 6)
+
+    def test_l1_values_are_copies(self):
+        self.first.set('key', [1])
+        self.first.get('key').append(2)
+        self.assertEqual(self.first.get('key'), [1])
+
+    def test_l1_bounded(self):
+        backend = open_two_tier_cache(self.server, L1_MAX_ENTRIES=3)
+        for i in range(10):
+            backend.set(f'key{i}', i)
+        self.assertEqual(len(backend._store.l1), 3)
+        self.assertEqual(backend.get_many(['key0', 'key9']), {'key0': 0, 'key9': 9})
+
+
+class InMemoryBackendTests(AccountsTestCase):
+    def test_local_tier_expiry(self):
+        tier = LocalTier(max_entries=2)
+        with mock.patch.object(tiered_cache.time, 'monotonic', return_value=100):
+            tier.set('a', 1, 10)
+            tier.set('b', 2, 10)
+            tier.set('c', 3, 10)
+            self.assertIs(tier.get('a'), tiered_cache._MISSING)
+            self.assertEqual(tier.get('b'), 2)
+        with mock.patch.object(tiered_cache.time, 'monotonic', return_value=110):
+            self.assertIs(tier.get('b'), tiered_cache._MISSING)
+
+    def test_availability_filter(self):
+        User.objects.create_user('judy', 'Judy@example.com', PASSWORD)
+        bloom = InMemoryAvailabilityFilter(capacity=1000)
+        self.assertFalse(bloom.is_ready())
+        bloom.add([('username', 'ignored')])  # 생성 전 추가는 무시
+        bloom.ensure_ready()
+        bloom.add([('username', 'kate')])
+        self.assertEqual(
+            bloom.might_contain([('username', 'judy'), ('email', 'judy@EXAMPLE.com'), ('username', 'kate')]),
+            [True, True, True],
+        )
+        self.assertEqual(bloom.might_contain([('username', 'ignored')]), [False])
+
+    def test_rate_limiter(self):
+        limiter = InMemoryRateLimiter()
+        with mock.patch('accounts.throttling.time.monotonic', return_value=100):
+            self.assertEqual(limiter.hit('ip', 2, 60), (True, 0.0))
+            self.assertEqual(limiter.hit('ip', 2, 60), (True, 0.0))
+            self.assertEqual(limiter.hit('ip', 2, 60), (False, 60))
+        with mock.patch('accounts.throttling.time.monotonic', return_value=160):
+            self.assertEqual(limiter.hit('ip', 2, 60), (True, 0.0))
+
+
+class UserExportTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', PASSWORD)
+        self.users = [
+            User.objects.create_user(f'user{i}', f'user{i}@example.com', PASSWORD) for i in range(5)
+        ]
+        self.url = reverse('accounts:user_export')
+
+    def export(self, user=None, **params):
+        token = RefreshToken.for_user(user or self.admin).access_token
+        return async_to_sync(self.aexport)(f'Bearer {token}', params)
+
+    async def aexport(self, authorization, params):
+        # 비동기 스트리밍 응답은 ASGI 클라이언트에서 읽음
+        response = await self.async_client.get(self.url, params, headers={'Authorization': authorization})
+        if not response.streaming:
+            return response, b''
+        return response, b''.join([chunk async for chunk in response.streaming_content])
+
+    def test_keyset_pages(self):
+        # 페이지마다 id > 마지막 id 조건으로 한 번씩 조회하고, 모든 사용자를 한 번씩만 내보냄
+        exporter = UserExporter('ndjson', page_size=2)
+        with self.assertNumQueries(4):
+            body = b''.join(exporter.stream())
+        ids = [json.loads(line)['id'] for line in body.decode().splitlines()]
+        self.assertEqual(ids, sorted(user.id for user in [self.admin, *self.users]))
+
+    def test_csv(self):
+        response, body = self.export(type='csv')
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(response['Cache-Control'], 'no-store')
+        rows = list(csv.reader(body.decode().splitlines()))
+        self.assertEqual(rows[0], ['id', 'username', 'email', 'user_type', 'phone_number', 'date_joined'])
+        self.assertEqual(len(rows), 1 + 1 + len(self.users))
+
+    def test_gzip(self):
+        response, body = self.export(type='ndjson', gzip='true')
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertTrue(response['Content-Disposition'].endswith('.ndjson.gz"'))
+        lines = gzip.decompress(body).decode().splitlines()
+        self.assertEqual(len(lines), 1 + len(self.users))
+
+    def test_since(self):
+        since = timezone.now() - timedelta(hours=1)
+        User.objects.filter(pk__in=[user.pk for user in self.users[1:]]).update(
+            modified_at=since - timedelta(hours=1)
+        )
+        response, body = self.export(type='ndjson', since=since.isoformat())
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual(sorted(row['id'] for row in rows), sorted([self.admin.id, self.users[0].id]))
+        self.assertIn('modified_at', rows[0])
+        self.assertLess(datetime.fromisoformat(response['X-Export-Watermark']), timezone.now())
+
+    def test_admin_only(self):
+        response, _ = self.export(self.users[0])
+        self.assertEqual(response.status_code, 403)
+
+    def test_schema(self):
+        # Serializer 없는 뷰로 문서에서 빠지지 않고 쿼리 파라미터가 선언되어야 함
+        schema = OpenAPISchemaGenerator(openapi.Info(title='RePlay', default_version='v1')).get_schema()
+        operation = next(path for url, path in schema['paths'].items() if url.endswith('/export/'))['get']
+        self.assertEqual([param['name'] for param in operation['parameters']], ['type', 'since', 'gzip'])
+
+
+class AvailabilityFilterTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        User.objects.create_user('judy', 'Judy@example.com', PASSWORD)
+        self.bloom = InMemoryAvailabilityFilter(capacity=1000)
+        patcher = mock.patch.object(availability, '_filter', self.bloom)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.url = reverse('accounts:availability')
+
+    def check(self, **params):
+        response = APIClient().get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_answers_from_db_until_ready(self):
+        # 첫 요청에서 전체 사용자로 필터를 만들지 않고 DB로 답한 뒤 백그라운드 생성만 시작
+        with mock.patch.object(self.bloom, 'build_in_background') as build:
+            self.assertEqual(self.check(username='judy', email='new@example.com'), {'username': False, 'email': True})
+        build.assert_called_once_with()
+        self.assertFalse(self.bloom.is_ready())
+
+    def test_absent_values_skip_db(self):
+        self.bloom.ensure_ready()
+        # 필터에 없는 아이디는 DB 조회 없이, 있을 수도 있는 이메일만 DB에서 확인
+        with self.assertNumQueries(1):
+            self.assertEqual(self.check(username='nobody', email='JUDY@example.com'), {'username': True, 'email': False})
+
+    def test_build_in_background_runs_once(self):
+        release = threading.Event()
+
+        def rebuild():
+            release.wait(2)
+            self.bloom.store(self.bloom.build_bits([('username', 'judy')])[0])
+
+        with mock.patch.object(self.bloom, 'rebuild', side_effect=rebuild) as mocked:
+            self.bloom.build_in_background()
+            self.bloom.build_in_background()
+            release.set()
+            wait_until(self.bloom.is_ready)
+        mocked.assert_called_once_with()
+        self.assertEqual(self.bloom.might_contain([('username', 'judy')]), [True])
+
+    def test_bit_positions(self):
+        digest = availability.item_digest('username', 'judy')
+        positions = list(bit_positions(digest, self.bloom.num_bits, self.bloom.num_hashes))
+        self.assertEqual(positions, list(self.bloom.positions('username', 'judy')))
+        self.assertEqual(len(positions), self.bloom.num_hashes)
+        self.assertTrue(all(0 <= bit < self.bloom.num_bits for bit in positions))
+
+
+class TokenDenylistTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('quinn', 'quinn@example.com', PASSWORD)
+        self.backends = [denylist.InMemoryDenylistBackend(), denylist.RedisDenylistBackend()]
+        patcher = mock.patch.object(denylist, 'get_redis', return_value=fakeredis.FakeRedis())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def use(self, backend):
+        return mock.patch.object(tokens, 'get_denylist', return_value=backend)
+
+    def assertDenied(self, token, denied=True):
+        if denied:
+            with self.assertRaises(TokenError):
+                AccessToken(str(token))
+        else:
+            AccessToken(str(token))
+
+    def test_revoke_user_same_second(self):
+        # 폐기 전에 발급된 토큰은 같은 초라도 거부하고, 폐기 직후 같은 초에 발급한 토큰은 허용
+        for backend in self.backends:
+            with self.subTest(backend=type(backend).__name__), self.use(backend):
+                now = datetime.now(dt_timezone.utc).replace(microsecond=100)
+                before = RefreshToken.for_user(self.user).access_token
+                before.set_iat(at_time=now)
+                backend.revoke_user(self.user.pk, revoked_at=(now - tokens.EPOCH) // timedelta(microseconds=1) + 1)
+                after = RefreshToken.for_user(self.user).access_token
+                after.set_iat(at_time=now.replace(microsecond=200))
+                self.assertEqual(before['iat'], after['iat'])
+                self.assertDenied(before)
+                self.assertDenied(after, denied=False)
+
+    def test_legacy_token_revoked_in_same_second(self):
+        # 마이크로초 클레임이 없는 이전 토큰은 발급된 초에 폐기되었으면 거부
+        for backend in self.backends:
+            with self.subTest(backend=type(backend).__name__), self.use(backend):
+                token = RefreshToken.for_user(self.user).access_token
+                del token[tokens.ISSUED_AT_US_CLAIM]
+                backend.revoke_user(self.user.pk, revoked_at=token['iat'] * 1_000_000 + 999_999)
+                self.assertDenied(token)
+
+    def test_deny_jti(self):
+        for backend in self.backends:
+            with self.subTest(backend=type(backend).__name__), self.use(backend):
+                token = RefreshToken.for_user(self.user)
+                other = RefreshToken.for_user(self.user)
+                token.blacklist()
+                with self.assertRaises(TokenError):
+                    RefreshToken(str(token))
+                RefreshToken(str(other))
+
+    def test_change_password_revokes_previous_tokens(self):
+        backend = self.backends[0]
+        with self.use(backend):
+            old = RefreshToken.for_user(self.user)
+            response = auth_client(self.user).put(reverse('accounts:change_password'), {
+                'old_password': PASSWORD,
+                'new_password': NEW_PASSWORD,
+                'confirm_new_password': NEW_PASSWORD,
+            }, format='json')
+            self.assertEqual(response.status_code, 200)
+            with self.assertRaises(TokenError):
+                RefreshToken(str(old))
+            # 같은 요청에서 새로 발급한 토큰은 폐기 시각 이후라 사용 가능
+            RefreshToken(response.data['token']['refresh'])
+            AccessToken(response.data['token']['access'])
+
+
+class AuditLogTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.spill_path = Path(directory.name) / 'audit_spill.jsonl'
+
+    def audit_log(self, **options):
+        log = AuditLog(spill_path=str(self.spill_path), flush_interval=0.05, **options)
+        # 테스트 트랜잭션 밖의 연결로 저장하지 않도록 DB 기록은 flush()로 직접 실행
+        patcher = mock.patch.object(log, '_ensure_started')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(log.stop)
+        return log
+
+    def event(self, username='rita'):
+        return {
+            'timestamp': timezone.now(), 'event_type': AuditEvent.LOGIN_SUCCESS, 'user_id': None,
+            'username': username, 'ip_address': '127.0.0.1', 'user_agent': '', 'data': {},
+        }
+
+    def spilled(self):
+        if not self.spill_path.exists():
+            return []
+        return [audit.event_from_json(line)['username'] for line in self.spill_path.read_text().splitlines()]
+
+    def test_flush_writes_queued_events(self):
+        log = self.audit_log()
+        log.emit(self.event('rita'))
+        log.emit(self.event('sam'))
+        log.flush()
+        self.assertEqual(sorted(AuditEvent.objects.values_list('username', flat=True)), ['rita', 'sam'])
+        self.assertEqual(log.events.value('written'), 2)
+
+    def test_overflow_spills_on_spill_thread(self):
+        # 큐가 가득 찼을 때 파일 기록은 emit()을 호출한 스레드(이벤트 루프)가 아니라 파일 기록 스레드에서 실행
+        log = self.audit_log(queue_size=1)
+        threads = []
+        spill = log.spill
+
+        def record_thread(events):
+            threads.append(threading.current_thread().name)
+            spill(events)
+
+        with mock.patch.object(log, 'spill', side_effect=record_thread):
+            for username in ('rita', 'sam', 'tom'):
+                log.emit(self.event(username))
+            wait_until(lambda: len(self.spilled()) == 2)
+        self.assertEqual(self.spilled(), ['sam', 'tom'])
+        self.assertEqual(set(threads), {'audit-spill'})
+        self.assertEqual((log.events.value('enqueued'), log.events.value('spilled')), (1, 2))
+
+    def test_overflow_drop(self):
+        log = self.audit_log(queue_size=1, overflow='drop')
+        log.emit(self.event('rita'))
+        log.emit(self.event('sam'))
+        self.assertEqual(log.events.value('dropped'), 1)
+        log.stop()
+        self.assertEqual(list(AuditEvent.objects.values_list('username', flat=True)), ['rita'])
+        self.assertEqual(self.spilled(), [])
+
+    def test_stop_drains_spill_queue(self):
+        log = self.audit_log(queue_size=1)
+        with mock.patch.object(log, '_ensure_spill_started'):
+            log.emit(self.event('rita'))
+            log.emit(self.event('sam'))
+        self.assertEqual(self.spilled(), [])
+        log.stop()
+        self.assertEqual(self.spilled(), ['sam'])
+        self.assertEqual(AuditEvent.objects.count(), 1)
+
+    def test_failed_write_spills_and_loads_back(self):
+        log = self.audit_log()
+        log.emit(self.event('rita'))
+        with mock.patch.object(AuditEvent.objects, 'bulk_create', side_effect=DatabaseError), \
+                self.assertLogs('accounts.audit', 'ERROR'):
+            log.flush()
+        self.assertEqual(self.spilled(), ['rita'])
+        call_command('load_audit_spill', path=str(self.spill_path), stdout=mock.Mock())
+        self.assertEqual(list(AuditEvent.objects.values_list('username', flat=True)), ['rita'])
+        self.assertFalse(self.spill_path.exists())
+
+
+class AsyncAccountsAPITests(AccountsTestCase):
+    """
+    ASGI(AsyncClient)에서 비동기 핸들러로 처리되는 가입/로그인/회원정보 API
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('uma', 'uma@example.com', PASSWORD)
+        self.authorization = f'Bearer {RefreshToken.for_user(self.user).access_token}'
+
+    def test_handlers_are_async(self):
+        for view, methods in (
+            (views.RegisterView, ('post',)),
+            (views.LoginView, ('post',)),
+            (views.UserProfileView, ('get', 'put', 'patch')),
+            (views.ChangePasswordView, ('put',)),
+        ):
+            for method in methods:
+                with self.subTest(view=view.__name__, method=method):
+                    self.assertTrue(asyncio.iscoroutinefunction(getattr(view, method)))
+
+    async def test_register_and_login(self):
+        response = await self.async_client.post(reverse('accounts:register'), {
+            'username': 'victor', 'email': 'victor@example.com', 'password': PASSWORD, 'password2': PASSWORD,
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            response.json(),
+            {'username': 'victor', 'email': 'victor@example.com', 'user_type': 'buyer', 'phone_number': None},
+        )
+
+        response = await self.async_client.post(
+            reverse('accounts:login'), {'username': 'victor', 'password': PASSWORD}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['user']['username'], 'victor')
+        self.assertEqual(set(data['token']), {'refresh', 'access'})
+
+    async def test_register_duplicate_username(self):
+        response = await self.async_client.post(reverse('accounts:register'), {
+            'username': 'uma', 'email': 'other@example.com', 'password': PASSWORD, 'password2': PASSWORD,
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('username', response.json())
+
+    async def test_profile_get_and_patch(self):
+        url = reverse('accounts:profile')
+        response = await self.async_client.get(url, headers={'Authorization': self.authorization})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['email'], 'uma@example.com')
+        etag = response['ETag']
+
+        response = await self.async_client.get(
+            url, headers={'Authorization': self.authorization, 'If-None-Match': etag}
+        )
+        self.assertEqual(response.status_code, 304)
+
+        response = await self.async_client.patch(
+            url, encode_multipart(BOUNDARY, {'user_type': 'seller'}),
+            content_type=MULTIPART_CONTENT, headers={'Authorization': self.authorization},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['user']['user_type'], 'seller')
+        self.assertNotEqual(response['ETag'], etag)
+        await self.user.arefresh_from_db()
+        self.assertEqual(self.user.user_type, 'seller')
+
+
+def image_bytes(fmt='PNG', size=(300, 200), mode='RGBA'):
+    buffer = io.BytesIO()
+    Image.new(mode, size, (255, 0, 0, 128) if mode == 'RGBA' else (255, 0, 0)).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+class ProfileImageTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        media = override_settings(MEDIA_ROOT=directory.name)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.storage = FileSystemStorage(location=directory.name)
+        self.user = User.objects.create_user('wendy', 'wendy@example.com', PASSWORD)
+        self.url = reverse('accounts:profile')
+
+    def upload(self, content, name='avatar.png'):
+        return auth_client(self.user).patch(self.url, {'profile_image': SimpleUploadedFile(name, content)})
+
+    def test_generate_renditions(self):
+        name = self.storage.save('profile_images/a.png', ContentFile(image_bytes()))
+        images.generate_renditions(name, self.storage)
+        for size in (64, 256, 1024):
+            for fmt, pil_format in (('webp', 'WEBP'), ('jpeg', 'JPEG')):
+                with self.subTest(size=size, fmt=fmt), self.storage.open(images.rendition_name(name, size, fmt)) as file:
+                    rendition = Image.open(file)
+                    self.assertEqual(rendition.format, pil_format)
+                    # 긴 변을 크기에 맞추되 원본보다 키우지 않음
+                    self.assertEqual(max(rendition.size), min(size, 300))
+        self.assertEqual(images.rendition_name(name, 64, 'jpeg'), 'profile_images/renditions/a_64.jpg')
+
+    def test_existing_renditions_skipped(self):
+        name = self.storage.save('profile_images/a.png', ContentFile(image_bytes()))
+        images.generate_renditions(name, self.storage)
+        with mock.patch.object(images.Image, 'open') as image_open:
+            images.generate_renditions(name, self.storage)
+        image_open.assert_not_called()
+
+    def test_upload_schedules_renditions(self):
+        with mock.patch.object(serializers_module, 'schedule_renditions') as schedule:
+            response = self.upload(image_bytes())
+        self.assertEqual(response.status_code, 200)
+        schedule.assert_called_once()
+        renditions = response.data['user']['profile_image_renditions']
+        self.assertEqual(set(renditions), {'64', '256', '1024'})
+        self.assertTrue(renditions['64']['webp'].endswith('_64.webp'))
+
+    def test_upload_rejects_non_image(self):
+        # 확장자가 아니라 첫 바이트로 형식 판별
+        response = self.upload(b'#!/bin/sh\necho hello\n' * 10)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('profile_image', response.data)
+
+    @override_settings(PROFILE_IMAGE_MAX_UPLOAD_SIZE=1024)
+    def test_upload_size_cap(self):
+        content = image_bytes(size=(256, 256), mode='RGB')
+        content += os.urandom(2048)
+        response = self.upload(content)
+        self.assertEqual(response.status_code, 413)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.profile_image)
+
+
+def throttle_settings(**rates):
+    return override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates})
+
+
+class ThrottleTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        User.objects.create_user('xavier', 'xavier@example.com', PASSWORD)
+
+    def login(self, username='xavier', password=PASSWORD, ip='10.0.0.1'):
+        return APIClient(REMOTE_ADDR=ip).post(
+            reverse('accounts:login'), {'username': username, 'password': password}, format='json'
+        )
+
+    @throttle_settings(**{'login.ip': '2/min'})
+    def test_login_ip_limit(self):
+        self.assertEqual(self.login().status_code, 200)
+        self.assertEqual(self.login(password=NEW_PASSWORD).status_code, 401)
+        response = self.login()
+        self.assertEqual(response.status_code, 429)
+        self.assertTrue(1 <= int(response['Retry-After']) <= 60)
+        # 다른 IP는 별도 카운터
+        self.assertEqual(self.login(ip='10.0.0.2').status_code, 200)
+
+    @throttle_settings(**{'login.username': '2/min'})
+    def test_login_username_limit_across_ips(self):
+        for ip in ('10.0.0.1', '10.0.0.2'):
+            self.assertEqual(self.login(password=NEW_PASSWORD, ip=ip).status_code, 401)
+        # 대소문자/공백이 달라도 같은 계정
+        self.assertEqual(self.login(username=' XAVIER ', ip='10.0.0.3').status_code, 429)
+        self.assertEqual(self.login(username='someone', ip='10.0.0.3').status_code, 401)
+
+    @throttle_settings(**{'login.ip': '1/min', 'login.route': '2/min'})
+    def test_denied_request_does_not_consume_route_limit(self):
+        self.assertEqual(self.login().status_code, 200)
+        for _ in range(3):
+            self.assertEqual(self.login().status_code, 429)
+        # IP 단위로 거부된 요청은 경로 전체 한도를 쓰지 않음
+        self.assertEqual(self.login(ip='10.0.0.2').status_code, 200)
+        self.assertEqual(self.login(ip='10.0.0.3').status_code, 429)
+
+    @throttle_settings(**{'register.ip': '1/hour', 'token_refresh.ip': '1/min'})
+    def test_register_and_refresh_limits(self):
+        url = reverse('accounts:register')
+        for username, status in (('yuri', 201), ('zoe', 429)):
+            response = APIClient().post(url, {
+                'username': username, 'email': f'{username}@example.com',
+                'password': PASSWORD, 'password2': PASSWORD,
+            }, format='json')
+            self.assertEqual(response.status_code, status, response.data)
+        self.assertIn('Retry-After', response)
+
+        refresh = str(RefreshToken.for_user(User.objects.get(username='xavier')))
+        url = reverse('accounts:token_refresh')
+        self.assertEqual(APIClient().post(url, {'refresh': refresh}, format='json').status_code, 200)
+        self.assertEqual(APIClient().post(url, {'refresh': refresh}, format='json').status_code, 429)
+
+    def test_redis_rate_limiter(self):
+        limiter = throttling.RedisRateLimiter()
+        with mock.patch.object(throttling, 'get_redis', return_value=fakeredis.FakeRedis()), \
+                mock.patch.object(throttling.time, 'time', return_value=1000):
+            self.assertEqual(limiter.hit('ip', 2, 60), (True, 0.0))
+            self.assertEqual(limiter.hit('ip', 2, 60), (True, 0.0))
+            self.assertEqual(limiter.hit('ip', 2, 60), (False, 60.0))
+            self.assertEqual(limiter.hit('other', 2, 60), (True, 0.0))
+
+
+class PrecomputedSchemaTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'openapi.json')
+        schema_path = override_settings(OPENAPI_SCHEMA_PATH=self.path)
+        schema_path.enable()
+        self.addCleanup(schema_path.disable)
+        patcher = mock.patch.object(schema, '_schema_cache', schema._SchemaCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_command_writes_schema(self):
+        call_command('build_openapi_schema', stdout=io.StringIO())
+        with open(self.path, 'rb') as schema_file:
+            document = json.load(schema_file)
+        self.assertIn('/login/', document['paths'])
+        self.assertFalse(os.path.exists(f'{self.path}.tmp'))
+
+    def test_etag_revalidation(self):
+        call_command('build_openapi_schema', stdout=io.StringIO())
+        with mock.patch.object(schema, 'generate_schema') as generate:
+            response = self.client.get(reverse('schema-json'))
+            self.assertEqual(response.status_code, 200)
+            with open(self.path, 'rb') as schema_file:
+                self.assertEqual(response.content, schema_file.read())
+            etag = response['ETag']
+            self.assertIn('no-cache', response['Cache-Control'])
+
+            response = self.client.get(reverse('schema-json'), headers={'If-None-Match': f'"other", {etag}'})
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response['ETag'], etag)
+            self.assertEqual(self.client.get(reverse('schema-swagger-ui'), {'format': 'openapi'}).status_code, 200)
+        # 요청 처리 중에는 스키마를 다시 분석하지 않음
+        generate.assert_not_called()
+
+        # 파일이 교체되면 새 내용과 ETag로 응답
+        with open(self.path, 'wb') as schema_file:
+            schema_file.write(b'{"paths": {}}')
+        os.utime(self.path, (time.time() + 10, time.time() + 10))
+        response = self.client.get(reverse('schema-json'), headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'{"paths": {}}')
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_missing_file_generated_once(self):
+        with mock.patch.object(schema, 'generate_schema', return_value=b'{}') as generate, \
+                self.assertLogs('RePlay.schema', 'WARNING'):
+            for _ in range(2):
+                self.assertEqual(self.client.get(reverse('schema-json')).content, b'{}')
+        generate.assert_called_once()
+
+    def test_post_not_allowed(self):
+        self.assertEqual(self.client.post(reverse('schema-json')).status_code, 405)
+
+
+@throttle_settings()
+class BenchmarkTests(AccountsTestCase):
+    def test_query_budgets(self):
+        # 벤치마크의 쿼리 수 예산을 테스트에서도 확인
+        counts = accounts_api.count_queries()
+        self.assertEqual(set(counts), set(accounts_api.ENDPOINTS))
+        for name, budget in accounts_api.QUERY_BUDGETS.items():
+            with self.subTest(endpoint=name):
+                self.assertLessEqual(counts[name], budget)
+
+    def test_load_flow(self):
+        latencies, errors, elapsed = async_to_sync(accounts_api.run_load)(clients=2, iterations=1)
+        self.assertEqual(errors, [])
+        self.assertEqual({name: len(values) for name, values in latencies.items()},
+                         dict.fromkeys(accounts_api.ENDPOINTS, 2))
+        self.assertGreater(elapsed, 0)
+
+    def test_summaries(self):
+        latencies = [i / 1000 for i in range(1, 101)]
+        summary = benchmark_common.summarize(latencies)
+        self.assertEqual(summary['count'], 100)
+        self.assertAlmostEqual(summary['p50_ms'], 50)
+        self.assertAlmostEqual(summary['p99_ms'], 99)
+        self.assertEqual(benchmark_common.percentile([], 50), 0.0)
+
+        rates = benchmark_common.summarize_rates([90.0, 100.0, 110.0])
+        self.assertAlmostEqual(rates['req/s'], 100)
+        self.assertAlmostEqual(rates['cv_%'], 10)
+        self.assertEqual((rates['min'], rates['max']), (90.0, 110.0))
+
+
+def instrumentation_settings(**options):
+    return override_settings(INSTRUMENTATION={**settings.INSTRUMENTATION, 'ENABLED': True, **options})
+
+
+class InstrumentationTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.registry = instrumentation.MetricsRegistry(instrumentation.DEFAULT_INSTRUMENTATION_SETTINGS['BUCKETS'])
+        patcher = mock.patch.object(instrumentation, '_registry', self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        User.objects.create_user('yvonne', 'yvonne@example.com', PASSWORD)
+
+    def login(self):
+        return self.client.post(
+            reverse('accounts:login'), {'username': 'yvonne', 'password': PASSWORD}, content_type='application/json'
+        )
+
+    @instrumentation_settings(SLOW_REQUEST_THRESHOLD_MS=0)
+    def test_server_timing_and_metrics(self):
+        response = self.login()
+        self.assertEqual(response.status_code, 200)
+        phases = {entry.split(';')[0] for entry in response['Server-Timing'].split(', ')}
+        self.assertTrue({'sql', 'hash', 'jwt', 'total'} <= phases, phases)
+
+        metrics = self.client.get(reverse('metrics')).content.decode()
+        self.assertIn(
+            'replay_request_duration_seconds_count{view="accounts:login",method="POST",status="200"} 1', metrics
+        )
+        self.assertIn('replay_request_phase_seconds_count{view="accounts:login",phase="hash"} 1', metrics)
+
+    @instrumentation_settings(SLOW_REQUEST_THRESHOLD_MS=0.001)
+    def test_slow_request_logged(self):
+        with self.assertLogs('accounts.instrumentation', 'WARNING') as logs:
+            self.login()
+        self.assertIn('POST /api/accounts/login/', logs.output[0])
+        self.assertIn('hash=', logs.output[0])
+
+    @instrumentation_settings(SERVER_TIMING=False, SLOW_REQUEST_THRESHOLD_MS=0)
+    def test_server_timing_disabled(self):
+        self.assertNotIn('Server-Timing', self.login())
+        self.assertEqual(self.registry.request_duration._series[('accounts:login', 'POST', '200')][2], 1)
+
+    def test_disabled(self):
+        # 기본 설정(꺼짐)에서는 Middleware 체인에서 제외됨
+        self.assertNotIn('Server-Timing', self.login())
+        self.assertEqual(self.registry.request_duration._series, {})
+
+    def test_metrics_allowed_ips(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 200)
+        self.assertEqual(self.client.get(reverse('metrics'), REMOTE_ADDR='203.0.113.1').status_code, 403)
+
+    def test_histogram_render(self):
+        histogram = instrumentation.Histogram('latency', 'help', ('view',), (0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, 'a"b')
+        self.assertEqual(histogram.render().splitlines()[2:], [
+            'latency_bucket{view="a\\"b",le="0.1"} 1',
+            'latency_bucket{view="a\\"b",le="1.0"} 2',
+            'latency_bucket{view="a\\"b",le="+Inf"} 3',
+            'latency_sum{view="a\\"b"} 5.55',
+            'latency_count{view="a\\"b"} 3',
+        ])
+
+
+class APIMiddlewareTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        User.objects.create_superuser('zack', 'zack@example.com', PASSWORD)
+        self.client = Client(enforce_csrf_checks=True)
+
+    def test_api_skips_session_and_csrf(self):
+        response = self.client.post(
+            reverse('accounts:login'), {'username': 'zack', 'password': PASSWORD}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.cookies, {})
+        self.assertNotIn('Cookie', response.get('Vary', ''))
+
+    def test_admin_keeps_session_and_csrf(self):
+        url = reverse('admin:login')
+        self.assertIn('csrftoken', self.client.get(url).cookies)
+        self.assertEqual(self.client.post(url, {'username': 'zack', 'password': PASSWORD}).status_code, 403)
+
+        token = self.client.get(url).cookies['csrftoken'].value
+        response = self.client.post(url, {'username': 'zack', 'password': PASSWORD, 'csrfmiddlewaretoken': token})
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(settings.SESSION_COOKIE_NAME, response.cookies)
+
+    def test_request_attributes(self):
+        factory = RequestFactory()
+        middleware = RePlayAuthenticationMiddleware(lambda request: request)
+        session_middleware = RePlaySessionMiddleware(middleware)
+        api_request = session_middleware(factory.get('/api/accounts/profile/'))
+        self.assertFalse(hasattr(api_request, 'session'))
+        self.assertFalse(hasattr(api_request, 'user'))
+        admin_request = session_middleware(factory.get('/admin/'))
+        self.assertTrue(hasattr(admin_request, 'session'))
+        self.assertFalse(admin_request.user.is_authenticated)
+
+
+class HasherCalibrationTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'password_hashers.json')
+
+    def calibrate(self, iterations):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump({'hashers': {'pbkdf2_sha256': {'iterations': iterations}}}, file)
+        calibration = override_settings(PASSWORD_HASHER_CALIBRATION_PATH=self.path)
+        calibration.enable()
+        self.addCleanup(calibration.disable)
+
+    def test_command_writes_config(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command(
+            'calibrate_hashers', '--hashers', 'pbkdf2_sha256', 'scrypt', '--target-ms', '1', '--samples', '1',
+            '--output', self.path, stdout=stdout, stderr=stderr,
+        )
+        with open(self.path, encoding='utf-8') as file:
+            config = json.load(file)
+        self.assertEqual(config['target_ms'], 1)
+        self.assertEqual(set(config['hashers']), {'pbkdf2_sha256', 'scrypt'})
+        # 1ms 목표는 Django 기본값보다 낮으므로 기본값을 하한으로 사용
+        self.assertEqual(config['hashers']['pbkdf2_sha256']['iterations'], django_hashers.PBKDF2PasswordHasher.iterations)
+        self.assertEqual(config['hashers']['scrypt']['work_factor'], django_hashers.ScryptPasswordHasher.work_factor)
+        self.assertIn('Django 기본값보다 낮아', stderr.getvalue())
+
+        call_command(
+            'calibrate_hashers', '--hashers', 'pbkdf2_sha256', '--target-ms', '1', '--samples', '1',
+            '--allow-below-default', '--output', self.path, stdout=stdout,
+        )
+        with open(self.path, encoding='utf-8') as file:
+            iterations = json.load(file)['hashers']['pbkdf2_sha256']['iterations']
+        self.assertLess(iterations, django_hashers.PBKDF2PasswordHasher.iterations)
+        self.assertEqual(iterations % 1000, 0)
+
+    def test_calibrated_hasher(self):
+        self.calibrate(1000)
+        hasher = django_hashers.get_hasher('default')
+        self.assertEqual(hasher.algorithm, 'pbkdf2_sha256')
+        self.assertEqual(hasher.iterations, 1000)
+        self.assertTrue(django_hashers.make_password(PASSWORD).startswith('pbkdf2_sha256$1000$'))
+
+    def test_login_rehashes_outdated_password(self):
+        self.calibrate(1000)
+        user = User.objects.create_user('abby', 'abby@example.com', PASSWORD)
+        self.calibrate(2000)
+        response = APIClient().post(
+            reverse('accounts:login'), {'username': 'abby', 'password': PASSWORD}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$2000$'))
+        self.assertTrue(user.check_password(PASSWORD))
+
+    def test_password_hash_report(self):
+        self.calibrate(1000)
+        User.objects.create_user('beth', 'beth@example.com', PASSWORD)
+        User.objects.create_user('cody', 'cody@example.com', None)
+        self.calibrate(2000)
+        User.objects.create_user('dina', 'dina@example.com', PASSWORD)
+
+        stdout = io.StringIO()
+        call_command('password_hash_report', stdout=stdout)
+        output = stdout.getvalue()
+        self.assertIn('pbkdf2_sha256 [iterations=1000]: 1명 (갱신 필요)', output)
+        self.assertIn('pbkdf2_sha256 [iterations=2000]: 1명 (최신)', output)
+        self.assertIn('사용할 수 없는 비밀번호: 1명', output)
+        self.assertIn('전체 2명 중 1명(50.0%)', output)
+
+
+class PublicProfileTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user('erin', 'erin@example.com', PASSWORD)
+        self.users = [User.objects.create_user(f'member{i}', f'member{i}@example.com', PASSWORD) for i in range(3)]
+        self.inactive = User.objects.create_user('gone', 'gone@example.com', PASSWORD, is_active=False)
+        self.url = reverse('accounts:public_profiles')
+
+    def fetch(self, ids, client=None):
+        return (client or auth_client(self.viewer)).get(self.url, {'ids': ids})
+
+    def test_batch_lookup(self):
+        ids = [self.users[2].pk, self.inactive.pk, 999999, self.users[0].pk, self.users[2].pk]
+        response = self.fetch(','.join(map(str, ids)))
+        self.assertEqual(response.status_code, 200)
+        # 요청 순서 유지, 중복/없는/비활성 사용자 제외
+        self.assertEqual([user['id'] for user in response.data['results']], [self.users[2].pk, self.users[0].pk])
+        self.assertEqual(
+            set(response.data['results'][0]),
+            {'id', 'username', 'user_type', 'profile_image', 'profile_image_renditions'},
+        )
+
+    def test_single_query_then_cached(self):
+        ids = [user.pk for user in self.users] + [self.inactive.pk, 999999]
+        with CaptureQueriesContext(connection) as queries:
+            users = async_to_sync(aget_public_users)(ids)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('password', queries[0]['sql'])
+        self.assertEqual(set(users), {user.pk for user in self.users})
+        # 공개 필드 외의 값을 읽지 않으므로 직렬화 중 추가 쿼리 없음
+        with self.assertNumQueries(0):
+            PublicUserSerializer(list(users.values()), many=True).data
+            # 없는 사용자도 캐시되므로 다시 조회하지 않음
+            self.assertEqual(async_to_sync(aget_public_users)(ids), users)
+
+    def test_profile_update_invalidates(self):
+        client = auth_client(self.users[0])
+        self.assertEqual(self.fetch(str(self.users[0].pk)).data['results'][0]['user_type'], 'buyer')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.patch(reverse('accounts:profile'), {'user_type': 'seller'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.fetch(str(self.users[0].pk)).data['results'][0]['user_type'], 'seller')
+
+        user_id = self.users[0].pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users[0].delete()
+        self.assertEqual(self.fetch(str(user_id)).data['results'], [])
+
+    def test_lru_cache(self):
+        lru = LRUCache(max_size=2, timeout=60)
+        with mock.patch('accounts.cache.time.monotonic', return_value=100):
+            lru.set_many({1: 'a', 2: 'b'})
+            self.assertEqual(lru.get_many([1]), {1: 'a'})
+            lru.set_many({3: 'c'})
+            # 최근에 조회한 1은 남고 2가 밀려남
+            self.assertEqual(lru.get_many([1, 2, 3]), {1: 'a', 3: 'c'})
+        with mock.patch('accounts.cache.time.monotonic', return_value=160):
+            self.assertEqual(lru.get_many([1, 3]), {})
+
+    @override_settings(ACCOUNTS_PUBLIC_PROFILE_BATCH_SIZE=2)
+    def test_invalid_ids(self):
+        for ids in ('', 'a,b', '1,2,3'):
+            with self.subTest(ids=ids):
+                self.assertEqual(self.fetch(ids).status_code, 400)
+        self.assertEqual(self.fetch('1', client=APIClient()).status_code, 401)
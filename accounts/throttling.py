@@ -0,0 +1,177 @@
+import collections
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from .redis_client import get_redis
+
+# 슬라이딩 윈도우(요청 시각 로그) 검사와 기록을 원자적으로 수행하는 Lua 스크립트
+# KEYS[1]: 카운터 키 / ARGV: 현재 시각(ms), 윈도우(ms), 허용 횟수, 요청 식별자
+# 반환값: {허용 여부(1/0), 다시 시도까지 남은 시간(ms)}
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    return {1, 0}
+end
+
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, tonumber(oldest[2]) + window - now}
+"""
+
+
+class RedisRateLimiter:
+    """
+    Redis 기반 슬라이딩 윈도우 카운터
+    여러 워커가 같은 카운터를 공유하며, DB 쓰기 없이 Lua 스크립트 한 번으로 검사와 기록을 끝냅니다.
+    """
+
+    def __init__(self, prefix='accounts:throttle'):
+        self.prefix = prefix
+        self._script = None
+
+    def hit(self, key, limit, window):
+        """
+        요청을 기록하고 (허용 여부, 다시 시도까지 남은 초) 반환
+        """
+        if self._script is None:
+            self._script = get_redis().register_script(SLIDING_WINDOW_SCRIPT)
+        allowed, retry_after_ms = self._script(
+            keys=[f'{self.prefix}:{key}'],
+            args=[int(time.time() * 1000), int(window * 1000), limit, uuid.uuid4().hex],
+        )
+        return bool(allowed), int(retry_after_ms) / 1000
+
+
+class InMemoryRateLimiter:
+    """
+    프로세스 메모리 기반 슬라이딩 윈도우 카운터 (테스트 및 Redis 없는 로컬 개발용)
+    """
+
+    def __init__(self):
+        self._hits = collections.defaultdict(collections.deque)
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, window):
+        now = time.monotonic()
+        with self._lock:
+            hits = self._hits[key]
+            while hits and hits[0] <= now - window:
+                hits.popleft()
+            if len(hits) < limit:
+                hits.append(now)
+                return True, 0.0
+            return False, hits[0] + window - now
+
+    def clear(self):
+        with self._lock:
+            self._hits.clear()
+
+
+def parse_rate(rate):
+    """
+    '요청 수/기간' 형식의 제한을 (요청 수, 윈도우 초)로 변환 (DRF의 SimpleRateThrottle과 같은 형식)
+    """
+    num, period = rate.split('/')
+    return int(num), {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[period[0]]
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    RATE_LIMIT 설정의 카운터 백엔드 인스턴스 반환
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                options = getattr(settings, 'RATE_LIMIT', {})
+                limiter_class = import_string(
+                    options.get('BACKEND', 'accounts.throttling.InMemoryRateLimiter')
+                )
+                _limiter = limiter_class(**options.get('OPTIONS', {}))
+    return _limiter
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    슬라이딩 윈도우 스로틀 기본 클래스
+    뷰의 throttle_scope와 하위 클래스의 scope_suffix로 제한 이름(예: 'login.ip')을 만들고,
+    DEFAULT_THROTTLE_RATES에서 해당 이름의 제한을 읽습니다. 제한이 없으면 검사하지 않습니다.
+    """
+    scope_suffix = None
+
+    def get_ident_key(self, request, view):
+        """
+        제한 대상을 식별하는 값 (None이면 검사하지 않음)
+        """
+        raise NotImplementedError('.get_ident_key() must be overridden')
+
+    def allow_request(self, request, view):
+        scope = getattr(view, 'throttle_scope', None)
+        if not scope:
+            return True
+
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(f'{scope}.{self.scope_suffix}')
+        if rate is None:
+            return True
+
+        ident = self.get_ident_key(request, view)
+        if ident is None:
+            return True
+
+        limit, window = parse_rate(rate)
+        allowed, self.retry_after = get_rate_limiter().hit(
+            f'{scope}.{self.scope_suffix}:{ident}', limit, window
+        )
+        return allowed
+
+    def wait(self):
+        return self.retry_after
+
+
+class IPRateThrottle(SlidingWindowThrottle):
+    """
+    클라이언트 IP 단위 제한
+    """
+    scope_suffix = 'ip'
+
+    def get_ident_key(self, request, view):
+        return self.get_ident(request)
+
+
+class UsernameRateThrottle(SlidingWindowThrottle):
+    """
+    요청 본문의 아이디 단위 제한 (여러 IP에서 한 계정을 노리는 공격 차단)
+    """
+    scope_suffix = 'username'
+
+    def get_ident_key(self, request, view):
+        username = request.data.get('username') if hasattr(request.data, 'get') else None
+        if not isinstance(username, str) or not username:
+            return None
+        return username.strip().lower()
+
+
+class RouteRateThrottle(SlidingWindowThrottle):
+    """
+    경로 전체 제한 (분산 공격 시 해싱 CPU 사용량 상한)
+    """
+    scope_suffix = 'route'
+
+    def get_ident_key(self, request, view):
+        return 'all'
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from .denylist import get_denylist
+from .instrumentation import timed
+
+# 발급 시각(epoch 마이크로초) 클레임
+# iat는 초 단위라 사용자 토큰 폐기 직후 같은 초에 발급한 새 토큰과 폐기 전 토큰을 구분할 수 없음
+ISSUED_AT_US_CLAIM = 'iat_us'
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class DenylistMixin:
+    """
+    denylist를 확인하는 토큰 Mixin
+    simplejwt의 DB 기반 blacklist 앱 대신 jti/사용자 단위 denylist를 사용합니다.
+    """
+
+    def verify(self, *args, **kwargs):
+        super().verify(*args, **kwargs)
+        self.check_denylist()
+
+    def set_iat(self, claim='iat', at_time=None):
+        super().set_iat(claim, at_time)
+        if claim == 'iat':
+            at_time = at_time or self.current_time
+            self.payload[ISSUED_AT_US_CLAIM] = (at_time - EPOCH) // timedelta(microseconds=1)
+
+    def issued_at_us(self):
+        issued_at = self.payload.get(ISSUED_AT_US_CLAIM)
+        if issued_at is not None:
+            return issued_at
+        # 클레임이 없는 이전 토큰은 발급된 초의 시작 시각으로 간주 (같은 초에 폐기되었으면 거부)
+        iat = self.payload.get('iat')
+        return iat * 1_000_000 if iat is not None else None
+
+    def check_denylist(self):
+        if get_denylist().is_denied(
+            self.payload.get(api_settings.JTI_CLAIM),
+            self.payload.get(api_settings.USER_ID_CLAIM),
+            self.issued_at_us(),
+        ):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        """
+        토큰을 만료 시각까지 거부 목록에 추가
+        (BLACKLIST_AFTER_ROTATION 설정 시 TokenRefreshSerializer가 로테이션 직전에 호출)
+        """
+        get_denylist().deny(self.payload[api_settings.JTI_CLAIM], self.payload['exp'])
+
+
+class SigningTimingMixin:
+    """
+    토큰 서명(인코딩) 시간을 요청 계측에 기록하는 Mixin
+    """
+
+    def __str__(self):
+        with timed('jwt'):
+            return super().__str__()
+
+
+class AccessToken(SigningTimingMixin, DenylistMixin, tokens.AccessToken):
+    pass
+
+
+class RefreshToken(SigningTimingMixin, DenylistMixin, tokens.RefreshToken):
+    access_token_class = AccessToken
+
+
+def revoke_user_tokens(user):
+    """
+    사용자에게 지금까지 발급된 모든 토큰을 폐기
+    """
+    get_denylist().revoke_user(user.pk)
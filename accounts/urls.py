@@ -1,5 +1,4 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenRefreshView
 from . import views
 
 app_name = 'accounts'
@@ -8,15 +7,27 @@ urlpatterns = [
     # 회원가입
     path('register/', views.RegisterView.as_view(), name='register'),
     
+    # 아이디/이메일 사용 가능 여부
+    path('availability/', views.AvailabilityView.as_view(), name='availability'),
+    
     # 로그인
     path('login/', views.LoginView.as_view(), name='login'),
     
     # 토큰 갱신
-    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('token/refresh/', views.TokenRefreshView.as_view(), name='token_refresh'),
     
     # 회원정보 조회 및 수정
     path('profile/', views.UserProfileView.as_view(), name='profile'),
     
+    # 공개 프로필 일괄 조회
+    path('users/', views.PublicProfileListView.as_view(), name='public_profiles'),
+    
     # 비밀번호 변경
     path('change-password/', views.ChangePasswordView.as_view(), name='change_password'),
+    
+    # 사용자 목록 내보내기 (관리자 전용)
+    path('export/', views.UserExportView.as_view(), name='user_export'),
+    
+    # 감사 이벤트 조회
+    path('audit-events/', views.AuditEventListView.as_view(), name='audit_events'),
 ]
@@ -0,0 +1,75 @@
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.password_validation import CommonPasswordValidator
+from django.core.exceptions import ValidationError
+
+from .bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# 필터 파일 교체 여부를 확인하는 간격 (초)
+RELOAD_CHECK_INTERVAL = 5
+
+_filters = {}
+_filters_lock = threading.Lock()
+
+
+def get_password_filter(path):
+    """
+    프로세스별로 한 번만 메모리 맵으로 연 필터 반환
+    build_password_filter로 파일이 교체되면(inode 변경) RELOAD_CHECK_INTERVAL 안에 다시 엽니다.
+    파일이 없으면 None을 반환합니다.
+    """
+    now = time.monotonic()
+    entry = _filters.get(path)
+    if entry is not None and now < entry[1]:
+        return entry[0]
+
+    with _filters_lock:
+        try:
+            inode = os.stat(path).st_ino
+        except FileNotFoundError:
+            bloom = None
+        else:
+            bloom = entry[0] if entry is not None else None
+            if bloom is None or bloom.inode != inode:
+                bloom = BloomFilter(path)
+        _filters[path] = (bloom, now + RELOAD_CHECK_INTERVAL)
+    return bloom
+
+
+class BreachedPasswordValidator:
+    """
+    유출된 비밀번호 목록(Bloom 필터)에 포함된 비밀번호를 거부하는 검사기
+    필터 파일은 build_password_filter 명령으로 미리 생성합니다.
+    필터 파일이 없으면 Django의 CommonPasswordValidator로 대신 검사합니다.
+    """
+
+    def __init__(self, filter_path=None):
+        self.filter_path = os.fspath(filter_path or settings.BREACHED_PASSWORD_FILTER['PATH'])
+        self._fallback = None
+
+    def validate(self, password, user=None):
+        bloom = get_password_filter(self.filter_path)
+        if bloom is None:
+            self.get_fallback().validate(password, user)
+            return
+        # 흔한 비밀번호 목록은 소문자로 저장되어 있으므로 CommonPasswordValidator와 같이 정규화한 값도 확인
+        if bloom.contains_password(password) or bloom.contains_password(password.lower().strip()):
+            raise ValidationError(
+                '유출된 적이 있는 비밀번호입니다. 다른 비밀번호를 사용해주세요.',
+                code='password_breached',
+            )
+
+    def get_fallback(self):
+        if self._fallback is None:
+            logger.warning('유출 비밀번호 필터 파일이 없어 기본 목록으로 검사합니다: %s', self.filter_path)
+            self._fallback = CommonPasswordValidator()
+        return self._fallback
+
+    def get_help_text(self):
+        return '유출된 적이 있는 비밀번호는 사용할 수 없습니다.'
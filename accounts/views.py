@@ -1,44 +1,97 @@
+from django.contrib.auth import aauthenticate
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth import authenticate
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework_simplejwt.views import TokenRefreshView as BaseTokenRefreshView
+from asgiref.sync import sync_to_async
+from .activity import record_login
+from .audit import audit, audit_events, encode_cursor
+from .availability import check_availability
+from .cache import aget_cached_profile, aget_public_users, aset_cached_profile
+from .export import UserExporter
+from .images import ProfileImageUploadHandler
+from .mixins import AsyncAPIViewMixin, SequentialThrottleMixin
+from .notifications import arevoke_user_connections
+from .throttling import IPRateThrottle, RouteRateThrottle, UsernameRateThrottle
+from .tokens import RefreshToken, revoke_user_tokens
 from .serializers import UserSerializer, RegisterSerializer, LoginSerializer, UpdateUserSerializer, ChangePasswordSerializer
+from .serializers import PublicUserSerializer, PublicProfileQuerySerializer, AvailabilityQuerySerializer
+from .serializers import AuditEventSerializer, AuditEventQuerySerializer, UserExportQuerySerializer
+from .models import AuditEvent
 from rest_framework import permissions
 from rest_framework.parsers import MultiPartParser, FormParser
 
 # Create your views here.
 
-class RegisterView(generics.CreateAPIView):
+class RegisterView(SequentialThrottleMixin, AsyncAPIViewMixin, generics.GenericAPIView):
     """
     회원가입 View
     """
     permission_classes = (AllowAny,)
     serializer_class = RegisterSerializer
+    throttle_classes = (IPRateThrottle, RouteRateThrottle)
+    throttle_scope = 'register'
 
-class LoginView(generics.GenericAPIView):
+    async def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        await serializer.ais_valid(raise_exception=True)
+        await serializer.asave()
+        audit(AuditEvent.REGISTER, request, user=serializer.instance)
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+class AvailabilityView(SequentialThrottleMixin, AsyncAPIViewMixin, generics.GenericAPIView):
+    """
+    아이디/이메일 사용 가능 여부 조회 View
+    회원가입 입력 중 확인용으로, 사용 중인 값의 Bloom 필터에 없으면 DB 조회 없이 응답합니다.
+    """
+    permission_classes = (AllowAny,)
+    serializer_class = AvailabilityQuerySerializer
+    throttle_classes = (IPRateThrottle, RouteRateThrottle)
+    throttle_scope = 'availability'
+
+    async def get(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        items = list(serializer.validated_data.items())
+        return Response(await sync_to_async(check_availability)(items))
+
+class LoginView(SequentialThrottleMixin, AsyncAPIViewMixin, generics.GenericAPIView):
     """
     로그인 View
     """
     permission_classes = (AllowAny,)
     serializer_class = LoginSerializer
+    throttle_classes = (IPRateThrottle, UsernameRateThrottle, RouteRateThrottle)
+    throttle_scope = 'login'
 
-    def post(self, request):
+    async def post(self, request):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        user = authenticate(
+        user = await aauthenticate(
+            request,
             username=serializer.validated_data['username'],
             password=serializer.validated_data['password']
         )
         
         if user is None:
+            audit(AuditEvent.LOGIN_FAILURE, request, username=serializer.validated_data['username'])
             return Response(
                 {"error": "아이디 또는 비밀번호가 올바르지 않습니다."},
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
+        # 로그인 시각은 요청마다 저장하지 않고 버퍼를 거쳐 일괄 저장
+        await sync_to_async(record_login)(user.pk)
+        audit(AuditEvent.LOGIN_SUCCESS, request, user=user)
         refresh = RefreshToken.for_user(user)
         
         return Response({
@@ -49,31 +102,102 @@ class LoginView(generics.GenericAPIView):
             }
         })
 
-class UserProfileView(generics.RetrieveUpdateAPIView):
+class TokenRefreshView(SequentialThrottleMixin, BaseTokenRefreshView):
+    """
+    토큰 갱신 View
+    """
+    throttle_classes = (IPRateThrottle, RouteRateThrottle)
+    throttle_scope = 'token_refresh'
+
+class UserProfileView(AsyncAPIViewMixin, generics.GenericAPIView):
     """
     회원정보 조회 및 수정 View
     """
     permission_classes = (IsAuthenticated,)
     serializer_class = UpdateUserSerializer
     parser_classes = (MultiPartParser, FormParser)
+
+    def initialize_request(self, request, *args, **kwargs):
+        # 프로필 이미지는 크기 제한과 형식 검사를 하면서 디스크로 스트리밍
+        request.upload_handlers = [ProfileImageUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
     
     def get_object(self):
         return self.request.user
+
+    def get_profile_headers(self, user):
+        """
+        회원정보 버전 기반 조건부 요청 헤더
+        """
+        return {
+            'ETag': quote_etag(f'{user.pk}-{user.version}'),
+            'Last-Modified': http_date(user.modified_at.timestamp()),
+            'Cache-Control': 'private, no-cache',
+            'Vary': 'Authorization',
+        }
+
+    async def get(self, request, *args, **kwargs):
+        user = self.get_object()
+        headers = self.get_profile_headers(user)
+
+        # 회원정보가 바뀌지 않았으면 직렬화 없이 304 응답
+        not_modified = get_conditional_response(
+            request, etag=headers['ETag'], last_modified=int(user.modified_at.timestamp())
+        )
+        if not_modified is not None:
+            for name, value in headers.items():
+                not_modified[name] = value
+            return not_modified
+
+        base_url = request.build_absolute_uri('/')
+        data = await aget_cached_profile(user, base_url)
+        if data is None:
+            data = self.get_serializer(user).data
+            await aset_cached_profile(user, data, base_url)
+        return Response(data, headers=headers)
+
+    async def put(self, request, *args, **kwargs):
+        return await self.update(request, *args, **kwargs)
+
+    async def patch(self, request, *args, **kwargs):
+        kwargs['partial'] = True
+        return await self.update(request, *args, **kwargs)
     
-    def update(self, request, *args, **kwargs):
+    async def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
-        serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
+        await serializer.ais_valid(raise_exception=True)
+        await serializer.asave()
+        audit(AuditEvent.PROFILE_UPDATE, request, user=instance, fields=sorted(serializer.validated_data))
         
+        # 저장 시 회원정보 버전이 올라가므로 이전 버전의 프로필 캐시는 더 이상 사용되지 않음
         return Response({
             "message": "회원정보가 성공적으로 수정되었습니다.",
             "user": serializer.data
-        })
+        }, headers=self.get_profile_headers(serializer.instance))
 
 
-class ChangePasswordView(generics.UpdateAPIView):
+class PublicProfileListView(AsyncAPIViewMixin, generics.GenericAPIView):
+    """
+    공개 프로필 일괄 조회 View
+    채팅/목록 화면에서 여러 사용자의 공개 정보를 한 번에 조회합니다. (GET ?ids=1,2,3)
+    결과는 요청한 id 순서이며, 없거나 비활성화된 사용자는 제외됩니다.
+    """
+    permission_classes = (IsAuthenticated,)
+    serializer_class = PublicUserSerializer
+
+    async def get(self, request, *args, **kwargs):
+        query = PublicProfileQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        user_ids = query.validated_data['ids']
+
+        users = await aget_public_users(user_ids)
+        found = [users[user_id] for user_id in user_ids if user_id in users]
+        return Response({'results': self.get_serializer(found, many=True).data})
+
+
+class ChangePasswordView(AsyncAPIViewMixin, generics.GenericAPIView):
     """
     비밀번호 변경 View
     """
@@ -83,12 +207,23 @@ class ChangePasswordView(generics.UpdateAPIView):
     def get_object(self):
         return self.request.user
 
-    def update(self, request, *args, **kwargs):
+    async def put(self, request, *args, **kwargs):
+        return await self.update(request, *args, **kwargs)
+
+    async def patch(self, request, *args, **kwargs):
+        return await self.update(request, *args, **kwargs)
+
+    async def update(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+        # 현재 비밀번호 확인(해싱)만 해싱 풀에서 수행
+        await serializer.ais_valid(raise_exception=True)
+        await serializer.asave()
         
-        # 비밀번호가 변경되면 기존 토큰 무효화를 위해 새로운 토큰 발급
+        # 비밀번호가 변경되면 기존에 발급된 토큰을 모두 폐기하고 새로운 토큰 발급
+        await sync_to_async(revoke_user_tokens)(request.user)
+        await sync_to_async(request.auth.blacklist)()
+        await arevoke_user_connections(request.user.pk)
+        audit(AuditEvent.PASSWORD_CHANGE, request, user=request.user)
         refresh = RefreshToken.for_user(request.user)
         
         return Response({
@@ -98,3 +233,63 @@ class ChangePasswordView(generics.UpdateAPIView):
                 "access": str(refresh.access_token),
             }
         })
+
+
+class AuditEventListView(AsyncAPIViewMixin, generics.GenericAPIView):
+    """
+    감사 이벤트 조회 View (최신순, 커서 기반 페이지)
+    관리자는 ?user=로 모든 사용자의 이벤트를 조회할 수 있고, 일반 사용자는 자신의 이벤트만 조회합니다.
+    파라미터: user, event_type(쉼표로 구분), since, until, cursor, limit(최대 100)
+    """
+    permission_classes = (IsAuthenticated,)
+    serializer_class = AuditEventSerializer
+
+    async def get(self, request, *args, **kwargs):
+        query = AuditEventQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        user_id = params.get('user') if request.user.is_staff else request.user.pk
+        limit = params['limit']
+        queryset = audit_events(
+            user_id=user_id,
+            event_types=params.get('event_type'),
+            since=params.get('since'),
+            until=params.get('until'),
+            cursor=params.get('cursor'),
+        )
+        events = [event async for event in queryset[:limit + 1]]
+        next_cursor = encode_cursor(events[limit - 1]) if len(events) > limit else None
+        return Response({
+            'results': self.get_serializer(events[:limit], many=True).data,
+            'next': next_cursor,
+        })
+
+
+class UserExportView(AsyncAPIViewMixin, APIView):
+    """
+    사용자 목록 내보내기 View (관리자 전용)
+    전체 목록을 메모리에 올리지 않고 id 순서의 페이지 단위로 조회하면서 CSV/NDJSON으로 스트리밍합니다.
+    ?since=를 지정하면 그 이후 수정된 사용자만 내보내며, 다음 변경분 조회에는 X-Export-Watermark 값을 사용합니다.
+    """
+    permission_classes = (IsAdminUser,)
+
+    # 응답 본문이 Serializer가 아닌 파일이므로 문서에는 쿼리 파라미터만 선언
+    @swagger_auto_schema(
+        query_serializer=UserExportQuerySerializer,
+        responses={200: openapi.Response('CSV 또는 NDJSON 파일 (gzip=true이면 gzip 압축)')},
+    )
+    async def get(self, request, *args, **kwargs):
+        query = UserExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        exporter = UserExporter(params['type'], since=params.get('since'), compress=params['gzip'])
+        response = StreamingHttpResponse(
+            exporter.astream(),
+            content_type='application/gzip' if exporter.compress else exporter.content_type,
+        )
+        response['Content-Disposition'] = f'attachment; filename="{exporter.filename}"'
+        response['X-Export-Watermark'] = exporter.watermark.isoformat()
+        response['Cache-Control'] = 'no-store'
+        return response
@@ -0,0 +1,107 @@
+"""
+벤치마크 공용 유틸리티
+
+각 벤치마크는 프로젝트 루트에서 모듈로 실행합니다.
+    python -m benchmarks.login_latency --clients 32
+"""
+
+import contextlib
+import math
+import os
+import statistics
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """
+    벤치마크 실행을 위한 Django 초기화
+    """
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'RePlay.settings')
+    import django
+
+    django.setup()
+
+    from django.conf import settings
+
+    # 테스트 클라이언트의 기본 호스트(testserver) 허용
+    if 'testserver' not in settings.ALLOWED_HOSTS:
+        settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+
+
+@contextlib.contextmanager
+def test_database(verbosity=0):
+    """
+    벤치마크 전용 테스트 DB를 생성하고 종료 시 삭제
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=verbosity, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        teardown_test_environment()
+
+
+def percentile(values, pct):
+    """
+    정렬된 값 목록에서 백분위수 계산 (nearest-rank)
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = max(0, min(len(values) - 1, math.ceil(pct / 100 * len(values)) - 1))
+    return values[rank]
+
+
+def summarize(latencies):
+    """
+    지연 시간 목록(초)을 밀리초 단위 통계로 요약
+    """
+    return {
+        'count': len(latencies),
+        'mean_ms': statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+def summarize_rates(rates):
+    """
+    반복 실행별 처리량(초당 요청 수)의 평균, 표준편차, 변동계수(%)
+    변동계수가 두 구성의 차이보다 크면 결과를 비교에 사용할 수 없습니다.
+    """
+    mean = statistics.fmean(rates) if rates else 0.0
+    stdev = statistics.stdev(rates) if len(rates) > 1 else 0.0
+    return {
+        'req/s': mean,
+        'stdev': stdev,
+        'cv_%': stdev / mean * 100 if mean else 0.0,
+        'min': min(rates, default=0.0),
+        'max': max(rates, default=0.0),
+    }
+
+
+def print_table(rows, columns):
+    """
+    결과를 간단한 표 형식으로 출력
+    """
+    widths = [max(len(column), *(len(_format(row.get(column))) for row in rows)) for column in columns]
+    print('  '.join(column.ljust(width) for column, width in zip(columns, widths)))
+    print('  '.join('-' * width for width in widths))
+    for row in rows:
+        print('  '.join(_format(row.get(column)).ljust(width) for column, width in zip(columns, widths)))
+
+
+def _format(value):
+    if isinstance(value, float):
+        return f'{value:.2f}'
+    return '' if value is None else str(value)
@@ -0,0 +1,124 @@
+"""
+로그인 지연 시간 벤치마크 (해싱 풀 사용 여부 비교)
+
+N개의 동시 클라이언트가 ASGI 애플리케이션으로 로그인 요청을 보내고
+p50/p99 지연 시간을 측정합니다. 같은 시간 동안 해싱이 없는 가벼운 요청(probe)도
+함께 보내서, 해싱이 이벤트 루프를 얼마나 막는지 확인합니다.
+    - inline: 이벤트 루프에서 직접 해싱 (풀을 사용하지 않는 경우)
+    - pool:   PASSWORD_HASHING_POOL 설정의 해싱 풀 사용
+
+    python -m benchmarks.login_latency --clients 32 --requests 4
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from benchmarks.common import print_table, setup_django, summarize, test_database
+
+PASSWORD = 'Bench!mark-2024'
+
+
+async def _run_clients(clients, requests_per_client, usernames):
+    from django.test import AsyncClient
+
+    latencies = []
+    statuses = {}
+
+    async def client_loop(index):
+        client = AsyncClient()
+        username = usernames[index % len(usernames)]
+        for _ in range(requests_per_client):
+            started = time.perf_counter()
+            response = await client.post(
+                '/api/accounts/login/',
+                {'username': username, 'password': PASSWORD},
+                content_type='application/json',
+            )
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    probe_latencies = []
+    done = asyncio.Event()
+
+    async def probe_loop():
+        client = AsyncClient()
+        while not done.is_set():
+            started = time.perf_counter()
+            await client.get('/api/accounts/login/')
+            probe_latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0.01)
+
+    async def run_clients():
+        await asyncio.gather(*(client_loop(index) for index in range(clients)))
+        done.set()
+
+    started = time.perf_counter()
+    await asyncio.gather(run_clients(), probe_loop())
+    elapsed = time.perf_counter() - started
+    return latencies, probe_latencies, statuses, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=32, help='동시 클라이언트 수')
+    parser.add_argument('--requests', type=int, default=4, help='클라이언트당 요청 수')
+    parser.add_argument('--users', type=int, default=8, help='생성할 테스트 사용자 수')
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.test import override_settings
+    from rest_framework.settings import api_settings
+
+    from accounts import hashing
+
+    class InlineHashingPool(hashing.PasswordHashingPool):
+        """풀 없이 호출한 코루틴 안에서 바로 해싱하는 비교용 풀"""
+
+        async def run(self, func, *args, **kwargs):
+            return func(*args, **kwargs)
+
+    User = get_user_model()
+    rows = []
+    failed = {}
+    # 모든 클라이언트가 같은 IP(127.0.0.1)이므로 스로틀을 끄지 않으면 429 응답 시간을 측정하게 됨
+    rest_framework = {**api_settings.user_settings, 'DEFAULT_THROTTLE_RATES': {}}
+    with test_database(), override_settings(REST_FRAMEWORK=rest_framework):
+        password_hash = make_password(PASSWORD)
+        usernames = [f'bench{index}' for index in range(args.users)]
+        User.objects.bulk_create(User(username=username, password=password_hash) for username in usernames)
+
+        pooled = hashing.get_hashing_pool()
+        for mode, pool in (('inline', InlineHashingPool()), ('pool', pooled)):
+            hashing._pool = pool
+            latencies, probe_latencies, statuses, elapsed = asyncio.run(
+                _run_clients(args.clients, args.requests, usernames)
+            )
+            probe = summarize(probe_latencies)
+            rows.append({
+                'mode': mode,
+                'clients': args.clients,
+                **summarize(latencies),
+                'probe_p50_ms': probe['p50_ms'],
+                'probe_p99_ms': probe['p99_ms'],
+                'req/s': len(latencies) / elapsed,
+                'status': ','.join(f'{code}x{count}' for code, count in sorted(statuses.items())),
+            })
+            errors = {code: count for code, count in statuses.items() if code != 200}
+            if errors:
+                failed[mode] = errors
+        hashing._pool = pooled
+        pooled.shutdown()
+
+    print_table(rows, ['mode', 'clients', 'count', 'p50_ms', 'p99_ms', 'req/s', 'probe_p50_ms', 'probe_p99_ms', 'status'])
+    if failed:
+        # 실패 응답이 섞이면 지연 시간이 로그인 처리 시간을 나타내지 않으므로 결과를 사용하지 않음
+        sys.exit(f'로그인 요청 중 200이 아닌 응답이 있습니다: {failed}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Middleware 구성별 처리량 벤치마크 (워커 1개 기준 초당 요청 수)
+
+같은 요청을 두 가지 Middleware 구성으로 처리하여 비교합니다.
+    - full: Django 기본 세션/CSRF/인증/메시지 Middleware를 모든 경로에서 실행
+    - lean: settings.MIDDLEWARE (API 경로에서는 세션 기반 Middleware를 건너뜀)
+
+측정 대상은 JWT 인증 프로필 조회(조건부 요청으로 304 응답)와 /admin/ 로그인 페이지이며,
+--session-cookie를 지정하면 관리자 페이지에 로그인한 브라우저처럼 세션 쿠키를 함께 보냅니다.
+
+구성마다 --warmup만큼 먼저 요청해서 결과에서 제외하고, --requests개씩 --repeats번 측정합니다.
+시간에 따른 변화(CPU 클럭, 캐시 등)가 한쪽 구성에만 몰리지 않도록 반복마다 두 구성의 실행 순서를 바꾸며,
+처리량은 반복별 값의 평균과 표준편차(stdev), 변동계수(cv_%)로 보고합니다.
+
+    python -m benchmarks.middleware_rps --requests 5000 --repeats 5
+"""
+
+import argparse
+import sys
+import time
+
+from benchmarks.common import print_table, setup_django, summarize, summarize_rates, test_database
+
+PASSWORD = 'Bench!mark-2024'
+
+FULL_MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+
+def run(client, path, headers, requests):
+    latencies = []
+    statuses = {}
+    started = time.perf_counter()
+    for _ in range(requests):
+        request_started = time.perf_counter()
+        response = client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - request_started)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+    return latencies, statuses, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=5000, help='반복 1회의 구성/경로별 요청 수')
+    parser.add_argument('--repeats', type=int, default=5, help='반복 측정 횟수')
+    parser.add_argument('--warmup', type=int, default=500, help='측정 전에 버리는 구성/경로별 요청 수')
+    parser.add_argument('--session-cookie', action='store_true', help='세션 쿠키를 함께 전송')
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test import Client, override_settings
+    from rest_framework.settings import api_settings
+
+    from accounts.tokens import RefreshToken
+
+    modes = (('full', FULL_MIDDLEWARE), ('lean', settings.MIDDLEWARE))
+    # 같은 클라이언트가 반복해서 요청하므로 스로틀을 끄지 않으면 429 응답을 측정하게 됨
+    rest_framework = {**api_settings.user_settings, 'DEFAULT_THROTTLE_RATES': {}}
+    with test_database(), override_settings(REST_FRAMEWORK=rest_framework):
+        user = get_user_model().objects.create_user('bench', 'bench@example.com', PASSWORD, is_staff=True)
+        access = str(RefreshToken.for_user(user).access_token)
+
+        # 클라이언트는 첫 요청에서 Middleware 체인을 만들므로 구성별로 따로 생성
+        clients = {}
+        targets = {}
+        for mode, middleware in modes:
+            with override_settings(MIDDLEWARE=middleware):
+                client = clients[mode] = Client()
+                if args.session_cookie:
+                    client.login(username='bench', password=PASSWORD)
+                profile = client.get('/api/accounts/profile/', headers={'Authorization': f'Bearer {access}'})
+                targets[mode] = (
+                    ('api profile (304)', '/api/accounts/profile/', {
+                        'Authorization': f'Bearer {access}',
+                        'If-None-Match': profile['ETag'],
+                    }, 304),
+                    # 로그인된 세션이면 관리자 첫 페이지로 이동(302)
+                    ('admin login', '/admin/login/', {}, 302 if args.session_cookie else 200),
+                )
+                # 캐시 채우기, 지연 import 등 초기 비용은 측정에서 제외
+                for name, path, headers, expected in targets[mode]:
+                    run(client, path, headers, args.warmup)
+
+        results = {}
+        for repeat in range(args.repeats):
+            for mode, middleware in (modes if repeat % 2 == 0 else modes[::-1]):
+                with override_settings(MIDDLEWARE=middleware):
+                    for name, path, headers, expected in targets[mode]:
+                        latencies, statuses, elapsed = run(clients[mode], path, headers, args.requests)
+                        result = results.setdefault((mode, name), {
+                            'rates': [], 'latencies': [], 'statuses': {}, 'expected': expected,
+                        })
+                        result['rates'].append(len(latencies) / elapsed)
+                        result['latencies'].extend(latencies)
+                        for code, count in statuses.items():
+                            result['statuses'][code] = result['statuses'].get(code, 0) + count
+
+    rows = []
+    failed = {}
+    for (mode, name), result in results.items():
+        rows.append({
+            'mode': mode,
+            'target': name,
+            **summarize_rates(result['rates']),
+            **summarize(result['latencies']),
+            'statuses': ','.join(f'{code}x{count}' for code, count in sorted(result['statuses'].items())),
+        })
+        errors = {code: count for code, count in result['statuses'].items() if code != result['expected']}
+        if errors:
+            failed[f'{mode}/{name}'] = errors
+
+    print(f'요청 {args.requests}개 x 반복 {args.repeats}회 (워밍업 {args.warmup}개)')
+    print_table(rows, [
+        'mode', 'target', 'req/s', 'stdev', 'cv_%', 'min', 'max', 'mean_ms', 'p50_ms', 'p99_ms', 'statuses',
+    ])
+    if failed:
+        # 예상과 다른 응답(401, 429 등)이 섞이면 처리량이 Middleware 비용을 나타내지 않음
+        sys.exit(f'예상과 다른 응답이 있습니다: {failed}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+로그인 스로틀 부하 테스트 (크리덴셜 스터핑 중 정상 사용자 지연 시간)
+
+정상 사용자(각자 다른 IP)가 주기적으로 로그인하는 동안, 공격자가 한 IP에서
+한 계정에 틀린 비밀번호를 연속으로 보냅니다. 공격이 없는 경우(baseline),
+스로틀을 끈 경우와 켠 경우의 정상 사용자 로그인 p50/p99 지연 시간과
+공격 요청의 처리 결과를 비교합니다.
+
+    python -m benchmarks.throttle_attack --duration 10 --attackers 16
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.common import print_table, setup_django, summarize, test_database
+
+PASSWORD = 'Bench!mark-2024'
+
+
+async def _run(duration, legit_clients, attackers, legit_interval):
+    from django.test import AsyncClient
+
+    legit_latencies = []
+    legit_statuses = {}
+    attack_statuses = {}
+    deadline = time.perf_counter() + duration
+
+    async def legit_loop(index):
+        client = AsyncClient()
+        headers = {'X-Forwarded-For': f'10.0.1.{index}'}
+        # 정상 사용자의 요청 시작 시점을 분산
+        await asyncio.sleep(random.uniform(0, legit_interval))
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.post(
+                '/api/accounts/login/',
+                {'username': f'legit{index}', 'password': PASSWORD},
+                content_type='application/json',
+                headers=headers,
+            )
+            legit_latencies.append(time.perf_counter() - started)
+            legit_statuses[response.status_code] = legit_statuses.get(response.status_code, 0) + 1
+            await asyncio.sleep(legit_interval)
+
+    async def attack_loop():
+        client = AsyncClient()
+        headers = {'X-Forwarded-For': '10.0.9.9'}
+        while time.perf_counter() < deadline:
+            response = await client.post(
+                '/api/accounts/login/',
+                {'username': 'victim', 'password': 'wrong-password'},
+                content_type='application/json',
+                headers=headers,
+            )
+            attack_statuses[response.status_code] = attack_statuses.get(response.status_code, 0) + 1
+
+    await asyncio.gather(
+        *(legit_loop(index) for index in range(legit_clients)),
+        *(attack_loop() for _ in range(attackers)),
+    )
+    return legit_latencies, legit_statuses, attack_statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--duration', type=float, default=30, help='측정 시간(초)')
+    parser.add_argument('--legit-clients', type=int, default=16, help='정상 사용자 수')
+    parser.add_argument('--legit-interval', type=float, default=8.0, help='정상 사용자 요청 간격(초, 아이디당 제한보다 느리게)')
+    parser.add_argument('--attackers', type=int, default=16, help='동시 공격 요청 수')
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.test import override_settings
+    from rest_framework.settings import api_settings
+
+    from accounts import throttling
+
+    User = get_user_model()
+    rows = []
+    with test_database():
+        password_hash = make_password(PASSWORD)
+        User.objects.bulk_create(
+            [User(username=f'legit{index}', password=password_hash) for index in range(args.legit_clients)]
+            + [User(username='victim', password=password_hash)]
+        )
+
+        rates = dict(api_settings.DEFAULT_THROTTLE_RATES)
+        modes = (
+            ('baseline', rates, 0),
+            ('no-throttle', {}, args.attackers),
+            ('throttle', rates, args.attackers),
+        )
+        for mode, throttle_rates, attackers in modes:
+            rest_framework = {**api_settings.user_settings, 'DEFAULT_THROTTLE_RATES': throttle_rates, 'NUM_PROXIES': 1}
+            limiter = throttling.get_rate_limiter()
+            if hasattr(limiter, 'clear'):
+                limiter.clear()
+            with override_settings(REST_FRAMEWORK=rest_framework):
+                latencies, legit_statuses, attack_statuses = asyncio.run(
+                    _run(args.duration, args.legit_clients, attackers, args.legit_interval)
+                )
+            rows.append({
+                'mode': mode,
+                **{f'legit_{key}': value for key, value in summarize(latencies).items()},
+                'legit': ','.join(f'{code}x{count}' for code, count in sorted(legit_statuses.items())),
+                'attack': ','.join(f'{code}x{count}' for code, count in sorted(attack_statuses.items())),
+            })
+
+    print_table(rows, ['mode', 'legit_count', 'legit_p50_ms', 'legit_p99_ms', 'legit', 'attack'])
+
+
+if __name__ == '__main__':
+    main()
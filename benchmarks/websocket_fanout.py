@@ -0,0 +1,123 @@
+"""
+WebSocket 알림 벤치마크 (프로세스당 연결 수, 알림 fan-out 처리량)
+
+ASGI 애플리케이션(RePlay.asgi)에 N개의 인증된 WebSocket 연결을 열고
+    - 연결 1개당 수립 시간과 메모리 사용량(tracemalloc)
+    - 사용자별 알림(notify_user)을 채널 레이어로 보냈을 때 초당 전달 메시지 수
+    - 한 사용자를 모든 연결이 구독할 때 접속 상태 변경 fan-out 시간
+을 측정합니다. 채널 레이어는 settings.CHANNEL_LAYERS를 사용합니다.
+(REDIS_URL이 없으면 InMemoryChannelLayer)
+
+    python -m benchmarks.websocket_fanout --connections 500 --messages 20
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from benchmarks.common import print_table, setup_django, summarize, test_database
+
+ORIGIN = [(b'origin', b'http://testserver')]
+
+
+async def run(connections, messages, tokens, users):
+    from channels.layers import get_channel_layer
+    from channels.testing import WebsocketCommunicator
+
+    from accounts.notifications import anotify_user, presence_group
+    from RePlay.asgi import application
+
+    # 1. 연결 수립
+    tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0]
+    communicators = []
+    connect_latencies = []
+    for index in range(connections):
+        communicator = WebsocketCommunicator(
+            application,
+            '/ws/accounts/notifications/',
+            headers=ORIGIN + [(b'authorization', f'Bearer {tokens[index]}'.encode())],
+        )
+        started = time.perf_counter()
+        connected, _ = await communicator.connect()
+        if not connected:
+            raise RuntimeError('WebSocket 연결 실패')
+        await communicator.receive_json_from()  # connected 메시지
+        connect_latencies.append(time.perf_counter() - started)
+        communicators.append(communicator)
+    memory_per_connection = (tracemalloc.get_traced_memory()[0] - memory_before) / connections
+    tracemalloc.stop()
+
+    # 2. 사용자별 알림 fan-out
+    started = time.perf_counter()
+    for sequence in range(messages):
+        await asyncio.gather(*(anotify_user(user.pk, {'sequence': sequence}) for user in users))
+    sent = time.perf_counter() - started
+
+    async def drain(communicator, count):
+        for _ in range(count):
+            await communicator.receive_json_from(timeout=30)
+
+    await asyncio.gather(*(drain(communicator, messages) for communicator in communicators))
+    delivered = time.perf_counter() - started
+
+    # 3. 접속 상태 fan-out (모든 연결이 첫 번째 사용자를 구독)
+    for communicator in communicators:
+        await communicator.send_json_to({'type': 'presence.subscribe', 'user_ids': [users[0].pk]})
+        await communicator.receive_json_from()
+    started = time.perf_counter()
+    await get_channel_layer().group_send(
+        presence_group(users[0].pk), {'type': 'presence.update', 'user_id': users[0].pk, 'online': True}
+    )
+    await asyncio.gather(*(drain(communicator, 1) for communicator in communicators))
+    presence_fanout = time.perf_counter() - started
+
+    for communicator in communicators:
+        await communicator.disconnect()
+
+    return {
+        'connect': summarize(connect_latencies),
+        'memory_per_connection_kb': memory_per_connection / 1024,
+        'notify_send_s': sent,
+        'notify_delivered_s': delivered,
+        'messages': messages * connections,
+        'presence_fanout_ms': presence_fanout * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--connections', type=int, default=200, help='WebSocket 연결 수 (사용자당 1개)')
+    parser.add_argument('--messages', type=int, default=10, help='사용자당 알림 수')
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+
+    from accounts.tokens import RefreshToken
+
+    with test_database():
+        User = get_user_model()
+        User.objects.bulk_create(
+            User(username=f'ws{index}', password='!') for index in range(args.connections)
+        )
+        users = list(User.objects.order_by('pk'))
+        tokens = [str(RefreshToken.for_user(user).access_token) for user in users]
+        result = asyncio.run(run(args.connections, args.messages, tokens, users))
+
+    print(f"채널 레이어: {settings.CHANNEL_LAYERS['default']['BACKEND']}")
+    print_table([{
+        'connections': args.connections,
+        'connect_p50_ms': result['connect']['p50_ms'],
+        'connect_p99_ms': result['connect']['p99_ms'],
+        'kb/conn': result['memory_per_connection_kb'],
+        'notify msg/s': result['messages'] / result['notify_delivered_s'],
+        'presence_fanout_ms': result['presence_fanout_ms'],
+    }], ['connections', 'connect_p50_ms', 'connect_p99_ms', 'kb/conn', 'notify msg/s', 'presence_fanout_ms'])
+
+
+if __name__ == '__main__':
+    main()